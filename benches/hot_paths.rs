@@ -0,0 +1,564 @@
+//! Synthetic-workload latency benchmark for the CLI hot paths.
+//!
+//! Builds a throwaway git repo holding a `.maestro` tree of configurable size
+//! -- feature and task cards split between YAML and `store.sqlite`, run logs,
+//! channel files, archived snapshots -- next to a committed source tree, then
+//! times the built `maestro` binary over `status`, `list` (the card scan),
+//! `grep`, `hook record`, and `mission-control --json`. Each command gets
+//! warm-up runs (the first `grep` builds its shards) and then reports the
+//! median wall time.
+//!
+//! Latency is machine-specific, so baselines are machine-local: pass
+//! `--save-baseline` once to record the medians, and later runs against the
+//! same workload fail when a median regresses past `--tolerance`.
+//! `--profile` reruns each command once with `MAESTRO_PROFILE=1` and prints its
+//! slowest phases.
+//!
+//! ```sh
+//! cargo bench --bench hot_paths
+//! cargo bench --bench hot_paths -- --cards 5000 --logs 200 --save-baseline
+//! ```
+
+use std::fs;
+use std::path::{Path, PathBuf};
+use std::process::{Command, ExitCode, Output, Stdio};
+use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
+
+use anyhow::{Context, Result, bail};
+use maestro::domain::card::schema::{Card, CardType};
+use maestro::domain::card::{archive_db, live_db, store};
+use maestro::domain::channel;
+use maestro::foundation::core::paths::MaestroPaths;
+use maestro::foundation::core::time::utc_now_timestamp;
+use serde_json::{Value, json};
+
+const BASELINE_SCHEMA: &str = "maestro.bench-baseline.v1";
+const DEFAULT_BASELINE: &str = "target/bench-baselines/hot_paths.json";
+
+const USAGE: &str = "\
+usage: cargo bench --bench hot_paths -- [options]
+
+workload:
+  --features N          feature cards (default 20)
+  --cards N             task cards in YAML (default 400)
+  --db-cards N          task cards in store.sqlite (default 400)
+  --logs N              run logs (default 40)
+  --log-events N        events per run log (default 500)
+  --channels N          pair channels (default 20)
+  --channel-messages N  messages per channel (default 50)
+  --archived N          archived card snapshots (default 200)
+  --source-files N      files in the source tree (default 300)
+
+measurement:
+  --iterations N        timed runs per command (default 5)
+  --warmup N            untimed runs per command first (default 1)
+  --baseline PATH       baseline file (default target/bench-baselines/hot_paths.json)
+  --save-baseline       record this run's medians as the baseline
+  --tolerance F         allowed regression over the baseline (default 0.25)
+  --profile             print each command's slowest phases (MAESTRO_PROFILE=1)
+  --keep                keep the generated repo and print its path";
+
+/// The size of the generated tree; part of the baseline, so medians are only
+/// compared between runs over the same shape.
+#[derive(Clone, Debug, PartialEq)]
+struct Workload {
+    features: usize,
+    cards: usize,
+    db_cards: usize,
+    logs: usize,
+    log_events: usize,
+    channels: usize,
+    channel_messages: usize,
+    archived: usize,
+    source_files: usize,
+}
+
+impl Default for Workload {
+    fn default() -> Self {
+        Self {
+            features: 20,
+            cards: 400,
+            db_cards: 400,
+            logs: 40,
+            log_events: 500,
+            channels: 20,
+            channel_messages: 50,
+            archived: 200,
+            source_files: 300,
+        }
+    }
+}
+
+impl Workload {
+    fn to_json(&self) -> Value {
+        json!({
+            "features": self.features,
+            "cards": self.cards,
+            "db_cards": self.db_cards,
+            "logs": self.logs,
+            "log_events": self.log_events,
+            "channels": self.channels,
+            "channel_messages": self.channel_messages,
+            "archived": self.archived,
+            "source_files": self.source_files,
+        })
+    }
+}
+
+struct Options {
+    workload: Workload,
+    iterations: usize,
+    warmup: usize,
+    baseline: PathBuf,
+    save_baseline: bool,
+    tolerance: f64,
+    profile: bool,
+    keep: bool,
+}
+
+impl Options {
+    fn parse(mut args: impl Iterator<Item = String>) -> Result<Self> {
+        let mut options = Self {
+            workload: Workload::default(),
+            iterations: 5,
+            warmup: 1,
+            baseline: PathBuf::from(DEFAULT_BASELINE),
+            save_baseline: false,
+            tolerance: 0.25,
+            profile: false,
+            keep: false,
+        };
+        while let Some(arg) = args.next() {
+            let workload = &mut options.workload;
+            let count = match arg.as_str() {
+                // `cargo bench` passes `--bench` to every harness-less target.
+                "--bench" => continue,
+                "--save-baseline" => {
+                    options.save_baseline = true;
+                    continue;
+                }
+                "--profile" => {
+                    options.profile = true;
+                    continue;
+                }
+                "--keep" => {
+                    options.keep = true;
+                    continue;
+                }
+                "--baseline" => {
+                    options.baseline = PathBuf::from(value(&arg, args.next())?);
+                    continue;
+                }
+                "--tolerance" => {
+                    let raw = value(&arg, args.next())?;
+                    options.tolerance = raw
+                        .parse()
+                        .with_context(|| format!("--tolerance {raw:?} is not a number"))?;
+                    continue;
+                }
+                "--features" => &mut workload.features,
+                "--cards" => &mut workload.cards,
+                "--db-cards" => &mut workload.db_cards,
+                "--logs" => &mut workload.logs,
+                "--log-events" => &mut workload.log_events,
+                "--channels" => &mut workload.channels,
+                "--channel-messages" => &mut workload.channel_messages,
+                "--archived" => &mut workload.archived,
+                "--source-files" => &mut workload.source_files,
+                "--iterations" => &mut options.iterations,
+                "--warmup" => &mut options.warmup,
+                _ => bail!("unknown argument {arg:?}\n\n{USAGE}"),
+            };
+            let raw = value(&arg, args.next())?;
+            *count = raw
+                .parse()
+                .with_context(|| format!("{arg} {raw:?} is not a count"))?;
+        }
+        if options.iterations == 0 {
+            bail!("--iterations must be at least 1");
+        }
+        Ok(options)
+    }
+}
+
+fn value(flag: &str, next: Option<String>) -> Result<String> {
+    next.with_context(|| format!("{flag} needs a value\n\n{USAGE}"))
+}
+
+/// One timed command line, run from the repo root.
+struct Case {
+    name: &'static str,
+    args: &'static [&'static str],
+}
+
+const CASES: &[Case] = &[
+    Case {
+        name: "status",
+        args: &["status", "--json"],
+    },
+    Case {
+        name: "scan",
+        args: &["list", "--json", "--all"],
+    },
+    Case {
+        name: "grep",
+        args: &["grep", "--json", "synthetic"],
+    },
+    Case {
+        name: "hook",
+        args: &[
+            "hook",
+            "record",
+            "--event",
+            "PostToolUse",
+            "--session",
+            "bench-hook",
+        ],
+    },
+    Case {
+        name: "mission-control",
+        args: &["mission-control", "--json"],
+    },
+];
+
+fn main() -> ExitCode {
+    match run() {
+        Ok(true) => ExitCode::SUCCESS,
+        Ok(false) => ExitCode::FAILURE,
+        Err(error) => {
+            eprintln!("Error: {error:#}");
+            ExitCode::FAILURE
+        }
+    }
+}
+
+/// Run the benchmark; `false` when a median regressed past the baseline.
+fn run() -> Result<bool> {
+    let options = Options::parse(std::env::args().skip(1))?;
+    let repo = temp_repo()?;
+    let started = Instant::now();
+    generate(&repo, &options.workload)?;
+    println!(
+        "generated {} in {:.1}s: {:?}",
+        repo.display(),
+        started.elapsed().as_secs_f64(),
+        options.workload
+    );
+
+    let mut medians = Vec::new();
+    for case in CASES {
+        for _ in 0..options.warmup {
+            maestro(&repo, case.args, false)?;
+        }
+        let mut samples = Vec::with_capacity(options.iterations);
+        for _ in 0..options.iterations {
+            let started = Instant::now();
+            maestro(&repo, case.args, false)?;
+            samples.push(started.elapsed());
+        }
+        samples.sort();
+        let median = millis(samples[samples.len() / 2]);
+        println!(
+            "{:<16} median {median:>9.2} ms  min {:>9.2} ms  max {:>9.2} ms",
+            case.name,
+            millis(samples[0]),
+            millis(samples[samples.len() - 1])
+        );
+        medians.push((case.name, median));
+        if options.profile {
+            print_profile(&maestro(&repo, case.args, true)?)?;
+        }
+    }
+
+    let passed = compare_or_save(&options, &medians)?;
+    if options.keep {
+        println!("kept {}", repo.display());
+    } else {
+        let _ = fs::remove_dir_all(&repo);
+    }
+    Ok(passed)
+}
+
+/// Check `medians` against the stored baseline, or store them when asked.
+fn compare_or_save(options: &Options, medians: &[(&str, f64)]) -> Result<bool> {
+    let workload = options.workload.to_json();
+    if options.save_baseline {
+        let baseline = json!({
+            "schema": BASELINE_SCHEMA,
+            "workload": workload,
+            "median_ms": medians
+                .iter()
+                .map(|(name, median)| (name.to_string(), json!(median)))
+                .collect::<serde_json::Map<_, _>>(),
+        });
+        if let Some(parent) = options.baseline.parent() {
+            fs::create_dir_all(parent)
+                .with_context(|| format!("failed to create {}", parent.display()))?;
+        }
+        fs::write(&options.baseline, serde_json::to_vec_pretty(&baseline)?)
+            .with_context(|| format!("failed to write {}", options.baseline.display()))?;
+        println!("saved baseline {}", options.baseline.display());
+        return Ok(true);
+    }
+    let Ok(raw) = fs::read(&options.baseline) else {
+        println!(
+            "no baseline at {}; rerun with --save-baseline to record one",
+            options.baseline.display()
+        );
+        return Ok(true);
+    };
+    let baseline: Value = serde_json::from_slice(&raw)
+        .with_context(|| format!("failed to parse {}", options.baseline.display()))?;
+    if baseline["schema"] != BASELINE_SCHEMA || baseline["workload"] != workload {
+        println!(
+            "baseline {} was recorded for another workload; not comparing",
+            options.baseline.display()
+        );
+        return Ok(true);
+    }
+    let mut passed = true;
+    for (name, median) in medians {
+        let Some(previous) = baseline["median_ms"][*name].as_f64() else {
+            continue;
+        };
+        let change = median / previous - 1.0;
+        let regressed = change > options.tolerance;
+        passed &= !regressed;
+        println!(
+            "{name:<16} {:>+7.1}% vs baseline {previous:.2} ms{}",
+            change * 100.0,
+            if regressed { "  REGRESSED" } else { "" }
+        );
+    }
+    Ok(passed)
+}
+
+/// The slowest phases from one profiled run's stderr report.
+fn print_profile(output: &Output) -> Result<()> {
+    let stderr = String::from_utf8_lossy(&output.stderr);
+    let profile: Value = stderr
+        .lines()
+        .rev()
+        .find_map(|line| serde_json::from_str::<Value>(line).ok())
+        .filter(|profile| profile["schema"] == "maestro.profile.v1")
+        .context("profiled run printed no profile on stderr")?;
+    let mut phases: Vec<(&String, f64, u64)> = profile["phases"]
+        .as_object()
+        .map(|phases| {
+            phases
+                .iter()
+                .map(|(path, phase)| {
+                    (
+                        path,
+                        phase["total_ms"].as_f64().unwrap_or(0.0),
+                        phase["allocations"].as_u64().unwrap_or(0),
+                    )
+                })
+                .collect()
+        })
+        .unwrap_or_default();
+    phases.sort_by(|left, right| right.1.total_cmp(&left.1));
+    for (path, total_ms, allocations) in phases.into_iter().take(8) {
+        println!("    {total_ms:>9.2} ms {allocations:>9} allocs  {path}");
+    }
+    Ok(())
+}
+
+fn maestro(repo: &Path, args: &[&str], profile: bool) -> Result<Output> {
+    let mut command = Command::new(env!("CARGO_BIN_EXE_maestro"));
+    command
+        .args(args)
+        .current_dir(repo)
+        .stdin(Stdio::null())
+        .env("MAESTRO_AUTO_UPDATE", "0")
+        .env_remove("MAESTRO_CURRENT_TASK")
+        .env_remove("MAESTRO_PROFILE");
+    if profile {
+        command.env("MAESTRO_PROFILE", "1");
+    }
+    let output = command
+        .output()
+        .with_context(|| format!("failed to run maestro {args:?}"))?;
+    if !output.status.success() {
+        bail!(
+            "maestro {args:?} failed\nstdout:\n{}\nstderr:\n{}",
+            String::from_utf8_lossy(&output.stdout),
+            String::from_utf8_lossy(&output.stderr)
+        );
+    }
+    Ok(output)
+}
+
+fn temp_repo() -> Result<PathBuf> {
+    let nanos = SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .context("system clock is before the Unix epoch")?
+        .as_nanos();
+    let repo = std::env::temp_dir().join(format!("maestro-bench-{}-{nanos}", std::process::id()));
+    fs::create_dir_all(&repo).with_context(|| format!("failed to create {}", repo.display()))?;
+    Ok(repo)
+}
+
+/// Write the synthetic tree and commit the source half of it.
+fn generate(repo: &Path, workload: &Workload) -> Result<()> {
+    git(repo, &["init", "-q"])?;
+    let paths = MaestroPaths::new(repo);
+    fs::create_dir_all(paths.cards_dir())?;
+    let now = utc_now_timestamp();
+
+    let features: Vec<String> = (0..workload.features)
+        .map(|n| format!("feature-bench-{n:04}"))
+        .collect();
+    for (n, id) in features.iter().enumerate() {
+        let mut card = Card::new(
+            id,
+            CardType::Feature,
+            &format!("Synthetic feature {n}"),
+            "in_progress",
+            &now,
+        );
+        card.description = Some(format!("Benchmark feature {n} covering area {}.", n % 7));
+        store::create_card(&paths, &card)?;
+    }
+
+    let mut tasks = Vec::new();
+    for n in 0..workload.cards + workload.db_cards {
+        let id = format!("task-bench-{n:05}");
+        let mut card = Card::new(
+            &id,
+            CardType::Task,
+            &format!("Synthetic task {n} for subsystem {}", n % 13),
+            ["ready", "in_progress", "done"][n % 3],
+            &now,
+        );
+        card.parent = (!features.is_empty()).then(|| features[n % features.len()].clone());
+        card.description = Some(format!(
+            "Synthetic benchmark card {n}. Touches module_{} and handler_{}.",
+            n % 17,
+            n % 29
+        ));
+        if n < workload.cards {
+            store::create_card(&paths, &card)?;
+        } else {
+            live_db::insert_card(&paths, &card, "task.yaml")?;
+        }
+        tasks.push(id);
+    }
+
+    for n in 0..workload.archived {
+        let id = format!("task-archived-{n:05}");
+        let card = Card::new(
+            &id,
+            CardType::Task,
+            &format!("Archived synthetic task {n}"),
+            "done",
+            &now,
+        );
+        archive_db::archive_virtual_card(&paths, &id, &card, Path::new(&id))?;
+    }
+
+    for n in 0..workload.logs {
+        let session = format!("bench-session-{n:04}");
+        let mut log = String::new();
+        for event in 0..workload.log_events {
+            let line = match event % 4 {
+                0 if !tasks.is_empty() => json!({
+                    "event_type": "card_touch",
+                    "session_id": session,
+                    "card_id": tasks[(n + event) % tasks.len()],
+                    "ts": now,
+                }),
+                1 => json!({
+                    "event_type": "PreToolUse",
+                    "session_id": session,
+                    "tool_name": "Edit",
+                    "ts": now,
+                }),
+                _ => json!({
+                    "event_type": "PostToolUse",
+                    "session_id": session,
+                    "tool_name": "Bash",
+                    "ts": now,
+                }),
+            };
+            log.push_str(&line.to_string());
+            log.push('\n');
+        }
+        let dir = paths.runs_dir().join(&session);
+        fs::create_dir_all(&dir)?;
+        fs::write(dir.join("events.jsonl"), log)?;
+    }
+
+    if tasks.len() >= 2 {
+        for n in 0..workload.channels {
+            let from = &tasks[(2 * n) % tasks.len()];
+            let to = &tasks[(2 * n + 1) % tasks.len()];
+            for message in 0..workload.channel_messages {
+                let (sender, session) = if message % 2 == 0 {
+                    (from, "bench-a")
+                } else {
+                    (to, "bench-b")
+                };
+                let receiver = if sender == from { to } else { from };
+                channel::send(
+                    &paths,
+                    sender,
+                    receiver,
+                    session,
+                    &format!("synthetic message {message} on channel {n}"),
+                )?;
+            }
+        }
+    }
+
+    for n in 0..workload.source_files {
+        let dir = repo.join("src").join(format!("module_{}", n % 17));
+        fs::create_dir_all(&dir)?;
+        fs::write(dir.join(format!("handler_{n}.rs")), source_file(n))?;
+    }
+    fs::write(repo.join(".gitignore"), ".maestro/index/\n")?;
+    git(repo, &["add", "-A"])?;
+    git(
+        repo,
+        &[
+            "-c",
+            "user.name=bench",
+            "-c",
+            "user.email=bench@example.invalid",
+            "commit",
+            "-qm",
+            "synthetic workload",
+        ],
+    )
+}
+
+fn source_file(n: usize) -> String {
+    let mut source = format!("//! Synthetic handler {n}.\n\n");
+    for function in 0..20 {
+        source.push_str(&format!(
+            "pub fn synthetic_handler_{n}_{function}(input: &str) -> usize {{\n    \
+             let trimmed = input.trim();\n    \
+             trimmed.len() + {function}\n}}\n\n"
+        ));
+    }
+    source
+}
+
+fn git(repo: &Path, args: &[&str]) -> Result<()> {
+    let output = Command::new("git")
+        .args(args)
+        .current_dir(repo)
+        .output()
+        .with_context(|| format!("failed to run git {args:?}"))?;
+    if !output.status.success() {
+        bail!(
+            "git {args:?} failed: {}",
+            String::from_utf8_lossy(&output.stderr)
+        );
+    }
+    Ok(())
+}
+
+fn millis(duration: Duration) -> f64 {
+    duration.as_secs_f64() * 1000.0
+}
@@ -11,6 +11,7 @@ use crate::domain::card::store::{CARD_FILE, DECISIONS_FILE, TASK_FILE, validate_
 use crate::foundation::core::fs::ensure_dir;
 use crate::foundation::core::hash::sha256_hex;
 use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
 use crate::foundation::core::schema::{CARD_SCHEMA_VERSION, Compat, classify};
 use crate::foundation::core::time::utc_now_timestamp;
 
@@ -85,6 +86,24 @@ pub fn resolve(paths: &MaestroPaths, id: &str) -> Result<Option<DbCard>> {
 }
 
 pub fn scan(paths: &MaestroPaths) -> Result<Vec<(Card, PathBuf)>> {
+    let _phase = profile::phase("card.store_db");
+    scan_raw(paths)?
+        .into_iter()
+        .map(|row| parse_raw(paths, &row))
+        .collect()
+}
+
+/// One `cards` row as stored, before its YAML is parsed.
+#[derive(Clone, Debug, Eq, PartialEq)]
+pub(crate) struct RawDbCard {
+    pub(crate) id: String,
+    pub(crate) card_yaml: String,
+    pub(crate) record_file: String,
+}
+
+/// Every DB card row, unparsed and sorted by id: the card read model diffs the
+/// raw text against what it indexed and parses only the rows that changed.
+pub(crate) fn scan_raw(paths: &MaestroPaths) -> Result<Vec<RawDbCard>> {
     let Some(conn) = open_existing(paths)? else {
         return Ok(Vec::new());
     };
@@ -92,15 +111,21 @@ pub fn scan(paths: &MaestroPaths) -> Result<Vec<(Card, PathBuf)>> {
     let mut rows = stmt.query([])?;
     let mut cards = Vec::new();
     while let Some(row) = rows.next()? {
-        let id: String = row.get(0)?;
-        let card_yaml: String = row.get(1)?;
-        let record_file: String = row.get(2)?;
-        let path = synthetic_card_path(paths, &id, &record_file);
-        cards.push((parse_card(&card_yaml, &path)?, path));
+        cards.push(RawDbCard {
+            id: row.get(0)?,
+            card_yaml: row.get(1)?,
+            record_file: row.get(2)?,
+        });
     }
     Ok(cards)
 }
 
+/// Parse one raw row exactly as [`scan`] would, with its synthetic path.
+pub(crate) fn parse_raw(paths: &MaestroPaths, row: &RawDbCard) -> Result<(Card, PathBuf)> {
+    let path = synthetic_card_path(paths, &row.id, &row.record_file);
+    Ok((parse_card(&row.card_yaml, &path)?, path))
+}
+
 pub fn insert_card(paths: &MaestroPaths, card: &Card, record_file: &str) -> Result<()> {
     validate_card_id(&card.id)?;
     validate_record_file(record_file)?;
@@ -12,6 +12,7 @@ pub mod index;
 pub mod live_db;
 pub mod locator;
 pub mod query;
+pub mod read_model;
 pub mod schema;
 pub mod store;
 pub mod suggest;
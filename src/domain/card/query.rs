@@ -17,6 +17,7 @@ use crate::domain::card::store::{
 use crate::domain::card::{archive_db, live_db};
 use crate::foundation::core::fs::sorted_child_dirs;
 use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
 
 /// The coarse, board-level status every card maps to (SPEC DN3, LOCKED). The
 /// real per-type status string is the single source of truth; this is derived
@@ -152,6 +153,7 @@ pub struct StoreScanFailure {
 /// file (one failure per broken `decisions.yaml`/`ideas.yaml`). `Err` only
 /// when the store root itself cannot be walked.
 pub fn scan_with_failures(paths: &MaestroPaths) -> Result<StoreScan> {
+    let _phase = profile::phase("card.scan");
     let mut scan = walk(&paths.cards_dir(), false)?;
     match live_db::scan(paths) {
         Ok(db_cards) => merge_db_cards(&mut scan, db_cards),
@@ -168,6 +170,7 @@ pub fn scan_with_failures(paths: &MaestroPaths) -> Result<StoreScan> {
 /// dir-backed card, the container list file for an entry), for the per-type
 /// scans that report artifact locations.
 pub(crate) fn scan_with_paths(paths: &MaestroPaths) -> Result<Vec<(Card, PathBuf)>> {
+    let _phase = profile::phase("card.scan");
     let mut scan = walk(&paths.cards_dir(), true)?;
     merge_db_cards(&mut scan, live_db::scan(paths)?);
     Ok(scan.cards)
@@ -201,26 +204,60 @@ pub fn scan_archived_with_paths(paths: &MaestroPaths) -> Result<Vec<(Card, PathB
 /// `decisions.yaml`, and nested `tasks/` pool. In strict mode the first
 /// failure propagates verbatim; tolerant mode collects it and keeps walking.
 fn walk(root: &Path, strict: bool) -> Result<StoreScan> {
+    let _phase = profile::phase("card.yaml");
     let mut scan = StoreScan {
         cards: Vec::new(),
         failures: Vec::new(),
     };
-    collect_entry_file(&root.join(DECISIONS_FILE), root, strict, &mut scan)?;
-    collect_entry_file(&root.join(IDEAS_FILE), root, strict, &mut scan)?;
-    collect_task_pool(&root.join(TASKS_DIR), strict, &mut scan)?;
-    for dir in sorted_child_dirs(root)? {
-        if dir.file_name().is_some_and(|name| name == TASKS_DIR) || is_dot_dir(&dir) {
-            continue;
+    for source in record_sources(root)? {
+        match source {
+            RecordSource::Record(yaml) => collect_record(&yaml, strict, &mut scan)?,
+            RecordSource::Entries(file) => collect_entry_file(&file, root, strict, &mut scan)?,
         }
-        collect_record(&dir.join(CARD_FILE), strict, &mut scan)?;
-        collect_entry_file(&dir.join(DECISIONS_FILE), root, strict, &mut scan)?;
-        collect_task_pool(&dir.join(TASKS_DIR), strict, &mut scan)?;
     }
     scan.cards.sort_by(|a, b| a.0.id.cmp(&b.0.id));
     scan.failures.sort_by(|a, b| a.id.cmp(&b.id));
     Ok(scan)
 }
 
+/// One file the container-layout walk reads: a dir-backed record
+/// (`card.yaml`/`task.yaml`) or a container entry list
+/// (`decisions.yaml`/`ideas.yaml`). A listed file may be absent; loading it
+/// contributes nothing.
+#[derive(Clone, Debug, Eq, PartialEq)]
+pub(crate) enum RecordSource {
+    Record(PathBuf),
+    Entries(PathBuf),
+}
+
+impl RecordSource {
+    pub(crate) fn path(&self) -> &Path {
+        match self {
+            Self::Record(path) | Self::Entries(path) => path,
+        }
+    }
+}
+
+/// Every file [`walk`] would read under `root`, in walk order, without
+/// reading any of them -- the seam the read model fingerprints so it only
+/// reparses what changed.
+pub(crate) fn record_sources(root: &Path) -> Result<Vec<RecordSource>> {
+    let mut sources = vec![
+        RecordSource::Entries(root.join(DECISIONS_FILE)),
+        RecordSource::Entries(root.join(IDEAS_FILE)),
+    ];
+    task_pool_sources(&root.join(TASKS_DIR), &mut sources)?;
+    for dir in sorted_child_dirs(root)? {
+        if dir.file_name().is_some_and(|name| name == TASKS_DIR) || is_dot_dir(&dir) {
+            continue;
+        }
+        sources.push(RecordSource::Record(dir.join(CARD_FILE)));
+        sources.push(RecordSource::Entries(dir.join(DECISIONS_FILE)));
+        task_pool_sources(&dir.join(TASKS_DIR), &mut sources)?;
+    }
+    Ok(sources)
+}
+
 fn merge_db_cards(scan: &mut StoreScan, db_cards: Vec<(Card, PathBuf)>) {
     if db_cards.is_empty() {
         return;
@@ -273,11 +310,11 @@ fn collect_entry_file(file: &Path, root: &Path, strict: bool, scan: &mut StoreSc
     Ok(())
 }
 
-/// Read every per-task dir of one `tasks/` pool into the scan. A missing
-/// pool contributes nothing; a symlinked pool is refused like a symlinked
-/// card dir (its children read as real dirs, so the per-dir skip alone would
-/// follow it outside the store).
-fn collect_task_pool(pool: &Path, strict: bool, scan: &mut StoreScan) -> Result<()> {
+/// The per-task records of one `tasks/` pool. A missing pool contributes
+/// nothing; a symlinked pool is refused like a symlinked card dir (its
+/// children read as real dirs, so the per-dir skip alone would follow it
+/// outside the store).
+fn task_pool_sources(pool: &Path, sources: &mut Vec<RecordSource>) -> Result<()> {
     if is_symlink(pool) {
         return Ok(());
     }
@@ -285,7 +322,7 @@ fn collect_task_pool(pool: &Path, strict: bool, scan: &mut StoreScan) -> Result<
         if is_dot_dir(&dir) {
             continue;
         }
-        collect_record(&dir.join(TASK_FILE), strict, scan)?;
+        sources.push(RecordSource::Record(dir.join(TASK_FILE)));
     }
     Ok(())
 }
@@ -558,7 +595,7 @@ pub struct ListFilter<'a> {
 }
 
 impl ListFilter<'_> {
-    fn matches(&self, card: &Card) -> bool {
+    pub(crate) fn matches(&self, card: &Card) -> bool {
         self.parent
             .is_none_or(|parent| card.parent.as_deref() == Some(parent))
             && self
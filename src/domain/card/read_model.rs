@@ -0,0 +1,509 @@
+//! The indexed card read model behind `ready` and `list`.
+//!
+//! A plain [`query::scan`] parses every record and container file under
+//! `.maestro/cards` plus every `store.sqlite` row, then filters in memory. The
+//! read model materializes the columns those queries select on -- type, stored
+//! and canonical status, coarse status (DN3), parent, lane, claim, suggestion,
+//! project, timestamps -- and the `deps` edges into an indexed SQLite file
+//! under `.maestro/index/`, so the `ready` rule (E3/E8), blocker resolution,
+//! and the `list` filter (G3) run as indexed queries that parse only the cards
+//! they return.
+//!
+//! Like the text index it is a pure accelerator. Freshness is passive: every
+//! source the walk reads is fingerprinted (a file's mtime and length, a DB
+//! row's content hash), and a read first re-indexes exactly the sources whose
+//! fingerprint moved -- a write through `save_with_snapshot`, `save_entries`,
+//! or `live_db::save_card_if_unchanged`, or a hand edit, costs one source
+//! reparse on the next read. When the model cannot be opened or brought
+//! current (a read-only store, a malformed card), the query runs over the
+//! plain scan instead, which stays the source of truth and the one that
+//! reports the failure.
+
+use std::collections::{BTreeSet, HashMap};
+use std::path::{Path, PathBuf};
+use std::time::{Duration, UNIX_EPOCH};
+
+use anyhow::{Context, Result};
+use rusqlite::{Connection, OptionalExtension, Transaction, TransactionBehavior, params};
+
+use crate::domain::card::live_db;
+use crate::domain::card::query::{self, ListFilter, RecordSource, coarse_of};
+use crate::domain::card::schema::Card;
+use crate::domain::card::store::{load, load_entries};
+use crate::foundation::core::fs::ensure_dir;
+use crate::foundation::core::hash::sha256_hex;
+use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
+
+const READ_MODEL_SCHEMA_VERSION: &str = "maestro.card-read-model.v1";
+
+/// Source-key prefix of a DB-backed card; tree sources are paths relative to
+/// `.maestro/`, so the two can never collide.
+const DB_SOURCE_PREFIX: &str = "store.sqlite#";
+
+/// A refresh blocked behind another process's refresh waits this long before
+/// the read falls back to the scan.
+const BUSY_TIMEOUT: Duration = Duration::from_secs(5);
+
+/// A workable, coarse-OPEN card (the shared half of [`ready`] and
+/// [`blocked`]).
+const OPEN_WORKABLE: &str = "c.workable = 1 AND c.coarse = 'open'";
+
+/// A `blocks` edge of card `c` whose target is missing from the live set or
+/// not coarse-CLOSED -- `query::unsatisfied_blocking_dep` as SQL.
+const UNSATISFIED_BLOCKER: &str = "EXISTS (
+    SELECT 1 FROM deps d
+    WHERE d.source = c.source AND d.ordinal = c.ordinal AND d.blocking = 1
+      AND NOT EXISTS (
+          SELECT 1 FROM live_cards t WHERE t.id = d.target AND t.coarse = 'closed'
+      )
+)";
+
+/// The `ready` rule (SPEC E3/E8) as an indexed query: identical to
+/// [`query::ready`] over the full scan, in id order.
+pub fn ready(paths: &MaestroPaths) -> Result<Vec<Card>> {
+    let Some(conn) = open_fresh(paths) else {
+        let cards = query::scan(paths)?;
+        return Ok(query::ready(&cards).into_iter().cloned().collect());
+    };
+    let clause = format!("{OPEN_WORKABLE} AND NOT {UNSATISFIED_BLOCKER}");
+    Ok(load_where(paths, &conn, &clause, &[])?
+        .into_iter()
+        .map(|(card, _)| card)
+        .collect())
+}
+
+/// The blocked set as an indexed query: identical to [`query::blocked`] over
+/// the full scan, in id order.
+pub fn blocked(paths: &MaestroPaths) -> Result<Vec<Card>> {
+    let Some(conn) = open_fresh(paths) else {
+        let cards = query::scan(paths)?;
+        return Ok(query::blocked(&cards).into_iter().cloned().collect());
+    };
+    let clause = format!("{OPEN_WORKABLE} AND {UNSATISFIED_BLOCKER}");
+    Ok(load_where(paths, &conn, &clause, &[])?
+        .into_iter()
+        .map(|(card, _)| card)
+        .collect())
+}
+
+/// The live cards `filter` matches, each with its backing path, in id order:
+/// [`query::query`] over [`query::scan_with_paths`], with every predicate
+/// answered by an index.
+pub fn query(paths: &MaestroPaths, filter: &ListFilter) -> Result<Vec<(Card, PathBuf)>> {
+    let Some(conn) = open_fresh(paths) else {
+        return Ok(query::scan_with_paths(paths)?
+            .into_iter()
+            .filter(|(card, _)| filter.matches(card))
+            .collect());
+    };
+    let mut clauses = Vec::new();
+    let mut values = Vec::new();
+    if let Some(parent) = filter.parent {
+        values.push(parent.to_string());
+        clauses.push(format!("c.parent = ?{}", values.len()));
+    }
+    if let Some(card_type) = filter.card_type {
+        values.push(card_type.as_str().to_string());
+        clauses.push(format!("c.card_type = ?{}", values.len()));
+    }
+    if let Some(assignee) = filter.assignee {
+        // `claim_matches`: the full `<agent>#<session>` token or its agent part.
+        values.push(assignee.to_string());
+        let n = values.len();
+        clauses.push(format!(
+            "(c.claimed_by = ?{n} OR c.claim_agent = ?{n} \
+             OR c.suggested_for = ?{n} OR c.suggested_agent = ?{n})"
+        ));
+    }
+    if let Some(status) = filter.status {
+        values.push(status.as_str().to_string());
+        clauses.push(format!("c.coarse = ?{}", values.len()));
+    }
+    let clause = if clauses.is_empty() {
+        "1 = 1".to_string()
+    } else {
+        clauses.join(" AND ")
+    };
+    load_where(paths, &conn, &clause, &values)
+}
+
+/// What a rebuild wrote, for the `index rebuild` receipt.
+#[derive(Debug)]
+pub struct RebuildReport {
+    pub cards: usize,
+}
+
+/// Drop the read model and re-index every source from scratch.
+pub fn rebuild(paths: &MaestroPaths) -> Result<RebuildReport> {
+    let mut conn = open(paths)?;
+    let tx = conn.transaction_with_behavior(TransactionBehavior::Immediate)?;
+    drop_schema(&tx)?;
+    refresh(paths, &tx)?;
+    let cards = tx.query_row("SELECT COUNT(*) FROM live_cards", [], |row| {
+        row.get::<_, i64>(0)
+    })?;
+    tx.commit()?;
+    Ok(RebuildReport {
+        cards: usize::try_from(cards).unwrap_or_default(),
+    })
+}
+
+/// Open the model and bring it current, or `None` when either step fails and
+/// the caller should answer from the scan. Failures stay silent here: the
+/// fallback scan surfaces anything that is really wrong with the store.
+///
+/// The fingerprints are compared in a deferred read transaction first, so
+/// concurrent readers of an unchanged store never queue on the write lock;
+/// only a moved source takes the immediate transaction, where [`refresh`]
+/// compares them again before re-indexing.
+fn open_fresh(paths: &MaestroPaths) -> Option<Connection> {
+    let _phase = profile::phase("card.read_model_refresh");
+    let mut conn = open(paths).ok()?;
+    let tx = conn
+        .transaction_with_behavior(TransactionBehavior::Deferred)
+        .ok()?;
+    let current = is_current(paths, &tx).unwrap_or(false);
+    drop(tx);
+    if current {
+        return Some(conn);
+    }
+    let tx = conn
+        .transaction_with_behavior(TransactionBehavior::Immediate)
+        .ok()?;
+    refresh(paths, &tx).ok()?;
+    tx.commit().ok()?;
+    Some(conn)
+}
+
+fn open(paths: &MaestroPaths) -> Result<Connection> {
+    ensure_dir(paths.index_dir())?;
+    let file = paths.card_read_model_file();
+    let conn =
+        Connection::open(&file).with_context(|| format!("failed to open {}", file.display()))?;
+    conn.busy_timeout(BUSY_TIMEOUT)?;
+    Ok(conn)
+}
+
+/// Re-index every source whose fingerprint moved since the last refresh and
+/// forget every source that disappeared. Runs inside one immediate
+/// transaction, so concurrent refreshes serialize and no reader sees a
+/// half-applied one.
+fn refresh(paths: &MaestroPaths, tx: &Transaction) -> Result<()> {
+    ensure_schema(tx)?;
+    let known = known_sources(tx)?;
+    let mut seen = BTreeSet::new();
+
+    for source in query::record_sources(&paths.cards_dir())? {
+        let Some(fingerprint) = file_fingerprint(source.path())? else {
+            continue;
+        };
+        let key = relative_key(paths, source.path());
+        seen.insert(key.clone());
+        if known.get(&key) == Some(&fingerprint) {
+            continue;
+        }
+        let cards: Vec<Card> = match &source {
+            RecordSource::Record(yaml) => load(yaml)?.into_iter().collect(),
+            RecordSource::Entries(file) => load_entries(file)?.cards,
+        };
+        let path = source.path().to_path_buf();
+        let rows: Vec<(Card, PathBuf)> = cards.into_iter().map(|c| (c, path.clone())).collect();
+        replace_source(paths, tx, &key, &fingerprint, &rows)?;
+    }
+
+    // The DB store only needs a row-by-row diff when the file itself moved.
+    let store_fingerprint = file_fingerprint(&live_db::db_file(paths))?.unwrap_or_default();
+    if read_meta(tx, "store_db")?.as_deref() == Some(store_fingerprint.as_str()) {
+        seen.extend(
+            known
+                .keys()
+                .filter(|key| key.starts_with(DB_SOURCE_PREFIX))
+                .cloned(),
+        );
+    } else {
+        for row in live_db::scan_raw(paths)? {
+            let key = format!("{DB_SOURCE_PREFIX}{}", row.id);
+            let fingerprint = sha256_hex(row.card_yaml.as_bytes());
+            seen.insert(key.clone());
+            if known.get(&key) == Some(&fingerprint) {
+                continue;
+            }
+            let parsed = live_db::parse_raw(paths, &row)?;
+            replace_source(paths, tx, &key, &fingerprint, &[parsed])?;
+        }
+        write_meta(tx, "store_db", &store_fingerprint)?;
+    }
+
+    for key in known.keys().filter(|key| !seen.contains(*key)) {
+        delete_source(tx, key)?;
+    }
+    Ok(())
+}
+
+/// Whether [`refresh`] would find nothing to do: the schema is current and
+/// every source, the DB store included, still has its recorded fingerprint.
+/// Reads only, so it runs without the write lock.
+fn is_current(paths: &MaestroPaths, tx: &Transaction) -> Result<bool> {
+    if read_meta(tx, "schema_version")?.as_deref() != Some(READ_MODEL_SCHEMA_VERSION) {
+        return Ok(false);
+    }
+    let store_fingerprint = file_fingerprint(&live_db::db_file(paths))?.unwrap_or_default();
+    if read_meta(tx, "store_db")?.as_deref() != Some(store_fingerprint.as_str()) {
+        return Ok(false);
+    }
+    let known = known_sources(tx)?;
+    let mut tree_sources = 0;
+    for source in query::record_sources(&paths.cards_dir())? {
+        let Some(fingerprint) = file_fingerprint(source.path())? else {
+            continue;
+        };
+        if known.get(&relative_key(paths, source.path())) != Some(&fingerprint) {
+            return Ok(false);
+        }
+        tree_sources += 1;
+    }
+    let known_tree_sources = known
+        .keys()
+        .filter(|key| !key.starts_with(DB_SOURCE_PREFIX))
+        .count();
+    Ok(known_tree_sources == tree_sources)
+}
+
+/// Create the tables on first use, and recreate them when an older model
+/// schema is found (the model is derived data; nothing is lost).
+fn ensure_schema(tx: &Transaction) -> Result<()> {
+    tx.execute_batch(
+        "CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY NOT NULL,
+            value TEXT NOT NULL
+        );",
+    )?;
+    if read_meta(tx, "schema_version")?.as_deref() == Some(READ_MODEL_SCHEMA_VERSION) {
+        return Ok(());
+    }
+    drop_schema(tx)?;
+    tx.execute_batch(
+        "CREATE TABLE meta (
+            key TEXT PRIMARY KEY NOT NULL,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE sources (
+            source TEXT PRIMARY KEY NOT NULL,
+            fingerprint TEXT NOT NULL
+        );
+        CREATE TABLE cards (
+            source TEXT NOT NULL,
+            ordinal INTEGER NOT NULL,
+            id TEXT NOT NULL,
+            from_db INTEGER NOT NULL,
+            card_type TEXT NOT NULL,
+            workable INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            canonical_status TEXT NOT NULL,
+            coarse TEXT,
+            parent TEXT,
+            lane TEXT,
+            claimed_by TEXT,
+            claim_agent TEXT,
+            suggested_for TEXT,
+            suggested_agent TEXT,
+            project TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            record_path TEXT NOT NULL,
+            card_yaml TEXT NOT NULL,
+            PRIMARY KEY (source, ordinal)
+        );
+        CREATE INDEX cards_by_id ON cards(id, from_db);
+        CREATE INDEX cards_by_state ON cards(workable, coarse);
+        CREATE INDEX cards_by_type ON cards(card_type, coarse);
+        CREATE INDEX cards_by_parent ON cards(parent);
+        CREATE INDEX cards_by_claim ON cards(claimed_by);
+        CREATE INDEX cards_by_claim_agent ON cards(claim_agent);
+        CREATE INDEX cards_by_suggested ON cards(suggested_for);
+        CREATE INDEX cards_by_suggested_agent ON cards(suggested_agent);
+        CREATE TABLE deps (
+            source TEXT NOT NULL,
+            ordinal INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            target TEXT NOT NULL,
+            blocking INTEGER NOT NULL
+        );
+        CREATE INDEX deps_by_card ON deps(source, ordinal);
+        CREATE INDEX deps_by_target ON deps(target);
+        -- A DB row shadows a tree card with the same id (`merge_db_cards`).
+        CREATE VIEW live_cards AS
+            SELECT * FROM cards
+            WHERE from_db = 1
+               OR id NOT IN (SELECT id FROM cards WHERE from_db = 1);",
+    )?;
+    write_meta(tx, "schema_version", READ_MODEL_SCHEMA_VERSION)
+}
+
+fn drop_schema(tx: &Transaction) -> Result<()> {
+    tx.execute_batch(
+        "DROP VIEW IF EXISTS live_cards;
+        DROP TABLE IF EXISTS deps;
+        DROP TABLE IF EXISTS cards;
+        DROP TABLE IF EXISTS sources;
+        DROP TABLE IF EXISTS meta;",
+    )?;
+    Ok(())
+}
+
+fn known_sources(tx: &Transaction) -> Result<HashMap<String, String>> {
+    let mut stmt = tx.prepare("SELECT source, fingerprint FROM sources")?;
+    let rows = stmt.query_map([], |row| Ok((row.get(0)?, row.get(1)?)))?;
+    Ok(rows.collect::<rusqlite::Result<_>>()?)
+}
+
+fn replace_source(
+    paths: &MaestroPaths,
+    tx: &Transaction,
+    key: &str,
+    fingerprint: &str,
+    cards: &[(Card, PathBuf)],
+) -> Result<()> {
+    delete_source(tx, key)?;
+    tx.execute(
+        "INSERT INTO sources (source, fingerprint) VALUES (?1, ?2)",
+        params![key, fingerprint],
+    )?;
+    let from_db = key.starts_with(DB_SOURCE_PREFIX);
+    for (ordinal, (card, path)) in cards.iter().enumerate() {
+        let ordinal = i64::try_from(ordinal).context("card source holds too many entries")?;
+        let card_yaml = serde_yaml::to_string(card).context("failed to serialize card")?;
+        tx.execute(
+            "INSERT INTO cards
+                (source, ordinal, id, from_db, card_type, workable, status, canonical_status,
+                 coarse, parent, lane, claimed_by, claim_agent, suggested_for, suggested_agent,
+                 project, created_at, updated_at, record_path, card_yaml)
+             VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13, ?14, ?15, ?16,
+                     ?17, ?18, ?19, ?20)",
+            params![
+                key,
+                ordinal,
+                card.id,
+                from_db,
+                card.card_type.as_str(),
+                card.card_type.workable(),
+                card.status,
+                query::canonical_status(&card.status),
+                coarse_of(&card.status).map(|coarse| coarse.as_str()),
+                card.parent.as_deref(),
+                card.lane.as_deref(),
+                card.claimed_by.as_deref(),
+                card.claimed_by.as_deref().and_then(claim_agent),
+                card.suggested_for.as_deref(),
+                card.suggested_for.as_deref().and_then(claim_agent),
+                card.project.as_deref(),
+                card.created_at,
+                card.updated_at,
+                relative_key(paths, path),
+                card_yaml,
+            ],
+        )
+        .with_context(|| format!("failed to index card {}", card.id))?;
+        for dep in &card.deps {
+            tx.execute(
+                "INSERT INTO deps (source, ordinal, kind, target, blocking)
+                 VALUES (?1, ?2, ?3, ?4, ?5)",
+                params![
+                    key,
+                    ordinal,
+                    dep.kind.as_str(),
+                    dep.target,
+                    dep.kind.is_blocking()
+                ],
+            )?;
+        }
+    }
+    Ok(())
+}
+
+fn delete_source(tx: &Transaction, key: &str) -> Result<()> {
+    tx.execute("DELETE FROM deps WHERE source = ?1", params![key])?;
+    tx.execute("DELETE FROM cards WHERE source = ?1", params![key])?;
+    tx.execute("DELETE FROM sources WHERE source = ?1", params![key])?;
+    Ok(())
+}
+
+/// Parse just the live cards matching `clause` (over alias `c`), in id order.
+fn load_where(
+    paths: &MaestroPaths,
+    conn: &Connection,
+    clause: &str,
+    values: &[String],
+) -> Result<Vec<(Card, PathBuf)>> {
+    let _phase = profile::phase("card.read_model_load");
+    let sql = format!(
+        "SELECT c.card_yaml, c.record_path FROM live_cards c
+         WHERE {clause}
+         ORDER BY c.id, c.from_db, c.source, c.ordinal"
+    );
+    let mut stmt = conn.prepare(&sql)?;
+    let mut rows = stmt.query(rusqlite::params_from_iter(values))?;
+    let mut cards = Vec::new();
+    while let Some(row) = rows.next()? {
+        let card_yaml: String = row.get(0)?;
+        let record_path: String = row.get(1)?;
+        let path = paths.maestro_dir().join(record_path);
+        let card: Card = serde_yaml::from_str(&card_yaml)
+            .with_context(|| format!("failed to parse indexed card {}", path.display()))?;
+        cards.push((card, path));
+    }
+    Ok(cards)
+}
+
+fn read_meta(tx: &Transaction, key: &str) -> Result<Option<String>> {
+    Ok(tx
+        .query_row(
+            "SELECT value FROM meta WHERE key = ?1",
+            params![key],
+            |row| row.get(0),
+        )
+        .optional()?)
+}
+
+fn write_meta(tx: &Transaction, key: &str, value: &str) -> Result<()> {
+    tx.execute(
+        "INSERT INTO meta (key, value) VALUES (?1, ?2)
+         ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        params![key, value],
+    )?;
+    Ok(())
+}
+
+/// The agent portion of a `<agent>#<session>` claim (SPEC DN8), indexed so
+/// `--assignee <agent>` stays an equality lookup.
+fn claim_agent(owner: &str) -> Option<&str> {
+    owner.split_once('#').map(|(agent, _)| agent)
+}
+
+/// A source's `<mtime ns>:<len>`, or `None` when it does not exist. Any
+/// write -- through maestro or not -- moves one of the two.
+fn file_fingerprint(path: &Path) -> Result<Option<String>> {
+    let metadata = match std::fs::metadata(path) {
+        Ok(metadata) => metadata,
+        Err(error) if error.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+        Err(error) => {
+            return Err(error).with_context(|| format!("failed to stat {}", path.display()));
+        }
+    };
+    let mtime_ns = metadata
+        .modified()
+        .ok()
+        .and_then(|modified| modified.duration_since(UNIX_EPOCH).ok())
+        .map_or(0, |elapsed| elapsed.as_nanos());
+    Ok(Some(format!("{mtime_ns}:{}", metadata.len())))
+}
+
+/// A path as stored in the model: relative to `.maestro/` so a moved checkout
+/// keeps resolving, verbatim when it lives elsewhere.
+fn relative_key(paths: &MaestroPaths, path: &Path) -> String {
+    path.strip_prefix(paths.maestro_dir())
+        .unwrap_or(path)
+        .to_string_lossy()
+        .into_owned()
+}
@@ -14,8 +14,14 @@
 //!   `delivery/<key>.jsonl` line 1 = `{"schema_version":"maestro.channel-delivery.v1",
 //!                         "pair":[a,b]}`, lines 2.. = delivery receipts.
 //!   `<key>.cur-<cardkey>` the viewer's read-through cursor: the newest seen ts
-//!                         plus exact message ids at that ts. Legacy bare-ts
-//!                         cursors still read as timestamp-only cursors.
+//!                         plus exact message ids at that ts, and per worktree
+//!                         file the byte offset the cursor covers. Legacy bare-ts
+//!                         and offset-less cursors still read as cursors; their
+//!                         next read parses the whole file once.
+//!   `members.json`        derived membership index: pair channel keys by member
+//!                         card id plus the broadcast key per feature, kept
+//!                         current by sends and rebuilt from the headers whenever
+//!                         the set of channel files no longer matches it.
 //!
 //! `key` is a short hash of the sorted lowercased id pair (two-card) or of
 //! `feature\n<id>` (broadcast), so every member derives the same channel;
@@ -27,28 +33,44 @@
 //! reads -- `load_union`/`channels_for_union` -- merge every worktree's file for
 //! a pair by ts; because a message lives in exactly one worktree's file there is
 //! nothing to dedup, only to interleave.
+//!
+//! The hot reads -- the inbox banner's unread counts and `msg read` -- never
+//! load a whole channel: they find the viewer's channels in the membership
+//! index and parse each worktree file only past the cursor's byte offset
+//! there, reading backward a bounded window for the seen context. An offset
+//! is trusted only while the file keeps its identity, is at least that long,
+//! and has a line break just before it; otherwise the file is read in full.
 
 use std::collections::{BTreeMap, BTreeSet};
-use std::fs;
-use std::io::{BufRead, ErrorKind};
+use std::fs::{self, File};
+use std::io::{BufRead, ErrorKind, Read, Seek, SeekFrom};
+use std::path::PathBuf;
 use std::sync::atomic::{AtomicU64, Ordering};
 use std::time::{SystemTime, UNIX_EPOCH};
 
 use anyhow::{Context, Result, bail};
+use serde::{Deserialize, Serialize};
 use serde_json::{Value, json};
 
 use crate::domain::run::{append_jsonl_line, open_managed_appendable};
+use crate::foundation::core::fs::{file_identity, stat_fingerprint};
 use crate::foundation::core::hash::sha256_hex;
 use crate::foundation::core::managed_path::{SymlinkPolicy, managed_path};
 use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::safe_write::write_atomic;
 use crate::foundation::core::time::{parse_utc_timestamp, utc_now_timestamp};
 
 /// Truncation length for the hashed channel and cursor keys: enough to make a
 /// collision astronomically unlikely while keeping filenames short. A collision
 /// is still caught by the authoritative header check, never silently merged.
 const KEY_LEN: usize = 16;
-const CURSOR_SCHEMA_VERSION: &str = "maestro.channel-cursor.v1";
+const CURSOR_SCHEMA_VERSION: &str = "maestro.channel-cursor.v2";
+const MEMBERSHIP_SCHEMA_VERSION: &str = "maestro.channel-members.v2";
+const MEMBERSHIP_RELATIVE_PATH: &str = ".maestro/channels/members.json";
 const DELIVERY_SCHEMA_VERSION: &str = "maestro.channel-delivery.v1";
+/// First backward window a read scans for seen context; it grows 4x until it
+/// holds enough partner messages or reaches the start of the file.
+const CONTEXT_WINDOW_BYTES: u64 = 16 * 1024;
 static MESSAGE_ID_COUNTER: AtomicU64 = AtomicU64::new(0);
 
 /// One message line. Timestamps are fixed-width RFC3339 millis, so a string
@@ -103,12 +125,65 @@ pub enum ChannelKind {
     Feature(String),
 }
 
+impl ChannelKind {
+    /// The partner card id for `viewer` on a pair channel (the other header
+    /// half). Feature broadcast channels have no single partner.
+    pub fn pair_partner(&self, viewer: &str) -> Option<&str> {
+        match self {
+            ChannelKind::Pair(pair) => {
+                if pair[0] == viewer {
+                    Some(&pair[1])
+                } else if pair[1] == viewer {
+                    Some(&pair[0])
+                } else {
+                    None
+                }
+            }
+            ChannelKind::Feature(_) => None,
+        }
+    }
+
+    /// The user-addressable channel id for a pair or feature channel: pair
+    /// partner for direct messages, feature id for a broadcast.
+    pub fn address(&self, viewer: &str) -> &str {
+        match self {
+            ChannelKind::Pair(_) => self
+                .pair_partner(viewer)
+                .expect("invariant: pair channel has a partner"),
+            ChannelKind::Feature(id) => id,
+        }
+    }
+}
+
+/// A channel known from the membership index: its key and kind, with no
+/// message parsed. Visibility is decided on heads; only the channels a
+/// surface shows are then read.
+#[derive(Clone, Debug, Eq, PartialEq)]
+pub struct ChannelHead {
+    pub key: String,
+    pub kind: ChannelKind,
+}
+
 /// A loaded channel: its kind (the authoritative header) and every message
 /// (ts-sorted when produced by the union readers).
 pub struct Channel {
     pub key: String,
     pub kind: ChannelKind,
     pub messages: Vec<Message>,
+    /// Per worktree root, where the load stopped in that root's file; stored
+    /// with the cursor so the next read resumes there.
+    offsets: BTreeMap<String, FileOffset>,
+}
+
+/// What a read of one channel shows, parsed only past the viewer's cursor:
+/// the unread messages, up to the requested number of already-seen partner
+/// messages above them (both oldest-to-newest), and the cursor [`mark_read`]
+/// stores once they are shown.
+pub struct ChannelRead {
+    pub head: ChannelHead,
+    pub unread: Vec<Message>,
+    pub context: Vec<Message>,
+    next_cursor: Option<CursorState>,
 }
 
 impl Channel {
@@ -164,29 +239,13 @@ impl Channel {
     /// The partner card id for `viewer` on a pair channel (the other header
     /// half). Feature broadcast channels have no single partner.
     pub fn pair_partner(&self, viewer: &str) -> Option<&str> {
-        match &self.kind {
-            ChannelKind::Pair(pair) => {
-                if pair[0] == viewer {
-                    Some(&pair[1])
-                } else if pair[1] == viewer {
-                    Some(&pair[0])
-                } else {
-                    None
-                }
-            }
-            ChannelKind::Feature(_) => None,
-        }
+        self.kind.pair_partner(viewer)
     }
 
     /// The user-addressable channel id for a pair or feature channel: pair
     /// partner for direct messages, feature id for a broadcast.
     pub fn address(&self, viewer: &str) -> &str {
-        match &self.kind {
-            ChannelKind::Pair(_) => self
-                .pair_partner(viewer)
-                .expect("invariant: pair channel has a partner"),
-            ChannelKind::Feature(id) => id,
-        }
+        self.kind.address(viewer)
     }
 }
 
@@ -329,6 +388,8 @@ fn append_message(
     {
         append_jsonl_line(&mut file, &header_json(header))
             .with_context(|| format!("failed to write header to {relative_path}"))?;
+        // Best effort: a stale index is caught and rebuilt by the next read.
+        let _ = record_membership(paths, key, header);
     } else {
         verify_header(paths, key, header)?;
     }
@@ -399,7 +460,7 @@ fn load_delivery_receipts(paths: &MaestroPaths, key: &str) -> Result<Vec<Deliver
 /// send is always local, so a message lives in exactly one root's file (no dedup).
 /// A corrupt root is skipped so one half-written gitignored channel file does not
 /// hide healthy channels from read surfaces.
-fn load_union_by_key(roots: &[MaestroPaths], key: &str) -> Result<Option<Channel>> {
+pub fn load_union_by_key(roots: &[MaestroPaths], key: &str) -> Result<Option<Channel>> {
     let mut found: Vec<Channel> = Vec::new();
     for paths in roots {
         if let Ok(Some(channel)) = load_by_key(paths, key) {
@@ -413,41 +474,70 @@ fn load_union_by_key(roots: &[MaestroPaths], key: &str) -> Result<Option<Channel
 }
 
 /// Every *pair* channel whose header pair contains `card`, loaded in full from
-/// one root. Reads each header in `.maestro/channels/` -- O(total channels in the
-/// repo). Feature broadcast channels are not keyed by member id (the header holds
-/// only the feature), so they are excluded here; a caller loads a feature channel
-/// directly with [`load_feature`]. Visibility (the link gate) is applied by the
-/// caller, not here.
+/// one root. Membership comes from the index (see [`heads_for`]), so only the
+/// matching channels are opened. Feature broadcast channels are not keyed by
+/// member id (the header holds only the feature), so they are excluded here; a
+/// caller loads a feature channel directly with [`load_feature`]. Visibility
+/// (the link gate) is applied by the caller, not here.
 pub fn channels_for(paths: &MaestroPaths, card: &str) -> Result<Vec<Channel>> {
-    let dir = paths.channels_dir();
-    let entries = match fs::read_dir(&dir) {
-        Ok(entries) => entries,
-        Err(error) if error.kind() == ErrorKind::NotFound => return Ok(Vec::new()),
-        Err(error) => {
-            return Err(error).with_context(|| format!("failed to read {}", dir.display()));
-        }
-    };
-    let needle = card.to_lowercase();
     let mut channels = Vec::new();
-    for entry in entries {
-        let entry = entry?;
-        let name = entry.file_name();
-        let Some(key) = name.to_str().and_then(|name| name.strip_suffix(".jsonl")) else {
-            continue;
-        };
-        // A corrupt, half-written, or foreign .jsonl must not blind enumeration of
-        // every healthy channel: skip an unreadable file (matching `cursor`'s lenient
-        // read on this gitignored, ephemeral store) rather than `?`-propagating it.
-        if let Ok(Some(ChannelKind::Pair(pair))) = load_kind_by_key(paths, key)
-            && pair.contains(&needle)
-            && let Ok(Some(channel)) = load_by_key(paths, key)
-        {
+    for head in heads_for(paths, card)? {
+        // A file that went bad since the index was built must not blind the
+        // healthy channels: skip it, like the union readers do.
+        if let Ok(Some(channel)) = load_by_key(paths, &head.key) {
             channels.push(channel);
         }
     }
     Ok(channels)
 }
 
+/// Every *pair* channel `card` is a member of in one root, from the membership
+/// index -- no channel file is opened unless the index has to be rebuilt.
+pub fn heads_for(paths: &MaestroPaths, card: &str) -> Result<Vec<ChannelHead>> {
+    let needle = card.to_lowercase();
+    let membership = membership(paths)?;
+    Ok(membership
+        .cards
+        .get(&needle)
+        .into_iter()
+        .flatten()
+        .map(|(key, partner)| {
+            let mut pair = [needle.clone(), partner.clone()];
+            pair.sort();
+            ChannelHead {
+                key: key.clone(),
+                kind: ChannelKind::Pair(pair),
+            }
+        })
+        .collect())
+}
+
+/// [`heads_for`] across every worktree root, one head per distinct key.
+pub fn heads_for_union(roots: &[MaestroPaths], card: &str) -> Result<Vec<ChannelHead>> {
+    let mut by_key: BTreeMap<String, ChannelHead> = BTreeMap::new();
+    for paths in roots {
+        for head in heads_for(paths, card)? {
+            by_key.entry(head.key.clone()).or_insert(head);
+        }
+    }
+    Ok(by_key.into_values().collect())
+}
+
+/// The feature broadcast channel for `feature_id`, if any worktree root's
+/// membership index holds it.
+pub fn feature_head_union(roots: &[MaestroPaths], feature_id: &str) -> Result<Option<ChannelHead>> {
+    let feature = feature_id.to_lowercase();
+    for paths in roots {
+        if let Some(key) = membership(paths)?.features.remove(&feature) {
+            return Ok(Some(ChannelHead {
+                key,
+                kind: ChannelKind::Feature(feature),
+            }));
+        }
+    }
+    Ok(None)
+}
+
 /// Every channel `card` participates in, merged across all worktree roots: one
 /// `Channel` per distinct key with the per-worktree append streams interleaved
 /// by ts. Visibility (the link gate) is applied by the caller.
@@ -488,20 +578,7 @@ pub fn cursor(paths: &MaestroPaths, key: &str, viewer: &str) -> Result<Option<St
 /// Read the newest cursor for `viewer` across worktree roots, merging exact
 /// same-timestamp seen ids when several roots have read to the same point.
 pub fn cursor_union(roots: &[MaestroPaths], key: &str, viewer: &str) -> Result<Option<String>> {
-    let mut merged: Option<CursorState> = None;
-    for paths in roots {
-        let Some(raw) = cursor(paths, key, viewer)? else {
-            continue;
-        };
-        let Some(state) = parse_cursor(&raw) else {
-            continue;
-        };
-        match &mut merged {
-            None => merged = Some(state),
-            Some(current) => current.merge(state),
-        }
-    }
-    Ok(merged.map(|state| state.to_storage()))
+    Ok(cursor_state_union(roots, key, viewer)?.map(|state| state.to_storage()))
 }
 
 /// Advance the viewer's cursor for channel `key` to `through_ts` (the newest
@@ -516,13 +593,122 @@ pub fn set_cursor(paths: &MaestroPaths, key: &str, viewer: &str, through_ts: &st
 
 /// Advance the viewer's cursor to the newest loaded message, preserving exact
 /// ids for every message at that timestamp so later same-ms messages remain
-/// unread.
+/// unread, and the offsets the load stopped at so the next read resumes there.
 pub fn set_cursor_to_latest(paths: &MaestroPaths, channel: &Channel, viewer: &str) -> Result<()> {
-    let Some(cursor) = CursorState::for_latest(channel) else {
+    let Some(mut cursor) = CursorState::for_latest(&channel.messages) else {
+        return Ok(());
+    };
+    cursor.offsets = channel.offsets.clone();
+    write_cursor(paths, &channel.key, viewer, &cursor)
+}
+
+/// The unread messages `viewer` has on channel `key` across worktree roots,
+/// counted from each root's file past the cursor's offset there. A corrupt
+/// root is skipped, like the union loaders.
+pub fn unread_count_union(roots: &[MaestroPaths], key: &str, viewer: &str) -> Result<usize> {
+    let cursor = cursor_state_union(roots, key, viewer)?;
+    Ok(tails_since(roots, key, cursor.as_ref())
+        .iter()
+        .flat_map(|(_, tail)| &tail.messages)
+        .filter(|message| message.from_card != viewer)
+        .filter(|message| cursor.as_ref().is_none_or(|seen| !seen.covers(message)))
+        .count())
+}
+
+/// Read `head` for `viewer` across worktree roots, parsing each root's file
+/// only past the cursor's offset there, with up to `context_limit` seen
+/// partner messages read backward from those offsets. `None` when no root
+/// holds the channel.
+pub fn read_since_cursor(
+    roots: &[MaestroPaths],
+    head: &ChannelHead,
+    viewer: &str,
+    context_limit: usize,
+) -> Result<Option<ChannelRead>> {
+    let cursor = cursor_state_union(roots, &head.key, viewer)?;
+    let tails = tails_since(roots, &head.key, cursor.as_ref());
+    if tails.is_empty() {
+        return Ok(None);
+    }
+    let mut context = Vec::new();
+    let mut messages = Vec::new();
+    let mut offsets = BTreeMap::new();
+    for (paths, tail) in tails {
+        if tail.start > 0 {
+            context.extend(
+                read_context_before(paths, &head.key, tail.start, viewer, context_limit)
+                    .unwrap_or_default(),
+            );
+        }
+        offsets.insert(root_id(paths), tail.end);
+        messages.extend(tail.messages);
+    }
+    messages.sort_by(|a, b| a.ts.cmp(&b.ts));
+
+    let mut next_cursor = cursor.clone();
+    if let Some(latest) = CursorState::for_latest(&messages) {
+        match &mut next_cursor {
+            None => next_cursor = Some(latest),
+            Some(current) => current.merge(latest),
+        }
+    }
+    if let Some(next) = &mut next_cursor {
+        next.offsets.extend(offsets);
+    }
+
+    let mut unread = Vec::new();
+    for message in messages {
+        if message.from_card == viewer {
+            continue;
+        }
+        match &cursor {
+            Some(seen) if seen.covers(&message) => context.push(message),
+            _ => unread.push(message),
+        }
+    }
+    context.sort_by(|a, b| a.ts.cmp(&b.ts));
+    let start = context.len().saturating_sub(context_limit);
+    Ok(Some(ChannelRead {
+        head: head.clone(),
+        unread,
+        context: context.split_off(start),
+        next_cursor,
+    }))
+}
+
+/// Store the cursor a shown [`ChannelRead`] advances to: everything it read
+/// is seen, and the next read resumes where this one stopped.
+pub fn mark_read(paths: &MaestroPaths, read: &ChannelRead, viewer: &str) -> Result<()> {
+    let Some(cursor) = &read.next_cursor else {
         return Ok(());
     };
+    write_cursor(paths, &read.head.key, viewer, cursor)
+}
+
+fn cursor_state_union(
+    roots: &[MaestroPaths],
+    key: &str,
+    viewer: &str,
+) -> Result<Option<CursorState>> {
+    let mut merged: Option<CursorState> = None;
+    for paths in roots {
+        let Some(raw) = cursor(paths, key, viewer)? else {
+            continue;
+        };
+        let Some(state) = parse_cursor(&raw) else {
+            continue;
+        };
+        match &mut merged {
+            None => merged = Some(state),
+            Some(current) => current.merge(state),
+        }
+    }
+    Ok(merged)
+}
+
+fn write_cursor(paths: &MaestroPaths, key: &str, viewer: &str, cursor: &CursorState) -> Result<()> {
     ensure_channels_dir(paths)?;
-    let relative_path = cursor_relative_path(&channel.key, viewer);
+    let relative_path = cursor_relative_path(key, viewer);
     let path = managed_path(paths, &relative_path, SymlinkPolicy::RejectAllComponents)?;
     fs::write(&path, format!("{}\n", cursor.to_storage()))
         .with_context(|| format!("failed to write {relative_path}"))
@@ -548,6 +734,10 @@ fn channel_relative_path(key: &str) -> String {
     format!(".maestro/channels/{key}.jsonl")
 }
 
+fn channel_file(paths: &MaestroPaths, key: &str) -> PathBuf {
+    paths.repo_root().join(channel_relative_path(key))
+}
+
 fn delivery_relative_path(key: &str) -> String {
     format!(".maestro/channels/delivery/{key}.jsonl")
 }
@@ -566,11 +756,23 @@ fn ensure_channels_dir(paths: &MaestroPaths) -> Result<()> {
     fs::create_dir_all(&dir).with_context(|| format!("failed to create {}", dir.display()))
 }
 
+/// Where a reader stopped in one worktree's channel file: the file's identity
+/// and the end of the last complete line it consumed.
+#[derive(Clone, Copy, Debug, Eq, PartialEq)]
+struct FileOffset {
+    inode: u64,
+    offset: u64,
+}
+
 #[derive(Clone, Debug, Eq, PartialEq)]
 struct CursorState {
     through_ts: String,
     seen_at_through: BTreeSet<String>,
     exact: bool,
+    /// Per worktree root, the prefix of that root's file every message of
+    /// which the cursor covers. Coverage only grows as a cursor advances, so
+    /// an offset recorded under any older cursor stays valid.
+    offsets: BTreeMap<String, FileOffset>,
 }
 
 impl CursorState {
@@ -579,6 +781,7 @@ impl CursorState {
             through_ts,
             seen_at_through: BTreeSet::new(),
             exact: false,
+            offsets: BTreeMap::new(),
         }
     }
 
@@ -587,18 +790,18 @@ impl CursorState {
             through_ts,
             seen_at_through,
             exact: true,
+            offsets: BTreeMap::new(),
         }
     }
 
-    fn for_latest(channel: &Channel) -> Option<Self> {
-        let through_ts = channel.latest_ts()?.to_string();
-        let seen_at_through = channel
-            .messages
+    fn for_latest(messages: &[Message]) -> Option<Self> {
+        let through_ts = messages.iter().map(|message| message.ts.as_str()).max()?;
+        let seen_at_through = messages
             .iter()
             .filter(|message| message.ts == through_ts)
             .map(message_cursor_id)
             .collect();
-        Some(Self::exact(through_ts, seen_at_through))
+        Some(Self::exact(through_ts.to_string(), seen_at_through))
     }
 
     fn covers(&self, message: &Message) -> bool {
@@ -610,7 +813,18 @@ impl CursorState {
         }
     }
 
-    fn merge(&mut self, other: Self) {
+    fn merge(&mut self, mut other: Self) {
+        let mut offsets = std::mem::take(&mut self.offsets);
+        for (root, offset) in std::mem::take(&mut other.offsets) {
+            offsets
+                .entry(root)
+                .and_modify(|current| {
+                    if current.inode == offset.inode && current.offset < offset.offset {
+                        *current = offset;
+                    }
+                })
+                .or_insert(offset);
+        }
         match other.through_ts.cmp(&self.through_ts) {
             std::cmp::Ordering::Less => {}
             std::cmp::Ordering::Greater => *self = other,
@@ -622,22 +836,37 @@ impl CursorState {
                 self.seen_at_through.clear();
             }
         }
+        self.offsets = offsets;
     }
 
+    /// A bare ts for a timestamp-only cursor with no offsets (the legacy
+    /// shape); JSON otherwise.
     fn to_storage(&self) -> String {
-        if !self.exact {
+        if !self.exact && self.offsets.is_empty() {
             return self.through_ts.clone();
         }
-        let seen: Vec<&str> = self.seen_at_through.iter().map(String::as_str).collect();
-        json!({
+        let mut value = json!({
             "schema_version": CURSOR_SCHEMA_VERSION,
             "through_ts": self.through_ts,
-            "seen_at_through": seen,
-        })
-        .to_string()
+        });
+        if self.exact {
+            let seen: Vec<&str> = self.seen_at_through.iter().map(String::as_str).collect();
+            value["seen_at_through"] = json!(seen);
+        }
+        if !self.offsets.is_empty() {
+            value["offsets"] = self
+                .offsets
+                .iter()
+                .map(|(root, offset)| (root.clone(), json!([offset.inode, offset.offset])))
+                .collect::<serde_json::Map<_, _>>()
+                .into();
+        }
+        value.to_string()
     }
 }
 
+/// Parse a stored cursor: a bare ts, or JSON whose `seen_at_through` (when
+/// present) makes it exact and whose `offsets` map roots to `[inode, offset]`.
 fn parse_cursor(raw: &str) -> Option<CursorState> {
     let raw = raw.trim();
     if parse_utc_timestamp(raw).is_some() {
@@ -646,14 +875,32 @@ fn parse_cursor(raw: &str) -> Option<CursorState> {
     let value: Value = serde_json::from_str(raw).ok()?;
     let through_ts = value.get("through_ts").and_then(Value::as_str)?;
     parse_utc_timestamp(through_ts)?;
-    let seen_at_through = value
-        .get("seen_at_through")
-        .and_then(Value::as_array)?
-        .iter()
-        .filter_map(Value::as_str)
-        .map(str::to_string)
-        .collect();
-    Some(CursorState::exact(through_ts.to_string(), seen_at_through))
+    let mut state = match value.get("seen_at_through") {
+        Some(seen) => CursorState::exact(
+            through_ts.to_string(),
+            seen.as_array()?
+                .iter()
+                .filter_map(Value::as_str)
+                .map(str::to_string)
+                .collect(),
+        ),
+        None => CursorState::timestamp_only(through_ts.to_string()),
+    };
+    if let Some(offsets) = value.get("offsets").and_then(Value::as_object) {
+        for (root, offset) in offsets {
+            let parsed = offset.as_array().and_then(|pair| match pair.as_slice() {
+                [inode, offset] => Some(FileOffset {
+                    inode: inode.as_u64()?,
+                    offset: offset.as_u64()?,
+                }),
+                _ => None,
+            });
+            if let Some(parsed) = parsed {
+                state.offsets.insert(root.clone(), parsed);
+            }
+        }
+    }
+    Some(state)
 }
 
 fn new_message_id(ts: &str, from_card: &str, from_session: &str, text: &str) -> String {
@@ -716,29 +963,34 @@ fn preview(text: &str) -> String {
 /// single channel whose messages are ts-sorted. Assumes a non-empty input.
 fn merge_same_key(key: String, mut channels: Vec<Channel>) -> Channel {
     let kind = channels[0].kind.clone();
-    let mut messages: Vec<Message> = channels
-        .drain(..)
-        .flat_map(|channel| channel.messages)
-        .collect();
+    let mut offsets = BTreeMap::new();
+    let mut messages: Vec<Message> = Vec::new();
+    for channel in channels.drain(..) {
+        offsets.extend(channel.offsets);
+        messages.extend(channel.messages);
+    }
     messages.sort_by(|a, b| a.ts.cmp(&b.ts));
     Channel {
         key,
         kind,
         messages,
+        offsets,
     }
 }
 
 fn load_by_key(paths: &MaestroPaths, key: &str) -> Result<Option<Channel>> {
-    let relative_path = channel_relative_path(key);
-    let path = managed_path(paths, &relative_path, SymlinkPolicy::RejectAllComponents)?;
-    let bytes = match fs::read(&path) {
-        Ok(bytes) => bytes,
-        Err(error) if error.kind() == ErrorKind::NotFound => return Ok(None),
-        Err(error) => {
-            return Err(error).with_context(|| format!("failed to read {relative_path}"));
-        }
+    let Some(tail) = read_tail(paths, key, None)? else {
+        return Ok(None);
     };
-    parse_channel(key, &bytes).map(Some)
+    let kind = tail
+        .kind
+        .with_context(|| format!("channel {key} has no header line"))?;
+    Ok(Some(Channel {
+        key: key.to_string(),
+        kind,
+        messages: tail.messages,
+        offsets: BTreeMap::from([(root_id(paths), tail.end)]),
+    }))
 }
 
 fn load_kind_by_key(paths: &MaestroPaths, key: &str) -> Result<Option<ChannelKind>> {
@@ -771,6 +1023,302 @@ fn load_kind_by_key(paths: &MaestroPaths, key: &str) -> Result<Option<ChannelKin
     }
 }
 
+/// One worktree's channel file read from a cursor offset to its last complete
+/// line.
+struct FileTail {
+    /// The header, when the read started at byte 0.
+    kind: Option<ChannelKind>,
+    messages: Vec<Message>,
+    /// Where the read started: the resumed offset, or 0.
+    start: u64,
+    end: FileOffset,
+}
+
+/// Read `key`'s file in one root from `from` onward, or from byte 0 when
+/// `from` is absent or no longer describes a prefix of the file: it names
+/// another file, lies past the end, or does not follow a line break. A line
+/// still being appended is left for the next read. `None` when the file does
+/// not exist.
+fn read_tail(
+    paths: &MaestroPaths,
+    key: &str,
+    from: Option<&FileOffset>,
+) -> Result<Option<FileTail>> {
+    let relative_path = channel_relative_path(key);
+    let path = managed_path(paths, &relative_path, SymlinkPolicy::RejectAllComponents)?;
+    let mut file = match File::open(&path) {
+        Ok(file) => file,
+        Err(error) if error.kind() == ErrorKind::NotFound => return Ok(None),
+        Err(error) => {
+            return Err(error).with_context(|| format!("failed to read {relative_path}"));
+        }
+    };
+    let metadata = file
+        .metadata()
+        .with_context(|| format!("failed to stat {relative_path}"))?;
+    let inode = file_identity(&metadata);
+    let start = match from {
+        Some(from)
+            if from.inode == inode && resumes_at(&mut file, metadata.len(), from.offset)? =>
+        {
+            from.offset
+        }
+        _ => 0,
+    };
+    let mut bytes = Vec::new();
+    file.seek(SeekFrom::Start(start))
+        .and_then(|_| file.read_to_end(&mut bytes))
+        .with_context(|| format!("failed to read {relative_path}"))?;
+    let complete = bytes
+        .iter()
+        .rposition(|byte| *byte == b'\n')
+        .map_or(0, |newline| newline + 1);
+    let (kind, messages) = parse_lines(key, &bytes[..complete], start == 0)?;
+    Ok(Some(FileTail {
+        kind,
+        messages,
+        start,
+        end: FileOffset {
+            inode,
+            offset: start + complete as u64,
+        },
+    }))
+}
+
+/// Whether `offset` is still a line boundary inside the open file.
+fn resumes_at(file: &mut File, len: u64, offset: u64) -> Result<bool> {
+    if offset == 0 {
+        return Ok(true);
+    }
+    if offset > len {
+        return Ok(false);
+    }
+    let mut before = [0u8; 1];
+    file.seek(SeekFrom::Start(offset - 1))?;
+    file.read_exact(&mut before)?;
+    Ok(before[0] == b'\n')
+}
+
+/// Every root's tail of `key` past `cursor`'s offset there. A root without
+/// the file, or whose file does not parse, is skipped.
+fn tails_since<'a>(
+    roots: &'a [MaestroPaths],
+    key: &str,
+    cursor: Option<&CursorState>,
+) -> Vec<(&'a MaestroPaths, FileTail)> {
+    roots
+        .iter()
+        .filter_map(|paths| {
+            let from = cursor.and_then(|cursor| cursor.offsets.get(&root_id(paths)));
+            match read_tail(paths, key, from) {
+                Ok(Some(tail)) => Some((paths, tail)),
+                _ => None,
+            }
+        })
+        .collect()
+}
+
+/// Up to `limit` partner messages from the lines before `end` in one root's
+/// file, oldest-to-newest. Reads backward in growing windows, so a long
+/// history is not parsed just to show its last few lines.
+fn read_context_before(
+    paths: &MaestroPaths,
+    key: &str,
+    end: u64,
+    viewer: &str,
+    limit: usize,
+) -> Result<Vec<Message>> {
+    if limit == 0 {
+        return Ok(Vec::new());
+    }
+    let relative_path = channel_relative_path(key);
+    let path = managed_path(paths, &relative_path, SymlinkPolicy::RejectAllComponents)?;
+    let mut file = File::open(&path).with_context(|| format!("failed to read {relative_path}"))?;
+    let mut window = CONTEXT_WINDOW_BYTES;
+    loop {
+        let start = end.saturating_sub(window);
+        let mut bytes = vec![0; (end - start) as usize];
+        file.seek(SeekFrom::Start(start))
+            .and_then(|_| file.read_exact(&mut bytes))
+            .with_context(|| format!("failed to read {relative_path}"))?;
+        // A window that starts mid-line drops the partial first line.
+        let first_line = if start == 0 {
+            0
+        } else {
+            bytes
+                .iter()
+                .position(|byte| *byte == b'\n')
+                .map_or(bytes.len(), |newline| newline + 1)
+        };
+        let (_, messages) = parse_lines(key, &bytes[first_line..], start == 0)?;
+        let mut partner: Vec<Message> = messages
+            .into_iter()
+            .filter(|message| message.from_card != viewer)
+            .collect();
+        if partner.len() >= limit || start == 0 {
+            let keep = partner.len().saturating_sub(limit);
+            return Ok(partner.split_off(keep));
+        }
+        window = window.saturating_mul(4);
+    }
+}
+
+/// The key a root's entry in a cursor's offsets is stored under.
+fn root_id(paths: &MaestroPaths) -> String {
+    paths.repo_root().display().to_string()
+}
+
+/// The membership index persisted at `.maestro/channels/members.json`: which
+/// channel files a root holds, answered without opening them.
+#[derive(Default, Deserialize, Serialize)]
+struct Membership {
+    schema_version: String,
+    /// Pair channels by member card id (lowercased): key -> the other member.
+    cards: BTreeMap<String, BTreeMap<String, String>>,
+    /// Broadcast channel key by feature id (lowercased).
+    features: BTreeMap<String, String>,
+    /// Channel files whose header did not parse when the index was built,
+    /// with the `(mtime_ns, len)` they had then. An empty or half-written file
+    /// is usually a channel mid-create; once its stat moves, the next read
+    /// probes it again.
+    unreadable: BTreeMap<String, (u128, u64)>,
+}
+
+impl Membership {
+    fn keys(&self) -> BTreeSet<&str> {
+        self.cards
+            .values()
+            .flat_map(BTreeMap::keys)
+            .chain(self.features.values())
+            .chain(self.unreadable.keys())
+            .map(String::as_str)
+            .collect()
+    }
+
+    /// Whether every file recorded as unreadable still has the stat it had
+    /// when it failed to parse.
+    fn unreadable_unchanged(&self, paths: &MaestroPaths) -> Result<bool> {
+        if self.unreadable.is_empty() {
+            return Ok(true);
+        }
+        let files: Vec<PathBuf> = self
+            .unreadable
+            .keys()
+            .map(|key| channel_file(paths, key))
+            .collect();
+        let stamps = stat_fingerprint(&files, &[])?;
+        Ok(self
+            .unreadable
+            .iter()
+            .all(|(key, stamp)| stamps.get(&channel_file(paths, key)) == Some(stamp)))
+    }
+
+    fn insert(&mut self, key: &str, kind: &ChannelKind) {
+        match kind {
+            ChannelKind::Pair([a, b]) => {
+                for (card, partner) in [(a, b), (b, a)] {
+                    self.cards
+                        .entry(card.to_lowercase())
+                        .or_default()
+                        .insert(key.to_string(), partner.to_lowercase());
+                }
+            }
+            ChannelKind::Feature(feature) => {
+                self.features
+                    .insert(feature.to_lowercase(), key.to_string());
+            }
+        }
+        self.unreadable.remove(key);
+    }
+}
+
+/// The root's membership index, rebuilt from the channel headers (and
+/// rewritten, best effort) when it is missing, unreadable, does not list
+/// exactly the channel files on disk, or a file it recorded as unreadable has
+/// since changed.
+fn membership(paths: &MaestroPaths) -> Result<Membership> {
+    let dir = paths.channels_dir();
+    let entries = match fs::read_dir(&dir) {
+        Ok(entries) => entries,
+        Err(error) if error.kind() == ErrorKind::NotFound => return Ok(Membership::default()),
+        Err(error) => {
+            return Err(error).with_context(|| format!("failed to read {}", dir.display()));
+        }
+    };
+    let mut keys = BTreeSet::new();
+    for entry in entries {
+        let entry = entry?;
+        if let Some(key) = entry
+            .file_name()
+            .to_str()
+            .and_then(|name| name.strip_suffix(".jsonl"))
+        {
+            keys.insert(key.to_string());
+        }
+    }
+    if let Some(index) = read_membership(paths)
+        && index.keys() == keys.iter().map(String::as_str).collect::<BTreeSet<_>>()
+        && index.unreadable_unchanged(paths)?
+    {
+        return Ok(index);
+    }
+    let mut index = Membership {
+        schema_version: MEMBERSHIP_SCHEMA_VERSION.to_string(),
+        ..Membership::default()
+    };
+    for key in keys {
+        // A corrupt, half-written, or foreign .jsonl must not blind enumeration
+        // of every healthy channel: it is recorded as unreadable, not
+        // `?`-propagated. Its stat is taken before the probe, so a header
+        // written mid-probe still moves it.
+        let path = channel_file(paths, &key);
+        let stamp = stat_fingerprint(std::slice::from_ref(&path), &[])?.remove(&path);
+        match load_kind_by_key(paths, &key) {
+            Ok(Some(kind)) => index.insert(&key, &kind),
+            Ok(None) => {}
+            Err(_) => {
+                if let Some(stamp) = stamp {
+                    index.unreadable.insert(key, stamp);
+                }
+            }
+        }
+    }
+    let _ = write_membership(paths, &index);
+    Ok(index)
+}
+
+/// Add a newly created channel to the root's index. A missing or unreadable
+/// index is left for the next read to rebuild.
+fn record_membership(paths: &MaestroPaths, key: &str, kind: &ChannelKind) -> Result<()> {
+    let Some(mut index) = read_membership(paths) else {
+        return Ok(());
+    };
+    index.insert(key, kind);
+    write_membership(paths, &index)
+}
+
+fn read_membership(paths: &MaestroPaths) -> Option<Membership> {
+    let path = managed_path(
+        paths,
+        MEMBERSHIP_RELATIVE_PATH,
+        SymlinkPolicy::RejectAllComponents,
+    )
+    .ok()?;
+    fs::read(path)
+        .ok()
+        .and_then(|bytes| serde_json::from_slice::<Membership>(&bytes).ok())
+        .filter(|index| index.schema_version == MEMBERSHIP_SCHEMA_VERSION)
+}
+
+fn write_membership(paths: &MaestroPaths, index: &Membership) -> Result<()> {
+    let path = managed_path(
+        paths,
+        MEMBERSHIP_RELATIVE_PATH,
+        SymlinkPolicy::RejectAllComponents,
+    )?;
+    write_atomic(path, &serde_json::to_vec(index)?)
+}
+
 fn verify_delivery_header(
     paths: &MaestroPaths,
     key: &str,
@@ -821,7 +1369,14 @@ fn verify_header(paths: &MaestroPaths, key: &str, expected: &ChannelKind) -> Res
     Ok(())
 }
 
-fn parse_channel(key: &str, bytes: &[u8]) -> Result<Channel> {
+/// Parse channel lines: the authoritative header first when `with_header` (a
+/// read from byte 0), message lines after it. A missing header is the
+/// caller's call -- a read that never reached a complete line has none yet.
+fn parse_lines(
+    key: &str,
+    bytes: &[u8],
+    with_header: bool,
+) -> Result<(Option<ChannelKind>, Vec<Message>)> {
     let text = std::str::from_utf8(bytes).context("channel file is not UTF-8")?;
     let mut kind: Option<ChannelKind> = None;
     let mut messages = Vec::new();
@@ -832,17 +1387,13 @@ fn parse_channel(key: &str, bytes: &[u8]) -> Result<Channel> {
         }
         let value: Value = serde_json::from_str(trimmed)
             .with_context(|| format!("malformed channel line in {key}"))?;
-        match kind {
-            None => kind = Some(parse_header(&value, key)?),
-            Some(_) => messages.push(parse_message(&value)),
+        if with_header && kind.is_none() {
+            kind = Some(parse_header(&value, key)?);
+        } else {
+            messages.push(parse_message(&value));
         }
     }
-    let kind = kind.with_context(|| format!("channel {key} has no header line"))?;
-    Ok(Channel {
-        key: key.to_string(),
-        kind,
-        messages,
-    })
+    Ok((kind, messages))
 }
 
 fn parse_delivery_receipts(key: &str, bytes: &[u8]) -> Result<Vec<DeliveryReceipt>> {
@@ -1004,6 +1555,7 @@ mod tests {
                     text: (*text).to_string(),
                 })
                 .collect(),
+            offsets: BTreeMap::new(),
         }
     }
 
@@ -1195,6 +1747,7 @@ mod tests {
             key: "pair-key".to_string(),
             kind: ChannelKind::Pair(["card-a".to_string(), "card-b".to_string()]),
             messages: Vec::new(),
+            offsets: BTreeMap::new(),
         };
         assert_eq!(pair.pair_partner("card-a"), Some("card-b"));
         assert_eq!(pair.pair_partner("card-b"), Some("card-a"));
@@ -1204,6 +1757,7 @@ mod tests {
             key: "feature-key".to_string(),
             kind: ChannelKind::Feature("feature-1".to_string()),
             messages: Vec::new(),
+            offsets: BTreeMap::new(),
         };
         assert_eq!(feature.pair_partner("feature-1"), None);
         assert_eq!(feature.address("card-a"), "feature-1");
@@ -1453,4 +2007,218 @@ mod tests {
             "no bytes may be written through the symlink: {leaked}"
         );
     }
+
+    /// Append `(ts, from, text)` message lines to `key`'s file, writing the
+    /// pair header first when the file is new.
+    fn append_lines(
+        paths: &MaestroPaths,
+        key: &str,
+        pair: [&str; 2],
+        lines: &[(&str, &str, &str)],
+    ) {
+        use std::io::Write;
+        fs::create_dir_all(paths.channels_dir()).expect("channels dir should be creatable");
+        let path = paths.channels_dir().join(format!("{key}.jsonl"));
+        let mut file = fs::OpenOptions::new()
+            .create(true)
+            .append(true)
+            .open(&path)
+            .expect("channel fixture should be appendable");
+        if file.metadata().expect("fixture metadata").len() == 0 {
+            writeln!(file, "{}", json!({ "pair": pair })).expect("header should write");
+        }
+        for (ts, from, text) in lines {
+            let id = sha256_hex(format!("{ts}\x1f{from}\x1f{text}").as_bytes());
+            let line = json!({"id": id, "ts": ts, "from_card": from, "from_session": "sess", "text": text});
+            writeln!(file, "{line}").expect("message should write");
+        }
+    }
+
+    fn texts(messages: &[Message]) -> Vec<&str> {
+        messages
+            .iter()
+            .map(|message| message.text.as_str())
+            .collect()
+    }
+
+    #[test]
+    fn a_channel_read_before_its_header_is_written_appears_once_it_is() {
+        let temp = TestTempDir::new("maestro-channel-members-empty");
+        let paths = MaestroPaths::new(temp.path());
+        let (_, key) = identity("card-a", "card-b");
+        fs::create_dir_all(paths.channels_dir()).expect("channels dir should be creatable");
+        fs::write(paths.channels_dir().join(format!("{key}.jsonl")), "")
+            .expect("plant the empty channel file");
+        assert!(
+            heads_for(&paths, "card-a")
+                .expect("heads should resolve")
+                .is_empty()
+        );
+        let index = read_membership(&paths).expect("the first read builds the index");
+        assert!(index.unreadable.contains_key(&key));
+
+        append_lines(&paths, &key, ["card-a", "card-b"], &[]);
+        let partners: Vec<String> = heads_for(&paths, "card-a")
+            .expect("heads should resolve")
+            .iter()
+            .filter_map(|head| head.kind.pair_partner("card-a").map(str::to_string))
+            .collect();
+        assert_eq!(partners, ["card-b"]);
+    }
+
+    #[test]
+    fn membership_index_follows_sends_and_rebuilds_when_files_drift() {
+        let temp = TestTempDir::new("maestro-channel-members");
+        let paths = MaestroPaths::new(temp.path());
+
+        send(&paths, "card-a", "card-b", "sess-a", "hi b").expect("a-b send");
+        send_feature(&paths, "feat-x", "card-a", "sess-a", "hi all").expect("broadcast");
+        assert!(
+            read_membership(&paths).is_none(),
+            "sends never build the index"
+        );
+        heads_for(&paths, "card-a").expect("heads should resolve");
+        let index = read_membership(&paths).expect("the first read builds the index");
+        assert_eq!(
+            index.cards["card-b"].values().collect::<Vec<_>>(),
+            ["card-a"]
+        );
+
+        // A later send records its new channel in the existing index.
+        send(&paths, "card-a", "card-e", "sess-a", "hi e").expect("a-e send");
+        let index = read_membership(&paths).expect("index should still parse");
+        assert_eq!(index.cards["card-a"].len(), 2);
+        assert_eq!(index.features["feat-x"], feature_identity("feat-x"));
+
+        // A file that appeared behind the index's back (another binary, a
+        // copied worktree) and a foreign file trigger one rebuild.
+        let (_, key) = identity("card-a", "card-c");
+        append_lines(&paths, &key, ["card-a", "card-c"], &[]);
+        fs::write(paths.channels_dir().join("garbage.jsonl"), "not json\n")
+            .expect("plant the foreign file");
+        let partners: BTreeSet<String> = heads_for(&paths, "CARD-A")
+            .expect("heads should resolve")
+            .iter()
+            .filter_map(|head| head.kind.pair_partner("card-a").map(str::to_string))
+            .collect();
+        assert_eq!(
+            partners,
+            BTreeSet::from(["card-b", "card-c", "card-e"].map(str::to_string))
+        );
+        let index = read_membership(&paths).expect("the rebuild rewrites the index");
+        assert!(index.unreadable.contains_key("garbage"));
+        assert_eq!(
+            feature_head_union(&[paths], "FEAT-X")
+                .expect("feature head should resolve")
+                .map(|head| head.kind),
+            Some(ChannelKind::Feature("feat-x".to_string()))
+        );
+    }
+
+    #[test]
+    fn reads_resume_past_the_cursor_offset_with_context_from_before_it() {
+        let temp = TestTempDir::new("maestro-channel-offset-read");
+        let paths = MaestroPaths::new(temp.path());
+        let (pair, key) = identity("card-a", "card-b");
+        let head = ChannelHead {
+            key: key.clone(),
+            kind: ChannelKind::Pair(pair),
+        };
+        let roots = [paths.clone()];
+        append_lines(
+            &paths,
+            &key,
+            ["card-a", "card-b"],
+            &[
+                ("2026-06-17T00:00:00.000Z", "card-b", "one"),
+                ("2026-06-17T00:00:01.000Z", "card-a", "mine"),
+                ("2026-06-17T00:00:02.000Z", "card-b", "two"),
+            ],
+        );
+
+        let first = read_since_cursor(&roots, &head, "card-a", 5)
+            .expect("first read")
+            .expect("channel exists");
+        assert_eq!(texts(&first.unread), ["one", "two"]);
+        assert!(first.context.is_empty());
+        mark_read(&paths, &first, "card-a").expect("cursor should write");
+        let stored = cursor(&paths, &key, "card-a")
+            .expect("cursor read")
+            .expect("cursor stored");
+        assert!(stored.contains("\"offsets\""), "{stored}");
+
+        append_lines(
+            &paths,
+            &key,
+            ["card-a", "card-b"],
+            &[("2026-06-17T00:00:03.000Z", "card-b", "three")],
+        );
+        let second = read_since_cursor(&roots, &head, "card-a", 1)
+            .expect("second read")
+            .expect("channel exists");
+        assert_eq!(texts(&second.unread), ["three"]);
+        assert_eq!(texts(&second.context), ["two"], "newest seen partner line");
+        mark_read(&paths, &second, "card-a").expect("cursor should advance");
+
+        // Bytes before the offset are never parsed again: clobbering them
+        // leaves the count of newer lines intact.
+        let path = paths.channels_dir().join(format!("{key}.jsonl"));
+        let original = fs::read_to_string(&path).expect("channel readable");
+        fs::write(&path, original.replacen("\"one\"", "\"on\u{0}\"", 1)).expect("clobber");
+        append_lines(
+            &paths,
+            &key,
+            ["card-a", "card-b"],
+            &[("2026-06-17T00:00:04.000Z", "card-b", "four")],
+        );
+        assert_eq!(
+            unread_count_union(&roots, &key, "card-a").expect("count"),
+            1
+        );
+    }
+
+    #[test]
+    fn legacy_and_stale_offset_cursors_fall_back_to_a_full_read() {
+        let temp = TestTempDir::new("maestro-channel-offset-fallback");
+        let paths = MaestroPaths::new(temp.path());
+        let (_, key) = identity("card-a", "card-b");
+        let roots = [paths.clone()];
+        append_lines(
+            &paths,
+            &key,
+            ["card-a", "card-b"],
+            &[
+                ("2026-06-17T00:00:00.000Z", "card-b", "one"),
+                ("2026-06-17T00:00:02.000Z", "card-b", "two"),
+            ],
+        );
+
+        // A bare-ts cursor has no offsets: the whole file is read.
+        set_cursor(&paths, &key, "card-a", "2026-06-17T00:00:01.000Z").expect("legacy cursor");
+        assert_eq!(
+            unread_count_union(&roots, &key, "card-a").expect("count"),
+            1
+        );
+
+        // An offset past the end of a file that was recreated shorter is
+        // ignored rather than trusted.
+        let mut stale = CursorState::timestamp_only("2026-06-17T00:00:01.000Z".to_string());
+        stale.offsets.insert(
+            root_id(&paths),
+            FileOffset {
+                inode: 0,
+                offset: 1 << 20,
+            },
+        );
+        write_cursor(&paths, &key, "card-a", &stale).expect("stale cursor");
+        let reparsed = cursor(&paths, &key, "card-a")
+            .expect("cursor read")
+            .and_then(|raw| parse_cursor(&raw))
+            .expect("offset cursor parses");
+        assert_eq!(reparsed, stale);
+        assert_eq!(
+            unread_count_union(&roots, &key, "card-a").expect("count"),
+            1
+        );
+    }
 }
@@ -11,12 +11,14 @@ use std::collections::BTreeMap;
 use std::path::{Component, Path};
 
 use anyhow::Result;
+use serde::{Deserialize, Serialize};
 
 use crate::foundation::core::paths::MaestroPaths;
 use crate::foundation::core::time::timestamp_nanos;
 
+use super::checkpoint::{EventFold, fold_managed_logs};
 use super::event::run_dir_name;
-use super::reader::{RunEvent, visit_event_log, visit_managed_events};
+use super::reader::{EventLine, visit_event_log, visit_managed_events};
 
 /// Minutes within which the last event marks a session live. Tunable default
 /// (the decision leaves thresholds to the implementation), not a locked value.
@@ -70,7 +72,7 @@ pub struct SessionActivity {
 }
 
 /// One session bucket's most recent observations across the kinds we surface.
-#[derive(Default)]
+#[derive(Default, Deserialize, Serialize)]
 struct Accumulator {
     overall: Option<(i128, String, String)>,
     agent_runtime: Option<(i128, String)>,
@@ -79,14 +81,14 @@ struct Accumulator {
     ownership: Option<OwnershipObservation>,
 }
 
-#[derive(Clone, Copy, Debug, Eq, PartialEq)]
+#[derive(Clone, Copy, Debug, Deserialize, Eq, PartialEq, Serialize)]
 enum OwnershipState {
     Active,
     Released,
     Done,
 }
 
-#[derive(Clone, Debug, Eq, PartialEq)]
+#[derive(Clone, Debug, Deserialize, Eq, PartialEq, Serialize)]
 struct OwnershipObservation {
     ts_nanos: i128,
     card_id: String,
@@ -130,7 +132,7 @@ impl Accumulator {
         }
     }
 
-    fn observe_ownership(&mut self, ts_nanos: i128, event: &RunEvent) {
+    fn observe_ownership(&mut self, ts_nanos: i128, event: &EventLine<'_>) {
         let Some(card_id) = event.card_id() else {
             return;
         };
@@ -144,17 +146,82 @@ impl Accumulator {
         } else {
             return;
         };
+        self.record_ownership(OwnershipObservation {
+            ts_nanos,
+            card_id: card_id.to_string(),
+            state,
+        });
+    }
+
+    fn record_ownership(&mut self, observation: OwnershipObservation) {
         if self
             .ownership
             .as_ref()
-            .is_none_or(|seen| ts_nanos >= seen.ts_nanos)
+            .is_none_or(|seen| observation.ts_nanos >= seen.ts_nanos)
+        {
+            self.ownership = Some(observation);
+        }
+    }
+
+    /// Fold in a later log's observations of the same session. Every slot
+    /// keeps the newest observation with later ties winning, so merging
+    /// per-log accumulators in log order equals observing every event in turn.
+    fn merge(&mut self, later: Accumulator) {
+        if let Some((ts_nanos, event_type, ts)) = later.overall {
+            self.observe_overall(ts_nanos, &event_type, &ts);
+        }
+        if let Some((ts_nanos, agent_runtime)) = later.agent_runtime {
+            self.observe_agent_runtime(ts_nanos, &agent_runtime);
+        }
+        if let Some((ts_nanos, skill)) = later.skill {
+            self.observe_skill(ts_nanos, &skill);
+        }
+        if let Some((ts_nanos, card)) = later.card {
+            self.observe_card(ts_nanos, &card);
+        }
+        if let Some(ownership) = later.ownership {
+            self.record_ownership(ownership);
+        }
+    }
+}
+
+/// Per-log liveness fold: one accumulator per session the log attributes
+/// events to, keyed by the log's own session id.
+#[derive(Default, Deserialize, Serialize)]
+struct SessionFold {
+    sessions: BTreeMap<String, Accumulator>,
+}
+
+impl EventFold for SessionFold {
+    const NAME: &'static str = "active-sessions.v1";
+
+    fn observe(&mut self, session_id: &str, event: &EventLine<'_>) {
+        let Some(ts) = event.timestamp() else {
+            return;
+        };
+        let Some(ts_nanos) = timestamp_nanos(ts) else {
+            return;
+        };
+        let event_type = event
+            .event_type()
+            .or_else(|| event.alias_kind())
+            .unwrap_or("<unknown>");
+        let acc = self.sessions.entry(session_id.to_string()).or_default();
+        acc.observe_overall(ts_nanos, event_type, ts);
+        if let Some(agent_runtime) = event.agent_runtime() {
+            acc.observe_agent_runtime(ts_nanos, agent_runtime);
+        }
+        if event.is_event_type("skill_activation")
+            && let Some(skill) = event.skill_name()
+        {
+            acc.observe_skill(ts_nanos, skill);
+        }
+        if event.is_event_type("card_touch")
+            && let Some(card) = event.card_id()
         {
-            self.ownership = Some(OwnershipObservation {
-                ts_nanos,
-                card_id: card_id.to_string(),
-                state,
-            });
+            acc.observe_card(ts_nanos, card);
         }
+        acc.observe_ownership(ts_nanos, event);
     }
 }
 
@@ -180,44 +247,22 @@ pub fn union_session_id(paths: &MaestroPaths, roots: &[MaestroPaths], session_id
 /// worktree root. With a single root this is the local view; with the roots of
 /// every worktree (`git::worktree_roots`), sessions from sibling worktrees merge
 /// in as a read-only union. Cross-worktree session ids are source-qualified so
-/// fallback or reused ids do not collapse distinct work. The union is read-only:
-/// it never writes outside any root and needs no flag to engage.
+/// fallback or reused ids do not collapse distinct work. The union is read-only
+/// over run state -- its only write is each root's own run-log checkpoint
+/// (`checkpoint::fold_managed_logs`) -- and needs no flag to engage.
 pub fn active_sessions_union(roots: &[MaestroPaths], now: &str) -> Result<Vec<SessionActivity>> {
     let now_nanos = timestamp_nanos(now).unwrap_or(i128::MAX);
     let mut by_session: BTreeMap<String, Accumulator> = BTreeMap::new();
 
     for paths in roots {
-        visit_managed_events(paths, |record| {
-            let session_id = union_session_id(paths, roots, record.session_id());
-            let event = record.event();
-            let Some(ts) = event.timestamp() else {
-                return Ok(());
-            };
-            let Some(ts_nanos) = timestamp_nanos(ts) else {
-                return Ok(());
-            };
-            let event_type = event
-                .event_type()
-                .or_else(|| event.alias_kind())
-                .unwrap_or("<unknown>");
-            let acc = by_session.entry(session_id).or_default();
-            acc.observe_overall(ts_nanos, event_type, ts);
-            if let Some(agent_runtime) = event.agent_runtime() {
-                acc.observe_agent_runtime(ts_nanos, agent_runtime);
-            }
-            if event.is_event_type("skill_activation")
-                && let Some(skill) = event.skill_name()
-            {
-                acc.observe_skill(ts_nanos, skill);
-            }
-            if event.is_event_type("card_touch")
-                && let Some(card) = event.card_id()
-            {
-                acc.observe_card(ts_nanos, card);
+        for fold in fold_managed_logs::<SessionFold>(paths)? {
+            for (session_id, acc) in fold.sessions {
+                by_session
+                    .entry(union_session_id(paths, roots, &session_id))
+                    .or_default()
+                    .merge(acc);
             }
-            acc.observe_ownership(ts_nanos, event);
-            Ok(())
-        })?;
+        }
     }
 
     let mut rows: Vec<(i128, SessionActivity)> = Vec::new();
@@ -322,40 +367,25 @@ pub fn warm_file_overlaps(paths: &MaestroPaths, now: &str) -> Result<Vec<FileOve
     // session -> file -> latest warm-edit ts.
     let mut warm: BTreeMap<String, BTreeMap<String, i128>> = BTreeMap::new();
 
-    visit_managed_events(paths, |record| {
-        let session_id = record.session_id().to_string();
-        let event = record.event();
-        let Some(ts) = event.timestamp() else {
-            return Ok(());
-        };
-        let Some(ts_nanos) = timestamp_nanos(ts) else {
-            return Ok(());
-        };
-
-        if event.is_event_type("card_touch")
-            && let Some(card) = event.card_id()
-        {
+    for fold in fold_managed_logs::<WarmEditFold>(paths)? {
+        for (session_id, (ts_nanos, card)) in fold.bound_card {
             let slot = bound_card
-                .entry(session_id.clone())
+                .entry(session_id)
                 .or_insert((i128::MIN, String::new()));
             if ts_nanos >= slot.0 {
-                *slot = (ts_nanos, card.to_string());
+                *slot = (ts_nanos, card);
             }
         }
-
-        if is_warm_edit(event)
-            && let Some(file) = event.file_path()
-        {
-            let file = normalize_warm_file_path(paths, file);
-            let latest = warm
-                .entry(session_id)
-                .or_default()
-                .entry(file)
-                .or_insert(i128::MIN);
-            *latest = (*latest).max(ts_nanos);
+        for (session_id, files) in fold.warm {
+            let session_files = warm.entry(session_id).or_default();
+            for (file, ts_nanos) in files {
+                let latest = session_files
+                    .entry(normalize_warm_file_path(paths, &file))
+                    .or_insert(i128::MIN);
+                *latest = (*latest).max(ts_nanos);
+            }
         }
-        Ok(())
-    })?;
+    }
 
     // file -> editors whose latest edit is still within the live window.
     let mut by_file: BTreeMap<String, Vec<(String, u64)>> = BTreeMap::new();
@@ -390,6 +420,54 @@ pub fn warm_file_overlaps(paths: &MaestroPaths, now: &str) -> Result<Vec<FileOve
     Ok(overlaps)
 }
 
+/// Per-log warm-edit fold. File paths stay as the agent spelled them and are
+/// normalized at merge time, where the latest edit per normalized path is the
+/// max over its spellings.
+#[derive(Default, Deserialize, Serialize)]
+struct WarmEditFold {
+    /// session -> (ts, card) of its latest `card_touch`.
+    bound_card: BTreeMap<String, (i128, String)>,
+    /// session -> raw file path -> latest warm-edit ts.
+    warm: BTreeMap<String, BTreeMap<String, i128>>,
+}
+
+impl EventFold for WarmEditFold {
+    const NAME: &'static str = "warm-edits.v1";
+
+    fn observe(&mut self, session_id: &str, event: &EventLine<'_>) {
+        let Some(ts) = event.timestamp() else {
+            return;
+        };
+        let Some(ts_nanos) = timestamp_nanos(ts) else {
+            return;
+        };
+
+        if event.is_event_type("card_touch")
+            && let Some(card) = event.card_id()
+        {
+            let slot = self
+                .bound_card
+                .entry(session_id.to_string())
+                .or_insert((i128::MIN, String::new()));
+            if ts_nanos >= slot.0 {
+                *slot = (ts_nanos, card.to_string());
+            }
+        }
+
+        if is_warm_edit(event)
+            && let Some(file) = event.file_path()
+        {
+            let latest = self
+                .warm
+                .entry(session_id.to_string())
+                .or_default()
+                .entry(file.to_string())
+                .or_insert(i128::MIN);
+            *latest = (*latest).max(ts_nanos);
+        }
+    }
+}
+
 /// Declared path scopes that overlap across live sessions in one or more
 /// worktrees. This is split-time advisory data: an orchestrator can declare the
 /// intended repo-relative paths before agents edit, and the read model compares
@@ -493,7 +571,7 @@ pub fn declared_scope_overlaps_for_active_union(
         .collect())
 }
 
-fn is_warm_edit(event: &RunEvent) -> bool {
+fn is_warm_edit(event: &EventLine<'_>) -> bool {
     event.is_event_type("PostToolUse")
         && event
             .tool_name()
@@ -1057,6 +1135,71 @@ mod tests {
         );
     }
 
+    #[test]
+    fn checkpointed_reads_equal_a_full_rescan_as_logs_grow() {
+        use std::io::Write;
+
+        let dir = TestTempDir::new("maestro-active-checkpoint");
+        let paths = MaestroPaths::new(dir.path().to_path_buf());
+        seed(
+            dir.path(),
+            "s-a",
+            &[
+                r#"{"event_type":"card_touch","session_id":"s-a","card_id":"card-a","ts":"2026-06-14T11:50:00.000Z"}"#,
+                r#"{"event_type":"PostToolUse","session_id":"s-a","tool_name":"Edit","file_path":"./src/lib.rs","ts":"2026-06-14T11:58:00.000Z"}"#,
+            ],
+        );
+        seed(
+            dir.path(),
+            "s-b",
+            &[
+                r#"{"event_type":"skill_activation","session_id":"s-b","skill_name":"review","ts":"2026-06-14T11:40:00.000Z"}"#,
+            ],
+        );
+        let full_rescan = || {
+            let _ = fs::remove_dir_all(paths.run_checkpoints_dir());
+            (
+                active_sessions(&paths, NOW).expect("active reads"),
+                warm_file_overlaps(&paths, NOW).expect("overlap reads"),
+            )
+        };
+        full_rescan();
+        assert!(paths.run_checkpoints_dir().is_dir());
+
+        let append = |session: &str, text: &str| {
+            fs::OpenOptions::new()
+                .append(true)
+                .open(
+                    dir.path()
+                        .join(".maestro/runs")
+                        .join(session)
+                        .join("events.jsonl"),
+                )
+                .and_then(|mut file| file.write_all(text.as_bytes()))
+                .expect("invariant: event log should be appendable");
+        };
+        append(
+            "s-b",
+            concat!(
+                r#"{"event_type":"ownership_acquire","session_id":"s-b","card_id":"card-b","ts":"2026-06-14T11:41:00.000Z"}"#,
+                "\n",
+                r#"{"event_type":"PostToolUse","session_id":"s-b","tool_name":"Write","file_path":"src/lib.rs","ts":"2026-06-14T11:59:00.000Z"}"#,
+                "\n",
+                r#"{"event_type":"Stop","session_id":"s-a","ts":"2026-06-14T11:59:30.000Z"}"#,
+                "\n",
+                r#"{"event_type":"card_touch","#,
+            ),
+        );
+        let resumed = (
+            active_sessions(&paths, NOW).expect("active resumes"),
+            warm_file_overlaps(&paths, NOW).expect("overlap resumes"),
+        );
+        assert_eq!(resumed, full_rescan());
+        assert_eq!(resumed.1.len(), 1, "the appended write contends src/lib.rs");
+        assert_eq!(row(&resumed.0, "s-a").last_action, "Stop");
+        assert_eq!(row(&resumed.0, "s-b").bound_card.as_deref(), Some("card-b"));
+    }
+
     #[test]
     fn warm_overlap_flags_two_live_sessions_editing_the_same_file() {
         let dir = TestTempDir::new("maestro-overlap-two");
@@ -0,0 +1,303 @@
+//! Checkpointed folds over the managed run event logs.
+//!
+//! Liveness and harness detection fold every event of every log into a small
+//! per-log state. Logs only grow by appends, so each fold persists its per-log
+//! state with the log's inode and the byte offset the state covers; the next
+//! read resumes at that offset and parses only the lines appended since. A log
+//! whose inode changed, that shrank below the offset, or whose bytes just
+//! before the offset no longer match is rescanned from byte 0, and a missing or
+//! unreadable checkpoint is a full rescan -- the folded states are identical
+//! either way. Persisting is best effort: a read-only tree still reads.
+
+use std::collections::BTreeMap;
+use std::fs::{self, File};
+use std::io::{BufRead, BufReader, ErrorKind, Read, Seek, SeekFrom};
+use std::path::Path;
+
+use anyhow::{Context, Result};
+use serde::de::DeserializeOwned;
+use serde::{Deserialize, Serialize};
+
+use crate::foundation::core::fs::file_identity;
+use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
+use crate::foundation::core::safe_write::write_atomic;
+
+use super::discovery::managed_event_files;
+use super::event::logical_session_id_from_run_path;
+use super::reader::EventLine;
+
+const CHECKPOINT_SCHEMA_VERSION: &str = "maestro.run-checkpoints.v1";
+/// Bytes before the offset kept to detect a log rewritten in place.
+const TAIL_BYTES: usize = 32;
+
+/// Per-log state folded from a log's events, in log order.
+pub(crate) trait EventFold: Default + Serialize + DeserializeOwned {
+    /// Checkpoint file stem; versioned so a state shape change starts fresh.
+    const NAME: &'static str;
+
+    /// Fold one complete, parseable event line attributed to `session_id`.
+    fn observe(&mut self, session_id: &str, event: &EventLine<'_>);
+}
+
+#[derive(Deserialize, Serialize)]
+struct CheckpointFile<L> {
+    schema_version: String,
+    logs: L,
+}
+
+#[derive(Deserialize, Serialize)]
+struct LogCheckpoint<F> {
+    inode: u64,
+    /// End of the last complete line folded into `state`.
+    offset: u64,
+    /// The bytes just before `offset`.
+    tail: Vec<u8>,
+    state: F,
+}
+
+/// Fold every managed event log under `paths`, resuming each from its
+/// checkpoint, and return the per-log states in log order.
+pub(crate) fn fold_managed_logs<F: EventFold>(paths: &MaestroPaths) -> Result<Vec<F>> {
+    let _phase = profile::phase("runs.replay");
+    let file = paths
+        .run_checkpoints_dir()
+        .join(format!("{}.json", F::NAME));
+    let mut previous = read_checkpoints::<F>(&file);
+    let mut dirty = false;
+    let mut logs = Vec::new();
+    for path in managed_event_files(paths)? {
+        let key = path
+            .strip_prefix(paths.runs_dir())
+            .unwrap_or(&path)
+            .display()
+            .to_string();
+        let Some((checkpoint, changed)) = fold_log(&path, previous.remove(&key))? else {
+            continue;
+        };
+        dirty |= changed;
+        logs.push((key, checkpoint));
+    }
+    if dirty || !previous.is_empty() {
+        let _ = write_checkpoints(&file, &logs);
+    }
+    Ok(logs.into_iter().map(|(_, log)| log.state).collect())
+}
+
+fn read_checkpoints<F: EventFold>(file: &Path) -> BTreeMap<String, LogCheckpoint<F>> {
+    fs::read(file)
+        .ok()
+        .and_then(|bytes| {
+            serde_json::from_slice::<CheckpointFile<BTreeMap<String, LogCheckpoint<F>>>>(&bytes)
+                .ok()
+        })
+        .filter(|checkpoints| checkpoints.schema_version == CHECKPOINT_SCHEMA_VERSION)
+        .map(|checkpoints| checkpoints.logs)
+        .unwrap_or_default()
+}
+
+fn write_checkpoints<F: EventFold>(file: &Path, logs: &[(String, LogCheckpoint<F>)]) -> Result<()> {
+    let checkpoints = CheckpointFile {
+        schema_version: CHECKPOINT_SCHEMA_VERSION.to_string(),
+        logs: logs
+            .iter()
+            .map(|(key, log)| (key.as_str(), log))
+            .collect::<BTreeMap<_, _>>(),
+    };
+    write_atomic(file, &serde_json::to_vec(&checkpoints)?)
+}
+
+/// Fold the lines of one log past `previous`, or the whole log when
+/// `previous` no longer describes a prefix of it, and whether the checkpoint
+/// moved. `None` when the log is gone or a symlink, which full reads skip too.
+fn fold_log<F: EventFold>(
+    path: &Path,
+    previous: Option<LogCheckpoint<F>>,
+) -> Result<Option<(LogCheckpoint<F>, bool)>> {
+    match fs::symlink_metadata(path) {
+        Ok(metadata) if metadata.file_type().is_symlink() => return Ok(None),
+        Ok(_) => {}
+        Err(error) if error.kind() == ErrorKind::NotFound => return Ok(None),
+        Err(error) => {
+            return Err(error).with_context(|| format!("failed to inspect {}", path.display()));
+        }
+    }
+    let mut file = match File::open(path) {
+        Ok(file) => file,
+        Err(error) if error.kind() == ErrorKind::NotFound => return Ok(None),
+        Err(error) => {
+            return Err(error).with_context(|| format!("failed to read {}", path.display()));
+        }
+    };
+    let metadata = file
+        .metadata()
+        .with_context(|| format!("failed to inspect {}", path.display()))?;
+    let inode = file_identity(&metadata);
+    let (mut checkpoint, mut changed) = match previous {
+        Some(previous)
+            if previous.inode == inode && resumes(&mut file, metadata.len(), &previous)? =>
+        {
+            (previous, false)
+        }
+        _ => (
+            LogCheckpoint {
+                inode,
+                offset: 0,
+                tail: Vec::new(),
+                state: F::default(),
+            },
+            true,
+        ),
+    };
+    file.seek(SeekFrom::Start(checkpoint.offset))
+        .with_context(|| format!("failed to read {}", path.display()))?;
+
+    let fallback_session_id = logical_session_id_from_run_path(path);
+    let mut reader = BufReader::new(file);
+    let mut line = Vec::new();
+    loop {
+        line.clear();
+        let bytes_read = reader
+            .read_until(b'\n', &mut line)
+            .with_context(|| format!("failed to read {}", path.display()))?;
+        if bytes_read == 0 || !line.ends_with(b"\n") {
+            break;
+        }
+        checkpoint.offset += bytes_read as u64;
+        changed = true;
+        push_tail(&mut checkpoint.tail, &line);
+        line.pop();
+        if line.is_empty() {
+            continue;
+        }
+        let Ok(raw_line) = std::str::from_utf8(&line) else {
+            continue;
+        };
+        let Ok(event) = serde_json::from_str::<EventLine>(raw_line) else {
+            continue;
+        };
+        let session_id = event.session_id().unwrap_or(&fallback_session_id);
+        checkpoint.state.observe(session_id, &event);
+    }
+    Ok(Some((checkpoint, changed)))
+}
+
+/// Whether `checkpoint` still covers a prefix of the open log: the log is at
+/// least that long and its bytes before the offset are the ones folded.
+fn resumes<F>(file: &mut File, len: u64, checkpoint: &LogCheckpoint<F>) -> Result<bool> {
+    if checkpoint.offset > len || checkpoint.tail.len() as u64 > checkpoint.offset {
+        return Ok(false);
+    }
+    let mut tail = vec![0; checkpoint.tail.len()];
+    file.seek(SeekFrom::Start(checkpoint.offset - tail.len() as u64))?;
+    file.read_exact(&mut tail)?;
+    Ok(tail == checkpoint.tail)
+}
+
+fn push_tail(tail: &mut Vec<u8>, consumed: &[u8]) {
+    let keep = consumed.len().min(TAIL_BYTES);
+    tail.extend_from_slice(&consumed[consumed.len() - keep..]);
+    let excess = tail.len().saturating_sub(TAIL_BYTES);
+    tail.drain(..excess);
+}
+
+#[cfg(all(test, unix))]
+mod tests {
+    use std::path::PathBuf;
+    use std::time::{SystemTime, UNIX_EPOCH};
+
+    use super::*;
+
+    /// Every folded line as `session:event_type`, in order.
+    #[derive(Debug, Default, Deserialize, PartialEq, Serialize)]
+    struct Lines(Vec<String>);
+
+    impl EventFold for Lines {
+        const NAME: &'static str = "test-lines.v1";
+
+        fn observe(&mut self, session_id: &str, event: &EventLine<'_>) {
+            self.0.push(format!(
+                "{session_id}:{}",
+                event.event_type().unwrap_or("-")
+            ));
+        }
+    }
+
+    fn full_rescan(paths: &MaestroPaths) -> Vec<Lines> {
+        let _ = fs::remove_dir_all(paths.run_checkpoints_dir());
+        fold_managed_logs(paths).expect("full rescan folds")
+    }
+
+    fn append(path: &Path, text: &str) {
+        use std::io::Write;
+        fs::OpenOptions::new()
+            .append(true)
+            .open(path)
+            .and_then(|mut file| file.write_all(text.as_bytes()))
+            .expect("invariant: event log should be appendable");
+    }
+
+    #[test]
+    fn resumed_folds_equal_a_full_rescan_across_appends_and_rewrites() {
+        let temp = TestTempDir::new("maestro-run-checkpoint");
+        let paths = MaestroPaths::new(temp.path().to_path_buf());
+        let log = paths.runs_dir().join("session-a/events.jsonl");
+        fs::create_dir_all(log.parent().unwrap()).expect("invariant: run dir is creatable");
+        fs::write(
+            &log,
+            "{\"event_type\":\"Start\"}\nnot json\n{\"event_type\":\"Half\"",
+        )
+        .expect("invariant: event log is writable");
+
+        let first: Vec<Lines> = fold_managed_logs(&paths).expect("first fold");
+        assert_eq!(first, vec![Lines(vec!["session-a:Start".to_string()])]);
+
+        append(
+            &log,
+            ",\"session_id\":\"s2\"}\n\n{\"event_type\":\"Stop\"}\n",
+        );
+        let resumed: Vec<Lines> = fold_managed_logs(&paths).expect("resumed fold");
+        assert_eq!(resumed, full_rescan(&paths));
+        assert_eq!(resumed[0].0.len(), 3);
+
+        // Rewritten in place to the same length: the tail check forces a rescan.
+        let rewritten = fs::read_to_string(&log).unwrap().replace("Stop", "Done");
+        fs::write(&log, rewritten).expect("invariant: event log is writable");
+        let resumed: Vec<Lines> = fold_managed_logs(&paths).expect("rewritten fold");
+        assert_eq!(resumed, full_rescan(&paths));
+        assert_eq!(resumed[0].0[2], "session-a:Done");
+
+        // Truncated below the checkpoint: rescanned from byte 0.
+        fs::write(&log, "{\"event_type\":\"Fresh\"}\n").expect("invariant: writable");
+        let resumed: Vec<Lines> = fold_managed_logs(&paths).expect("truncated fold");
+        assert_eq!(resumed, full_rescan(&paths));
+        assert_eq!(resumed, vec![Lines(vec!["session-a:Fresh".to_string()])]);
+    }
+
+    struct TestTempDir {
+        path: PathBuf,
+    }
+
+    impl TestTempDir {
+        fn new(prefix: &str) -> Self {
+            let nanos = SystemTime::now()
+                .duration_since(UNIX_EPOCH)
+                .expect("invariant: system clock should be after the Unix epoch")
+                .as_nanos();
+            let path =
+                std::env::temp_dir().join(format!("{prefix}-{}-{nanos}", std::process::id()));
+            fs::create_dir_all(&path).expect("invariant: temp dir should be creatable");
+            Self { path }
+        }
+
+        fn path(&self) -> &Path {
+            &self.path
+        }
+    }
+
+    impl Drop for TestTempDir {
+        fn drop(&mut self) {
+            let _ = fs::remove_dir_all(&self.path);
+        }
+    }
+}
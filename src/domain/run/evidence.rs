@@ -1,6 +1,7 @@
 use std::collections::BTreeMap;
 use std::fs::{self, File};
 use std::io::BufReader;
+use std::path::Path;
 
 use anyhow::{Context, Result};
 use serde::{Deserialize, Serialize};
@@ -84,23 +85,23 @@ pub fn load_run_evidence(paths: &MaestroPaths) -> Result<RunEvidenceLoad> {
     let mut records = Vec::new();
     let mut skipped = 0;
     for path in managed_run_evidence_files(paths)? {
-        let Ok(raw) = fs::read_to_string(&path) else {
-            skipped += 1;
-            continue;
-        };
-        let Ok(record) = serde_yaml::from_str::<RunEvidenceRecord>(&raw) else {
-            skipped += 1;
-            continue;
-        };
-        if classify(&record.schema_version, RUN_EVIDENCE_SCHEMA_VERSION) == Compat::Exact {
-            records.push(record);
-        } else {
-            skipped += 1;
+        match read_run_evidence_file(&path) {
+            Some(record) => records.push(record),
+            None => skipped += 1,
         }
     }
     Ok(RunEvidenceLoad { records, skipped })
 }
 
+/// Read one `run_evidence.yaml`; `None` when it is unreadable, malformed, or
+/// on another schema (what [`load_run_evidence`] counts as skipped).
+pub(crate) fn read_run_evidence_file(path: &Path) -> Option<RunEvidenceRecord> {
+    let raw = fs::read_to_string(path).ok()?;
+    let record = serde_yaml::from_str::<RunEvidenceRecord>(&raw).ok()?;
+    (classify(&record.schema_version, RUN_EVIDENCE_SCHEMA_VERSION) == Compat::Exact)
+        .then_some(record)
+}
+
 struct RunEvidenceBuilder {
     session_id: String,
     agent: Option<String>,
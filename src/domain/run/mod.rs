@@ -4,6 +4,7 @@ mod active;
 mod activity;
 mod append;
 mod autonomy;
+mod checkpoint;
 mod discovery;
 mod event;
 mod evidence;
@@ -22,14 +23,18 @@ pub(crate) use append::{
     append_jsonl_line, append_manual_event, insert_agent_runtime, open_managed_appendable,
 };
 pub use autonomy::{AutonomyActionRow, AutonomyReport, assemble_autonomy_report};
+pub(crate) use checkpoint::{EventFold, fold_managed_logs};
+pub(crate) use discovery::managed_run_evidence_files;
 pub use discovery::{RunEventLog, managed_event_logs};
 #[cfg(test)]
 pub(crate) use event::is_accepted_event;
 pub(crate) use event::run_dir_name;
 pub use event::{HookEventContract, hook_event_contract};
+pub(crate) use evidence::read_run_evidence_file;
 pub use evidence::{
     RunEvidenceLoad, RunEvidenceRecord, load_run_evidence, write_evidence_for_session,
 };
+pub(crate) use reader::EventLine;
 pub use reader::{RunEvent, RunEventRecord, visit_managed_event_logs, visit_managed_events};
 pub(crate) use record::{RecordOutcome, record_hook_event};
 pub use session::{
@@ -1,8 +1,11 @@
+use std::borrow::Cow;
+use std::fmt;
 use std::fs::{self, File};
 use std::io::{BufRead, BufReader, ErrorKind};
 use std::path::Path;
 
 use anyhow::{Context, Result};
+use serde::de::{self, Deserialize, Deserializer, IgnoredAny, MapAccess, SeqAccess, Visitor};
 use serde_json::Value;
 
 use crate::foundation::core::paths::MaestroPaths;
@@ -215,6 +218,237 @@ impl RunEvent {
     }
 }
 
+/// Borrowed, typed view of the event fields the checkpointed run folds read.
+///
+/// Decodes a line without building a `Value` map: string fields borrow from
+/// the line unless they carry escapes, and every other key is skipped. A
+/// field holding a non-string reads as absent and a repeated key keeps its
+/// last value, matching the [`RunEvent`] accessors.
+#[derive(Debug, Default)]
+pub(crate) struct EventLine<'a> {
+    ts: Option<Cow<'a, str>>,
+    event_type: Option<Cow<'a, str>>,
+    kind: Option<Cow<'a, str>>,
+    event: Option<Cow<'a, str>>,
+    type_: Option<Cow<'a, str>>,
+    session_id: Option<Cow<'a, str>>,
+    agent_runtime: Option<Cow<'a, str>>,
+    skill_name: Option<Cow<'a, str>>,
+    card_id: Option<Cow<'a, str>>,
+    status: Option<Cow<'a, str>>,
+    tool_name: Option<Cow<'a, str>>,
+    file_path: Option<Cow<'a, str>>,
+    note: Option<Cow<'a, str>>,
+    topic: Option<Cow<'a, str>>,
+    message: Option<Cow<'a, str>>,
+    prompt: Option<Cow<'a, str>>,
+    text: Option<Cow<'a, str>>,
+}
+
+impl EventLine<'_> {
+    /// See [`RunEvent::timestamp`].
+    pub(crate) fn timestamp(&self) -> Option<&str> {
+        self.ts.as_deref()
+    }
+
+    /// See [`RunEvent::event_type`].
+    pub(crate) fn event_type(&self) -> Option<&str> {
+        self.event_type.as_deref()
+    }
+
+    /// See [`RunEvent::alias_kind`].
+    pub(crate) fn alias_kind(&self) -> Option<&str> {
+        self.kind
+            .as_deref()
+            .or(self.event.as_deref())
+            .or(self.type_.as_deref())
+    }
+
+    /// See [`RunEvent::session_id`].
+    pub(crate) fn session_id(&self) -> Option<&str> {
+        self.session_id.as_deref()
+    }
+
+    /// See [`RunEvent::agent_runtime`].
+    pub(crate) fn agent_runtime(&self) -> Option<&'static str> {
+        self.agent_runtime.as_deref().and_then(known_agent_runtime)
+    }
+
+    /// See [`RunEvent::skill_name`].
+    pub(crate) fn skill_name(&self) -> Option<&str> {
+        self.skill_name.as_deref()
+    }
+
+    /// See [`RunEvent::card_id`].
+    pub(crate) fn card_id(&self) -> Option<&str> {
+        self.card_id.as_deref()
+    }
+
+    /// See [`RunEvent::status`].
+    pub(crate) fn status(&self) -> Option<&str> {
+        self.status.as_deref()
+    }
+
+    /// See [`RunEvent::tool_name`].
+    pub(crate) fn tool_name(&self) -> Option<&str> {
+        self.tool_name.as_deref()
+    }
+
+    /// See [`RunEvent::file_path`].
+    pub(crate) fn file_path(&self) -> Option<&str> {
+        self.file_path.as_deref()
+    }
+
+    /// See [`RunEvent::intervention_note`].
+    pub(crate) fn intervention_note(&self) -> Option<&str> {
+        self.note.as_deref()
+    }
+
+    /// See [`RunEvent::topic`].
+    pub(crate) fn topic(&self) -> Option<&str> {
+        self.topic.as_deref()
+    }
+
+    /// See [`RunEvent::prompt_text`].
+    pub(crate) fn prompt_text(&self) -> Option<&str> {
+        self.message
+            .as_deref()
+            .or(self.prompt.as_deref())
+            .or(self.text.as_deref())
+    }
+
+    /// See [`RunEvent::is_event_type`].
+    pub(crate) fn is_event_type(&self, event_type: &str) -> bool {
+        self.event_type() == Some(event_type)
+    }
+}
+
+impl<'de> Deserialize<'de> for EventLine<'de> {
+    fn deserialize<D>(deserializer: D) -> std::result::Result<Self, D::Error>
+    where
+        D: Deserializer<'de>,
+    {
+        deserializer.deserialize_map(EventLineVisitor)
+    }
+}
+
+struct EventLineVisitor;
+
+impl<'de> Visitor<'de> for EventLineVisitor {
+    type Value = EventLine<'de>;
+
+    fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+        formatter.write_str("a run event object")
+    }
+
+    fn visit_map<A>(self, mut map: A) -> std::result::Result<Self::Value, A::Error>
+    where
+        A: MapAccess<'de>,
+    {
+        let mut line = EventLine::default();
+        while let Some(LooseStr(key)) = map.next_key::<LooseStr<'de>>()? {
+            let slot = match key.as_deref().unwrap_or_default() {
+                "ts" => &mut line.ts,
+                "event_type" => &mut line.event_type,
+                "kind" => &mut line.kind,
+                "event" => &mut line.event,
+                "type" => &mut line.type_,
+                "session_id" => &mut line.session_id,
+                "agent_runtime" => &mut line.agent_runtime,
+                "skill_name" => &mut line.skill_name,
+                "card_id" => &mut line.card_id,
+                "status" => &mut line.status,
+                "tool_name" => &mut line.tool_name,
+                "file_path" => &mut line.file_path,
+                "note" => &mut line.note,
+                "topic" => &mut line.topic,
+                "message" => &mut line.message,
+                "prompt" => &mut line.prompt,
+                "text" => &mut line.text,
+                _ => {
+                    map.next_value::<IgnoredAny>()?;
+                    continue;
+                }
+            };
+            *slot = map.next_value::<LooseStr<'de>>()?.0;
+        }
+        Ok(line)
+    }
+}
+
+/// Any JSON value, kept only when it is a string.
+struct LooseStr<'a>(Option<Cow<'a, str>>);
+
+impl<'de> Deserialize<'de> for LooseStr<'de> {
+    fn deserialize<D>(deserializer: D) -> std::result::Result<Self, D::Error>
+    where
+        D: Deserializer<'de>,
+    {
+        deserializer.deserialize_any(LooseStrVisitor)
+    }
+}
+
+struct LooseStrVisitor;
+
+impl<'de> Visitor<'de> for LooseStrVisitor {
+    type Value = LooseStr<'de>;
+
+    fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+        formatter.write_str("any JSON value")
+    }
+
+    fn visit_borrowed_str<E: de::Error>(
+        self,
+        value: &'de str,
+    ) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(Some(Cow::Borrowed(value))))
+    }
+
+    fn visit_str<E: de::Error>(self, value: &str) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(Some(Cow::Owned(value.to_string()))))
+    }
+
+    fn visit_string<E: de::Error>(self, value: String) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(Some(Cow::Owned(value))))
+    }
+
+    fn visit_bool<E: de::Error>(self, _: bool) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(None))
+    }
+
+    fn visit_i64<E: de::Error>(self, _: i64) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(None))
+    }
+
+    fn visit_u64<E: de::Error>(self, _: u64) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(None))
+    }
+
+    fn visit_f64<E: de::Error>(self, _: f64) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(None))
+    }
+
+    fn visit_unit<E: de::Error>(self) -> std::result::Result<Self::Value, E> {
+        Ok(LooseStr(None))
+    }
+
+    fn visit_seq<A>(self, mut seq: A) -> std::result::Result<Self::Value, A::Error>
+    where
+        A: SeqAccess<'de>,
+    {
+        while seq.next_element::<IgnoredAny>()?.is_some() {}
+        Ok(LooseStr(None))
+    }
+
+    fn visit_map<A>(self, mut map: A) -> std::result::Result<Self::Value, A::Error>
+    where
+        A: MapAccess<'de>,
+    {
+        while map.next_entry::<IgnoredAny, IgnoredAny>()?.is_some() {}
+        Ok(LooseStr(None))
+    }
+}
+
 /// Parsed event line from a managed run event log.
 #[derive(Debug)]
 pub struct RunEventRecord<'a> {
@@ -377,6 +611,24 @@ mod tests {
         assert_eq!(tools, vec![Some("Bash".to_string())]);
     }
 
+    #[test]
+    fn event_line_reads_the_same_fields_as_the_value_model() {
+        let raw = r#"{"ts":"2026-06-14T12:00:00Z","event_type":"Post\u0054oolUse","tool_name":7,"kind":null,"event":"proof","card_id":"a","card_id":"b","tool_input":{"file_path":"x"},"message":["m"],"prompt":"p"}"#;
+        let line: EventLine = serde_json::from_str(raw).expect("event line decodes");
+        let event = RunEvent::from_value(serde_json::from_str(raw).expect("value decodes"));
+        assert_eq!(line.timestamp(), event.timestamp());
+        assert_eq!(line.event_type(), Some("PostToolUse"));
+        assert_eq!(line.event_type(), event.event_type());
+        assert_eq!(line.tool_name(), event.tool_name());
+        assert_eq!(line.alias_kind(), event.alias_kind());
+        assert_eq!(line.card_id(), Some("b"));
+        assert_eq!(line.card_id(), event.card_id());
+        assert_eq!(line.file_path(), event.file_path());
+        assert_eq!(line.prompt_text(), event.prompt_text());
+        assert!(matches!(line.ts, Some(Cow::Borrowed(_))));
+        assert!(serde_json::from_str::<EventLine>("[1]").is_err());
+    }
+
     struct TestTempDir {
         path: PathBuf,
     }
@@ -1,16 +1,18 @@
 use std::collections::{BTreeMap, BTreeSet};
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use std::time::UNIX_EPOCH;
 
 use anyhow::{Context, Result, bail};
 use serde::{Deserialize, Serialize};
 
-use crate::domain::card::query::{self as card_query, body_of};
+use crate::domain::card::live_db;
+use crate::domain::card::query::{self as card_query, RecordSource, body_of};
 use crate::domain::card::schema::{Card, CardType};
-use crate::domain::card::store::is_dir_backed;
+use crate::domain::card::store::{is_dir_backed, load, load_entries};
 use crate::domain::run;
 use crate::domain::search::intent;
 use crate::domain::search::lock;
+use crate::domain::search::memory_index::{MemoryIndex, TermLookup};
 use crate::domain::search::query::{self, ParsedQuery};
 use crate::domain::search::types::{
     GrepEnvelope, MatchSpan, ScoreReason, SearchCorpus, SearchDiagnostic, SearchDocument,
@@ -19,9 +21,10 @@ use crate::domain::search::types::{
 use crate::domain::task;
 use crate::foundation::core::fs::ensure_dir;
 use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
 use crate::foundation::core::safe_write::{write_atomic, write_string_atomic};
 
-const MEMORY_SHARD_SCHEMA_VERSION: &str = "maestro.memory-shard.v2";
+const MEMORY_SHARD_SCHEMA_VERSION: &str = "maestro.memory-shard.v4";
 const SEARCH_MANIFEST_SCHEMA_VERSION: &str = "maestro.search-manifest.v1";
 const MEMORY_SHARD_MAGIC: &[u8] = b"MAESTRO_MEMORY_SHARD_V1\n";
 
@@ -31,6 +34,8 @@ pub struct MemoryRebuildReport {
     pub live_docs: usize,
     pub archived_docs: usize,
     pub run_evidence_docs: usize,
+    pub reused_docs: usize,
+    pub rebuilt_docs: usize,
 }
 
 struct LoadedMemoryShard {
@@ -44,15 +49,33 @@ struct MemoryShard {
     schema_version: String,
     manifest: Vec<ManifestEntry>,
     docs: Vec<SearchDocument>,
+    /// Which manifest files each reusable group of docs was derived from.
+    units: Vec<SourceUnit>,
+    index: MemoryIndex,
 }
 
-#[derive(Debug, Deserialize, PartialEq, Eq, PartialOrd, Ord, Serialize)]
+#[derive(Clone, Debug, Deserialize, PartialEq, Eq, PartialOrd, Ord, Serialize)]
 struct ManifestEntry {
     path: String,
     mtime_ns: u64,
     len: u64,
 }
 
+/// The docs one source produced -- a card record with its sidecars, a
+/// container entry file, the archive DB, one run evidence file -- keyed by
+/// the manifest entries they were read from. A rebuild reuses them verbatim
+/// while those entries are unchanged.
+#[derive(Debug, Deserialize, Serialize)]
+struct SourceUnit {
+    source: String,
+    deps: Vec<ManifestEntry>,
+    /// Positions in `docs`.
+    docs: Vec<u32>,
+    /// Some card of the source was shadowed by a DB-backed card of the same
+    /// id and is absent from `docs`, so the unit cannot be reused.
+    shadowed: bool,
+}
+
 #[derive(Debug, Serialize)]
 struct SearchManifest {
     schema_version: String,
@@ -65,42 +88,239 @@ pub fn rebuild_memory(paths: &MaestroPaths) -> Result<MemoryRebuildReport> {
     rebuild_memory_unlocked(paths)
 }
 
+/// Rebuild the memory shard, re-deriving only the sources whose manifest
+/// entries moved since the previous shard; DB-backed live cards and progress
+/// tasks sit outside the manifest and are always re-derived.
 pub(crate) fn rebuild_memory_unlocked(paths: &MaestroPaths) -> Result<MemoryRebuildReport> {
-    let live = card_query::scan_with_paths(paths)?;
-    let archived = card_query::scan_archived_with_paths(paths)?;
-    let run_evidence = run::load_run_evidence(paths)?;
-
-    let mut docs = Vec::new();
-    for (card, path) in &live {
-        docs.push(document_for_card(Some(paths), card, path, false)?);
+    let manifest = manifest(paths)?;
+    let mut reusable = ReusableDocs::from_previous(paths);
+    let mut build = ShardBuild::new(&manifest, paths.maestro_dir());
+
+    let mut live = Vec::new();
+    for source in card_query::record_sources(&paths.cards_dir())? {
+        let docs = build.unit(&mut reusable, source.path(), &record_deps(&source), || {
+            let (cards, path) = match &source {
+                RecordSource::Record(yaml) => (load(yaml)?.into_iter().collect(), yaml),
+                RecordSource::Entries(file) => (load_entries(file)?.cards, file),
+            };
+            cards
+                .iter()
+                .map(|card| document_for_card(Some(paths), card, path, false))
+                .collect::<Result<Vec<_>>>()
+        })?;
+        live.extend(docs);
     }
-    for (card, path) in &archived {
-        docs.push(document_for_card(Some(paths), card, path, true)?);
+    // DB-backed cards shadow tree cards of the same id (`merge_db_cards`).
+    let db_cards = live_db::scan(paths)?;
+    let db_ids: BTreeSet<&str> = db_cards.iter().map(|(card, _)| card.id.as_str()).collect();
+    live.retain(|(unit, doc)| {
+        let shadowed = db_ids.contains(doc.id.as_str());
+        if shadowed && let Some(unit) = unit {
+            build.units[*unit].shadowed = true;
+        }
+        !shadowed
+    });
+    for (card, path) in &db_cards {
+        live.push((None, document_for_card(Some(paths), card, path, false)?));
+        build.rebuilt += 1;
     }
+    live.sort_by(|a, b| a.1.id.cmp(&b.1.id));
+    let live_docs = live.len();
+
+    let archive_db = crate::domain::card::archive_db::archive_db_file(paths);
+    let archived = build.unit(&mut reusable, &archive_db, &[archive_db.clone()], || {
+        card_query::scan_archived_with_paths(paths)?
+            .iter()
+            .map(|(card, path)| document_for_card(Some(paths), card, path, true))
+            .collect()
+    })?;
+    let archived_docs = archived.len();
+
+    let mut progress = Vec::new();
     for entry in task::load_progress_task_entries(paths)? {
-        docs.push(document_for_progress_task(&entry.task, &entry.task_dir)?);
+        progress.push((
+            None,
+            document_for_progress_task(&entry.task, &entry.task_dir, paths.repo_root())?,
+        ));
+        build.rebuilt += 1;
     }
-    for record in &run_evidence.records {
-        docs.push(document_for_run_evidence(record));
+
+    let mut run_evidence = Vec::new();
+    for file in run::managed_run_evidence_files(paths)? {
+        let docs = build.unit(&mut reusable, &file, &[file.clone()], || {
+            Ok(run::read_run_evidence_file(&file)
+                .iter()
+                .map(document_for_run_evidence)
+                .collect())
+        })?;
+        run_evidence.extend(docs);
     }
+    let run_evidence_docs = run_evidence.len();
 
-    let shard = MemoryShard {
-        schema_version: MEMORY_SHARD_SCHEMA_VERSION.to_string(),
-        manifest: manifest(paths)?,
-        docs,
-    };
+    let (reused_docs, rebuilt_docs) = (build.reused, build.rebuilt);
+    let shard = build.finish(
+        MEMORY_SHARD_SCHEMA_VERSION,
+        manifest,
+        [live, archived, progress, run_evidence].concat(),
+    );
     ensure_dir(paths.search_index_dir())?;
     write_atomic(paths.memory_shard_file(), &encode_shard(&shard)?)?;
     write_search_manifest(paths, shard.docs.len())?;
 
     Ok(MemoryRebuildReport {
         docs: shard.docs.len(),
-        live_docs: live.len(),
-        archived_docs: archived.len(),
-        run_evidence_docs: run_evidence.records.len(),
+        live_docs,
+        archived_docs,
+        run_evidence_docs,
+        reused_docs,
+        rebuilt_docs,
     })
 }
 
+/// The previous shard's docs grouped by source unit, for reuse.
+struct ReusableDocs {
+    units: BTreeMap<String, (Vec<ManifestEntry>, Vec<SearchDocument>)>,
+}
+
+impl ReusableDocs {
+    /// Any previous shard that still decodes on the current schema; a missing,
+    /// corrupt, or older shard just means nothing is reused.
+    fn from_previous(paths: &MaestroPaths) -> Self {
+        let mut units = BTreeMap::new();
+        let previous = std::fs::read(paths.memory_shard_file())
+            .ok()
+            .and_then(|bytes| decode_shard(&bytes).ok())
+            .filter(|shard| shard.schema_version == MEMORY_SHARD_SCHEMA_VERSION);
+        if let Some(shard) = previous {
+            let mut docs: Vec<Option<SearchDocument>> = shard.docs.into_iter().map(Some).collect();
+            for unit in shard.units.into_iter().filter(|unit| !unit.shadowed) {
+                let unit_docs: Vec<SearchDocument> = unit
+                    .docs
+                    .iter()
+                    .filter_map(|idx| docs.get_mut(*idx as usize).and_then(Option::take))
+                    .collect();
+                if unit_docs.len() == unit.docs.len() {
+                    units.insert(unit.source, (unit.deps, unit_docs));
+                }
+            }
+        }
+        Self { units }
+    }
+
+    fn take(&mut self, source: &str, deps: &[ManifestEntry]) -> Option<Vec<SearchDocument>> {
+        let (previous_deps, docs) = self.units.remove(source)?;
+        (previous_deps == deps).then_some(docs)
+    }
+}
+
+/// A shard under construction: its units, and how many docs were reused
+/// versus re-derived.
+struct ShardBuild {
+    entries: BTreeMap<String, ManifestEntry>,
+    base: PathBuf,
+    units: Vec<SourceUnit>,
+    reused: usize,
+    rebuilt: usize,
+}
+
+impl ShardBuild {
+    fn new(manifest: &[ManifestEntry], base: PathBuf) -> Self {
+        Self {
+            entries: manifest
+                .iter()
+                .map(|entry| (entry.path.clone(), entry.clone()))
+                .collect(),
+            base,
+            units: Vec::new(),
+            reused: 0,
+            rebuilt: 0,
+        }
+    }
+
+    /// The docs of one source: reused when every file in `dep_files` carries
+    /// the manifest entry it had last time, else derived by `derive`. A
+    /// source outside the manifest (absent, or not a regular file) is always
+    /// derived and not recorded as a unit.
+    fn unit(
+        &mut self,
+        reusable: &mut ReusableDocs,
+        source: &Path,
+        dep_files: &[PathBuf],
+        derive: impl FnOnce() -> Result<Vec<SearchDocument>>,
+    ) -> Result<Vec<(Option<usize>, SearchDocument)>> {
+        let key = relative_label(source, &self.base);
+        if !self.entries.contains_key(key.as_str()) {
+            let docs = derive()?;
+            self.rebuilt += docs.len();
+            return Ok(docs.into_iter().map(|doc| (None, doc)).collect());
+        }
+        let deps: Vec<ManifestEntry> = dep_files
+            .iter()
+            .filter_map(|file| self.entries.get(relative_label(file, &self.base).as_str()))
+            .cloned()
+            .collect();
+        let docs = match reusable.take(&key, &deps) {
+            Some(docs) => {
+                self.reused += docs.len();
+                docs
+            }
+            None => {
+                let docs = derive()?;
+                self.rebuilt += docs.len();
+                docs
+            }
+        };
+        let unit = self.units.len();
+        self.units.push(SourceUnit {
+            source: key,
+            deps,
+            docs: Vec::new(),
+            shadowed: false,
+        });
+        Ok(docs.into_iter().map(|doc| (Some(unit), doc)).collect())
+    }
+
+    /// Number the final doc order into the units and index the corpus.
+    fn finish(
+        mut self,
+        schema_version: &str,
+        manifest: Vec<ManifestEntry>,
+        ordered: Vec<(Option<usize>, SearchDocument)>,
+    ) -> MemoryShard {
+        let mut docs = Vec::with_capacity(ordered.len());
+        for (position, (unit, doc)) in ordered.into_iter().enumerate() {
+            if let Some(unit) = unit {
+                self.units[unit].docs.push(position as u32);
+            }
+            docs.push(doc);
+        }
+        MemoryShard {
+            schema_version: schema_version.to_string(),
+            manifest,
+            index: MemoryIndex::build(&docs),
+            docs,
+            units: self.units,
+        }
+    }
+}
+
+/// The files a card source's docs read: a dir-backed record pulls its
+/// sibling grep sidecars in too; a container entry file only itself.
+fn record_deps(source: &RecordSource) -> Vec<PathBuf> {
+    match source {
+        RecordSource::Record(yaml) => yaml
+            .parent()
+            .map(|dir| {
+                card_query::GREP_SIDECARS
+                    .iter()
+                    .map(|sidecar| dir.join(sidecar))
+                    .collect()
+            })
+            .unwrap_or_default(),
+        RecordSource::Entries(file) => vec![file.clone()],
+    }
+}
+
 pub fn grep_memory(paths: &MaestroPaths, raw_query: &str) -> GrepEnvelope {
     let parsed = match query::parse(raw_query) {
         Ok(parsed) => parsed,
@@ -116,12 +336,18 @@ pub fn card_list_grep_candidates(paths: &MaestroPaths, term: &str) -> Option<BTr
 
     let needle = term.to_lowercase();
     let loaded = load_for_query(paths).ok()?;
+    let shard = &loaded.shard;
+    let docs: Box<dyn Iterator<Item = &SearchDocument>> = match shard.index.lookup(&needle) {
+        Some(lookup) => Box::new(
+            lookup
+                .docs()
+                .iter()
+                .filter_map(|idx| shard.docs.get(*idx as usize)),
+        ),
+        None => Box::new(shard.docs.iter()),
+    };
     Some(
-        loaded
-            .shard
-            .docs
-            .iter()
-            .filter(|doc| doc.kind != "run_evidence")
+        docs.filter(|doc| doc.kind != "run_evidence")
             .filter(|doc| card_list_doc_contains(doc, &needle))
             .map(|doc| doc.id.clone())
             .collect(),
@@ -179,7 +405,10 @@ pub(crate) fn grep_memory_parsed(
             );
         }
     };
-    let hits = score_documents(&loaded.shard.docs, parsed);
+    let hits = {
+        let _phase = profile::phase("search.memory_match");
+        score_documents(&loaded.shard.docs, &loaded.shard.index, parsed)
+    };
     let mut envelope =
         GrepEnvelope::success(raw_query, hits, parsed.explicit_filter_overrides.clone())
             .with_freshness(vec![loaded.freshness]);
@@ -188,6 +417,7 @@ pub(crate) fn grep_memory_parsed(
 }
 
 fn load_for_query(paths: &MaestroPaths) -> Result<LoadedMemoryShard, SearchDiagnostic> {
+    let _phase = profile::phase("search.memory_shard");
     match load_fresh(paths) {
         Ok(shard) => Ok(LoadedMemoryShard {
             freshness: memory_freshness(&shard, false),
@@ -340,10 +570,10 @@ fn document_for_card(
         corpus: SearchCorpus::Memory,
         kind: kind.to_string(),
         title: card.title.clone(),
-        path: Some(relative_label(
-            path,
-            &std::env::current_dir().unwrap_or_default(),
-        )),
+        path: Some(match paths {
+            Some(paths) => relative_label(path, paths.repo_root()),
+            None => path.display().to_string(),
+        }),
         opener: Some(format!("maestro card show {}", card.id)),
         archived,
         feature: card
@@ -359,6 +589,7 @@ fn document_for_card(
 fn document_for_progress_task(
     task: &task::TaskRecord,
     progress_dir: &Path,
+    repo_root: &Path,
 ) -> Result<SearchDocument> {
     let mut fields = BTreeMap::new();
     fields.insert("status".to_string(), task.state.as_str().to_string());
@@ -396,7 +627,7 @@ fn document_for_progress_task(
         title: task.title.clone(),
         path: Some(relative_label(
             &progress_dir.join(task::PROGRESS_FILE),
-            &std::env::current_dir().unwrap_or_default(),
+            repo_root,
         )),
         opener: Some(format!("maestro task show {}", task.id)),
         archived: false,
@@ -460,13 +691,39 @@ fn memory_kind_for_card(card: &Card) -> &'static str {
     }
 }
 
-fn score_documents(docs: &[SearchDocument], parsed: &ParsedQuery) -> Vec<SearchHit> {
+fn score_documents(
+    docs: &[SearchDocument],
+    index: &MemoryIndex,
+    parsed: &ParsedQuery,
+) -> Vec<SearchHit> {
     let case_sensitive = query::literal_case_sensitive(parsed);
-    let mut hits: Vec<SearchHit> = docs
+    let required_terms = required_terms(parsed);
+    let lookups: Vec<Option<TermLookup>> = required_terms
         .iter()
-        .filter(|doc| filters_match(doc, parsed))
-        .filter_map(|doc| score_document(doc, parsed, case_sensitive))
+        .map(|term| index.lookup(term))
         .collect();
+    let scored = |(idx, doc): (usize, &SearchDocument)| {
+        if !filters_match(doc, parsed) {
+            return None;
+        }
+        score_document(
+            doc,
+            idx as u32,
+            parsed,
+            &required_terms,
+            &lookups,
+            case_sensitive,
+        )
+    };
+    let candidates = candidate_docs(docs, index, parsed, &required_terms, &lookups);
+    let mut hits: Vec<SearchHit> = match candidates {
+        Some(candidates) => candidates
+            .into_iter()
+            .filter_map(|idx| docs.get(idx as usize).map(|doc| (idx as usize, doc)))
+            .filter_map(scored)
+            .collect(),
+        None => docs.iter().enumerate().filter_map(scored).collect(),
+    };
     hits.sort_by(|a, b| {
         b.score
             .total_cmp(&a.score)
@@ -479,6 +736,48 @@ fn score_documents(docs: &[SearchDocument], parsed: &ParsedQuery) -> Vec<SearchH
     hits
 }
 
+/// The docs that can score at all: every doc holding each required term (or
+/// one of its domain aliases) per the index, plus every doc a term matches
+/// exactly by id, title, or path. `None` -- some required term has no token
+/// to look up, or there is none -- means every doc is a candidate.
+fn candidate_docs(
+    docs: &[SearchDocument],
+    index: &MemoryIndex,
+    parsed: &ParsedQuery,
+    required_terms: &[String],
+    lookups: &[Option<TermLookup>],
+) -> Option<BTreeSet<u32>> {
+    let mut candidates: Option<BTreeSet<u32>> = None;
+    for (term, lookup) in required_terms.iter().zip(lookups) {
+        let mut term_docs = lookup.as_ref()?.docs().clone();
+        for alias in aliases_for(term) {
+            if let Some(alias_lookup) = index.lookup(alias) {
+                term_docs.extend(alias_lookup.docs());
+            }
+        }
+        candidates = Some(match candidates {
+            Some(candidates) => candidates.intersection(&term_docs).copied().collect(),
+            None => term_docs,
+        });
+    }
+    let mut candidates = candidates?;
+    for (idx, doc) in docs.iter().enumerate() {
+        if parsed.terms.iter().any(|term| exact_doc_match(doc, term)) {
+            candidates.insert(idx as u32);
+        }
+    }
+    Some(candidates)
+}
+
+fn exact_doc_match(doc: &SearchDocument, term: &str) -> bool {
+    term.eq_ignore_ascii_case(&doc.id)
+        || term.eq_ignore_ascii_case(&doc.title)
+        || doc
+            .path
+            .as_deref()
+            .is_some_and(|path| path.eq_ignore_ascii_case(term))
+}
+
 fn filters_match(doc: &SearchDocument, parsed: &ParsedQuery) -> bool {
     if !parsed.filters.kinds.is_empty()
         && !parsed.filters.kinds.iter().any(|kind| kind == &doc.kind)
@@ -511,7 +810,10 @@ fn filters_match(doc: &SearchDocument, parsed: &ParsedQuery) -> bool {
 
 fn score_document(
     doc: &SearchDocument,
+    doc_idx: u32,
     parsed: &ParsedQuery,
+    required_terms: &[String],
+    lookups: &[Option<TermLookup>],
     case_sensitive: bool,
 ) -> Option<SearchHit> {
     if parsed
@@ -522,7 +824,6 @@ fn score_document(
         return None;
     }
 
-    let required_terms = required_terms(parsed);
     let mut score = 0.0;
     let mut reasons = Vec::new();
     let mut chosen_snippet = None;
@@ -588,7 +889,7 @@ fn score_document(
         }
     }
 
-    for term in &required_terms {
+    for (term, lookup) in required_terms.iter().zip(lookups) {
         if exact_terms
             .iter()
             .any(|exact| exact.eq_ignore_ascii_case(term))
@@ -596,8 +897,10 @@ fn score_document(
             continue;
         }
         if let Some(found) = best_segment_match(doc, term, case_sensitive) {
-            let weight = field_weight(&found.segment.field);
-            let value = bm25_like_value(term, &found.segment.text, weight);
+            let bm25 = lookup.as_ref().map_or(1.0, |lookup| {
+                lookup.bm25(doc_idx, found.segment_idx, &found.segment.field)
+            });
+            let value = field_weight(&found.segment.field) * bm25;
             score += value;
             if chosen_snippet.is_none() {
                 chosen_snippet = Some(snippet(&found.segment.text, found.start, found.end));
@@ -610,7 +913,7 @@ fn score_document(
             reasons.push(ScoreReason {
                 factor: "lexical".to_string(),
                 value,
-                detail: format!("BM25-like {} match", found.segment.field),
+                detail: format!("BM25 {} match", found.segment.field),
             });
         } else if let Some((alias, found)) = alias_match(doc, term, case_sensitive) {
             let value = 0.45 * field_weight(&found.segment.field);
@@ -637,7 +940,7 @@ fn score_document(
         return None;
     }
 
-    if !required_terms.is_empty() && proximity_match(doc, &required_terms, case_sensitive) {
+    if !required_terms.is_empty() && proximity_match(doc, required_terms, case_sensitive) {
         score += 0.35;
         reasons.push(ScoreReason {
             factor: "proximity".to_string(),
@@ -692,6 +995,7 @@ fn score_document(
 
 struct SegmentMatch<'a> {
     segment: &'a SearchSegment,
+    segment_idx: usize,
     start: usize,
     end: usize,
 }
@@ -704,12 +1008,6 @@ fn field_weight(field: &str) -> f64 {
     }
 }
 
-fn bm25_like_value(term: &str, text: &str, weight: f64) -> f64 {
-    let length_norm = 1.0 + (text.split_whitespace().count() as f64 / 180.0);
-    let term_weight = 1.0 + (term.chars().count().min(16) as f64 / 32.0);
-    (weight * term_weight) / length_norm
-}
-
 fn required_terms(parsed: &ParsedQuery) -> Vec<String> {
     parsed
         .terms
@@ -792,13 +1090,17 @@ fn best_segment_match<'a>(
     term: &str,
     case_sensitive: bool,
 ) -> Option<SegmentMatch<'a>> {
-    doc.segments.iter().find_map(|segment| {
-        find_term(&segment.text, term, case_sensitive).map(|(start, end)| SegmentMatch {
-            segment,
-            start,
-            end,
+    doc.segments
+        .iter()
+        .enumerate()
+        .find_map(|(segment_idx, segment)| {
+            find_term(&segment.text, term, case_sensitive).map(|(start, end)| SegmentMatch {
+                segment,
+                segment_idx,
+                start,
+                end,
+            })
         })
-    })
 }
 
 fn alias_match<'a>(
@@ -1049,7 +1351,8 @@ mod tests {
             }],
         };
         let parsed = query::parse("runtime type:decision corpus:memory").expect("query parses");
-        let hits = score_documents(&[doc], &parsed);
+        let docs = [doc];
+        let hits = score_documents(&docs, &MemoryIndex::build(&docs), &parsed);
         assert_eq!(hits.len(), 1);
         assert_eq!(hits[0].corpus, SearchCorpus::Memory);
         assert_eq!(hits[0].kind, "decision");
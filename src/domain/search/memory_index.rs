@@ -0,0 +1,293 @@
+//! The inverted index stored alongside the memory shard's documents: a folded
+//! token vocabulary with per-segment term frequencies, document frequencies,
+//! segment lengths, and per-field average lengths -- the corpus statistics
+//! real BM25 needs.
+//!
+//! Memory terms match as case-insensitive substrings, so the index is a
+//! candidate filter rather than an exact answer. Tokens are the maximal
+//! alphanumeric runs of the per-char lowercased text; every alphanumeric run
+//! of a query term therefore lies inside some indexed token of any segment the
+//! term occurs in, and [`MemoryIndex::lookup`] returns a superset of the
+//! matching documents that the scorer still confirms.
+
+use std::collections::{BTreeMap, BTreeSet};
+
+use serde::{Deserialize, Serialize};
+
+use crate::domain::search::types::SearchDocument;
+
+/// BM25 term-frequency saturation.
+const K1: f64 = 1.2;
+/// BM25 length normalization.
+const B: f64 = 0.75;
+
+#[derive(Debug, Default, Deserialize, Serialize)]
+pub(super) struct MemoryIndex {
+    doc_count: u32,
+    /// Token count of every segment, parallel to each document's segments.
+    segment_lengths: Vec<Vec<u32>>,
+    /// Mean segment token count per segment field across the corpus.
+    field_avg_lengths: BTreeMap<String, f64>,
+    /// The vocabulary, sorted by token.
+    terms: Vec<TermPostings>,
+}
+
+#[derive(Debug, Deserialize, Serialize)]
+struct TermPostings {
+    token: String,
+    /// Documents holding the token in any segment.
+    df: u32,
+    /// `(doc, segment, tf)`, sorted by doc then segment.
+    postings: Vec<(u32, u32, u32)>,
+}
+
+/// One query term resolved against the vocabulary.
+pub(super) struct TermLookup<'a> {
+    index: &'a MemoryIndex,
+    /// Per alphanumeric piece of the term, the tokens containing it.
+    pieces: Vec<Vec<&'a TermPostings>>,
+    docs: BTreeSet<u32>,
+}
+
+impl MemoryIndex {
+    pub(super) fn build(docs: &[SearchDocument]) -> Self {
+        let mut vocabulary: BTreeMap<String, Vec<(u32, u32, u32)>> = BTreeMap::new();
+        let mut segment_lengths = Vec::with_capacity(docs.len());
+        let mut field_totals: BTreeMap<&str, (u64, u64)> = BTreeMap::new();
+        for (doc_idx, doc) in docs.iter().enumerate() {
+            let mut lengths = Vec::with_capacity(doc.segments.len());
+            for (segment_idx, segment) in doc.segments.iter().enumerate() {
+                let segment_tokens = tokens(&segment.text);
+                lengths.push(segment_tokens.len() as u32);
+                let totals = field_totals.entry(segment.field.as_str()).or_default();
+                totals.0 += segment_tokens.len() as u64;
+                totals.1 += 1;
+                let mut counts: BTreeMap<String, u32> = BTreeMap::new();
+                for token in segment_tokens {
+                    *counts.entry(token).or_default() += 1;
+                }
+                for (token, tf) in counts {
+                    vocabulary.entry(token).or_default().push((
+                        doc_idx as u32,
+                        segment_idx as u32,
+                        tf,
+                    ));
+                }
+            }
+            segment_lengths.push(lengths);
+        }
+        let terms = vocabulary
+            .into_iter()
+            .map(|(token, postings)| {
+                let df = postings
+                    .iter()
+                    .map(|(doc, _, _)| doc)
+                    .collect::<BTreeSet<_>>()
+                    .len() as u32;
+                TermPostings {
+                    token,
+                    df,
+                    postings,
+                }
+            })
+            .collect();
+        let field_avg_lengths = field_totals
+            .into_iter()
+            .map(|(field, (tokens, segments))| {
+                (field.to_string(), tokens as f64 / segments.max(1) as f64)
+            })
+            .collect();
+        Self {
+            doc_count: docs.len() as u32,
+            segment_lengths,
+            field_avg_lengths,
+            terms,
+        }
+    }
+
+    /// Resolve `term` against the vocabulary, or `None` when it has no
+    /// alphanumeric piece to look up and so cannot narrow the corpus.
+    pub(super) fn lookup(&self, term: &str) -> Option<TermLookup<'_>> {
+        let pieces: Vec<Vec<&TermPostings>> = tokens(term)
+            .iter()
+            .map(|piece| self.tokens_containing(piece))
+            .collect();
+        if pieces.is_empty() {
+            return None;
+        }
+        let mut docs: Option<BTreeSet<u32>> = None;
+        for entries in &pieces {
+            let piece_docs: BTreeSet<u32> = entries
+                .iter()
+                .flat_map(|entry| entry.postings.iter().map(|(doc, _, _)| *doc))
+                .collect();
+            docs = Some(match docs {
+                Some(docs) => docs.intersection(&piece_docs).copied().collect(),
+                None => piece_docs,
+            });
+        }
+        Some(TermLookup {
+            index: self,
+            pieces,
+            docs: docs.unwrap_or_default(),
+        })
+    }
+
+    /// Every vocabulary token with `piece` as a substring: a scan of the
+    /// vocabulary, which is far smaller than the text it indexes.
+    fn tokens_containing(&self, piece: &str) -> Vec<&TermPostings> {
+        self.terms
+            .iter()
+            .filter(|entry| entry.token.contains(piece))
+            .collect()
+    }
+}
+
+impl TermLookup<'_> {
+    /// A superset of the documents the term occurs in.
+    pub(super) fn docs(&self) -> &BTreeSet<u32> {
+        &self.docs
+    }
+
+    /// The BM25 weight of the term in one segment of one document, scaled so
+    /// a single occurrence, in an average-length segment, of a term only one
+    /// document holds weighs 1.0: corpus-common terms and long segments weigh
+    /// less, repeated occurrences more (saturating at `K1 + 1`).
+    pub(super) fn bm25(&self, doc: u32, segment: usize, field: &str) -> f64 {
+        let tf = self
+            .pieces
+            .iter()
+            .map(|entries| {
+                entries
+                    .iter()
+                    .filter_map(|entry| {
+                        entry
+                            .postings
+                            .binary_search_by_key(&(doc, segment as u32), |(d, s, _)| (*d, *s))
+                            .ok()
+                            .map(|idx| entry.postings[idx].2)
+                    })
+                    .sum::<u32>()
+            })
+            .min()
+            .unwrap_or_default()
+            .max(1) as f64;
+        let segment_len = self
+            .index
+            .segment_lengths
+            .get(doc as usize)
+            .and_then(|lengths| lengths.get(segment))
+            .copied()
+            .unwrap_or_default() as f64;
+        let avg_len = self
+            .index
+            .field_avg_lengths
+            .get(field)
+            .copied()
+            .unwrap_or_default();
+        let length_ratio = if avg_len > 0.0 {
+            segment_len / avg_len
+        } else {
+            1.0
+        };
+        let df = match self.pieces.as_slice() {
+            [entries] if entries.len() == 1 => entries[0].df,
+            _ => self.docs.len() as u32,
+        };
+        let tf_factor = tf * (K1 + 1.0) / (tf + K1 * (1.0 - B + B * length_ratio));
+        let idf_factor =
+            (1.0 + idf(self.index.doc_count, df)) / (1.0 + idf(self.index.doc_count, 1));
+        tf_factor * idf_factor
+    }
+}
+
+/// BM25 inverse document frequency (the non-negative Lucene form).
+fn idf(doc_count: u32, df: u32) -> f64 {
+    let n = f64::from(doc_count);
+    let df = f64::from(df.max(1));
+    (1.0 + (n - df + 0.5) / (df + 0.5)).ln()
+}
+
+/// The maximal alphanumeric runs of `text`, lowercased per char with final
+/// sigma folded to `σ` so the whole-string and per-char lowercasings the
+/// scorer uses both land inside the same tokens.
+pub(super) fn tokens(text: &str) -> Vec<String> {
+    let mut tokens = Vec::new();
+    let mut current = String::new();
+    for ch in text
+        .chars()
+        .flat_map(char::to_lowercase)
+        .map(|ch| if ch == 'ς' { 'σ' } else { ch })
+    {
+        if ch.is_alphanumeric() {
+            current.push(ch);
+        } else if !current.is_empty() {
+            tokens.push(std::mem::take(&mut current));
+        }
+    }
+    if !current.is_empty() {
+        tokens.push(current);
+    }
+    tokens
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::domain::search::types::{SearchCorpus, SearchSegment};
+
+    fn doc(id: &str, segments: &[(&str, &str)]) -> SearchDocument {
+        SearchDocument {
+            id: id.to_string(),
+            corpus: SearchCorpus::Memory,
+            kind: "task".to_string(),
+            title: id.to_string(),
+            path: None,
+            opener: None,
+            archived: false,
+            feature: None,
+            parent: None,
+            fields: BTreeMap::new(),
+            segments: segments
+                .iter()
+                .map(|(field, text)| SearchSegment {
+                    id: field.to_string(),
+                    field: field.to_string(),
+                    text: text.to_string(),
+                })
+                .collect(),
+        }
+    }
+
+    #[test]
+    fn lookup_is_a_superset_of_substring_matches() {
+        let docs = vec![
+            doc(
+                "a",
+                &[("title", "Agent runtime"), ("body", "durable proof")],
+            ),
+            doc("b", &[("title", "Runtimes elsewhere")]),
+            doc("c", &[("title", "Unrelated")]),
+        ];
+        let index = MemoryIndex::build(&docs);
+        let runtime = index.lookup("RUNTIME").expect("term has a piece");
+        assert_eq!(runtime.docs(), &BTreeSet::from([0, 1]));
+        let phrase = index.lookup("agent-run").expect("term has pieces");
+        assert_eq!(phrase.docs(), &BTreeSet::from([0]));
+        assert!(index.lookup("--").is_none());
+    }
+
+    #[test]
+    fn bm25_prefers_rare_terms_and_repeated_short_segments() {
+        let docs = vec![
+            doc("a", &[("body", "cache cache shared")]),
+            doc("b", &[("body", "shared words and many more words here")]),
+            doc("c", &[("body", "shared")]),
+        ];
+        let index = MemoryIndex::build(&docs);
+        let cache = index.lookup("cache").expect("cache resolves");
+        let shared = index.lookup("shared").expect("shared resolves");
+        assert!(cache.bm25(0, 0, "body") > shared.bm25(0, 0, "body"));
+        assert!(shared.bm25(2, 0, "body") > shared.bm25(1, 0, "body"));
+    }
+}
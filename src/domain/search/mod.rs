@@ -3,9 +3,11 @@
 mod intent;
 mod lock;
 pub mod memory;
+mod memory_index;
 mod outline;
 pub mod query;
 pub mod source;
+mod source_shard;
 pub mod types;
 
 pub use lock::{SearchWriterLock, acquire_writer};
@@ -1,3 +1,6 @@
+use std::collections::BTreeMap;
+use std::collections::btree_map::Entry;
+
 use serde::{Deserialize, Serialize};
 use tree_sitter::{Language, Node, Parser};
 
@@ -36,35 +39,65 @@ pub fn extractor_health() -> OutlineExtractorHealth {
     }
 }
 
-pub fn extract_outline(file: &str, language: &str, contents: &str) -> Vec<OutlineEntry> {
-    let Some(tree) = parse(language, contents) else {
-        return Vec::new();
-    };
-    let mut entries = Vec::new();
-    match language {
-        "rust" => walk_rust(file, contents, tree.root_node(), None, &mut entries),
-        "typescript" | "javascript" => {
-            walk_js_like(file, contents, tree.root_node(), None, false, &mut entries)
+/// Per-thread tree-sitter parsers, one per outline language, reused across files.
+#[derive(Default)]
+pub struct OutlineParsers {
+    parsers: BTreeMap<&'static str, Parser>,
+}
+
+impl std::fmt::Debug for OutlineParsers {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("OutlineParsers")
+            .field("languages", &self.parsers.keys().collect::<Vec<_>>())
+            .finish()
+    }
+}
+
+impl OutlineParsers {
+    pub fn extract(&mut self, file: &str, language: &str, contents: &str) -> Vec<OutlineEntry> {
+        let Some(tree) = self.parse(language, contents) else {
+            return Vec::new();
+        };
+        let mut entries = Vec::new();
+        match language {
+            "rust" => walk_rust(file, contents, tree.root_node(), None, &mut entries),
+            "typescript" | "javascript" => {
+                walk_js_like(file, contents, tree.root_node(), None, false, &mut entries)
+            }
+            "python" => walk_python(file, contents, tree.root_node(), None, &mut entries),
+            "markdown" => walk_markdown(file, contents, tree.root_node(), &mut entries),
+            _ => {}
         }
-        "python" => walk_python(file, contents, tree.root_node(), None, &mut entries),
-        "markdown" => walk_markdown(file, contents, tree.root_node(), &mut entries),
-        _ => {}
+        entries
+    }
+
+    fn parse(&mut self, language: &str, contents: &str) -> Option<tree_sitter::Tree> {
+        let (name, grammar) = grammar(language)?;
+        let parser = match self.parsers.entry(name) {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => {
+                let mut parser = Parser::new();
+                parser.set_language(&grammar).ok()?;
+                entry.insert(parser)
+            }
+        };
+        parser.parse(contents, None)
     }
-    entries
 }
 
-fn parse(language: &str, contents: &str) -> Option<tree_sitter::Tree> {
-    let language: Language = match language {
-        "rust" => tree_sitter_rust::LANGUAGE.into(),
-        "typescript" => tree_sitter_typescript::LANGUAGE_TYPESCRIPT.into(),
-        "javascript" => tree_sitter_javascript::LANGUAGE.into(),
-        "python" => tree_sitter_python::LANGUAGE.into(),
-        "markdown" => tree_sitter_md::LANGUAGE.into(),
+fn grammar(language: &str) -> Option<(&'static str, Language)> {
+    let grammar: (&'static str, Language) = match language {
+        "rust" => ("rust", tree_sitter_rust::LANGUAGE.into()),
+        "typescript" => (
+            "typescript",
+            tree_sitter_typescript::LANGUAGE_TYPESCRIPT.into(),
+        ),
+        "javascript" => ("javascript", tree_sitter_javascript::LANGUAGE.into()),
+        "python" => ("python", tree_sitter_python::LANGUAGE.into()),
+        "markdown" => ("markdown", tree_sitter_md::LANGUAGE.into()),
         _ => return None,
     };
-    let mut parser = Parser::new();
-    parser.set_language(&language).ok()?;
-    parser.parse(contents, None)
+    Some(grammar)
 }
 
 fn walk_rust(
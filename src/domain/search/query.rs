@@ -1,4 +1,5 @@
 use crate::domain::search::types::SearchDiagnostic;
+use crate::foundation::core::profile;
 
 #[derive(Clone, Copy, Debug, Eq, PartialEq)]
 pub enum CaseMode {
@@ -48,6 +49,7 @@ pub struct ParsedQuery {
 }
 
 pub fn parse(raw: &str) -> Result<ParsedQuery, SearchDiagnostic> {
+    let _phase = profile::phase("search.parse");
     let atoms = tokenize(raw)?;
     let mut terms = Vec::new();
     let mut regexes = Vec::new();
@@ -1,9 +1,10 @@
 use std::collections::BTreeMap;
 use std::path::{Component, Path};
 use std::process::Command;
+use std::sync::atomic::{AtomicUsize, Ordering};
 use std::time::UNIX_EPOCH;
 
-use anyhow::{Context, Result, bail};
+use anyhow::{Context, Result, anyhow, bail};
 use regex::{Regex, RegexBuilder};
 use serde::{Deserialize, Serialize};
 
@@ -12,16 +13,19 @@ use crate::domain::search::lock;
 use crate::domain::search::memory;
 use crate::domain::search::outline::{self, OutlineEntry};
 use crate::domain::search::query::{self, ParsedQuery, QueryAtom, QueryExpr};
+use crate::domain::search::source_shard::{
+    self, LineOffset, ManifestEntry, SOURCE_SHARD_SCHEMA_VERSION, ShardReader, SourceFile,
+    SourceShard, SymbolEntry,
+};
 use crate::domain::search::types::{
     DiagnosticSeverity, GrepEnvelope, MatchSpan, ScoreReason, SearchCorpus, SearchDiagnostic,
     SearchFreshness, SearchHit,
 };
 use crate::foundation::core::fs::ensure_dir;
 use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
 use crate::foundation::core::safe_write::write_atomic;
 
-const SOURCE_SHARD_SCHEMA_VERSION: &str = "source-shard.v2";
-const SOURCE_SHARD_MAGIC: &[u8] = b"MAESTRO_SOURCE_SHARD_V2\n";
 const MAX_SOURCE_BYTES: u64 = 5 * 1024 * 1024;
 const MAX_SOURCE_LINES: usize = 80_000;
 const OUTLINE_KINDS: &[&str] = &[
@@ -31,6 +35,10 @@ const OUTLINE_KINDS: &[&str] = &[
 #[derive(Debug, Serialize)]
 pub struct SourceRebuildReport {
     pub indexed_files: usize,
+    /// Manifest entries whose stored contents, outline, and symbols were carried over.
+    pub reused_files: usize,
+    /// Manifest entries that were added or changed and read + outlined again.
+    pub reparsed_files: usize,
     pub outline_entries: usize,
     pub ctags_symbols: usize,
     pub ctags_status: CtagsStatus,
@@ -61,47 +69,6 @@ pub struct SourceSkip {
     pub reason: String,
 }
 
-#[derive(Debug, Deserialize, Serialize)]
-struct SourceShard {
-    schema_version: String,
-    manifest: Vec<ManifestEntry>,
-    files: Vec<SourceFile>,
-    outline_entries: Vec<OutlineEntry>,
-    symbols: Vec<SymbolEntry>,
-    ctags_status: CtagsStatus,
-    skipped: Vec<SourceSkip>,
-}
-
-#[derive(Clone, Debug, Deserialize, Eq, PartialEq, Serialize)]
-struct SourceFile {
-    path: String,
-    language: String,
-    contents: String,
-    line_offsets: Vec<LineOffset>,
-}
-
-#[derive(Clone, Debug, Deserialize, Eq, PartialEq, Serialize)]
-struct LineOffset {
-    line: u64,
-    byte_start: usize,
-}
-
-#[derive(Clone, Debug, Deserialize, Eq, PartialEq, Serialize)]
-struct SymbolEntry {
-    path: String,
-    name: String,
-    kind: String,
-    line: u64,
-    signature: Option<String>,
-}
-
-#[derive(Clone, Debug, Deserialize, Eq, Ord, PartialEq, PartialOrd, Serialize)]
-struct ManifestEntry {
-    path: String,
-    mtime_ns: u64,
-    len: u64,
-}
-
 #[derive(Clone, Debug)]
 struct SourceMatch {
     byte_start: usize,
@@ -112,7 +79,7 @@ struct SourceMatch {
 }
 
 struct LoadedSourceShard {
-    shard: SourceShard,
+    shard: ShardReader,
     freshness: SearchFreshness,
     diagnostics: Vec<SearchDiagnostic>,
 }
@@ -241,59 +208,61 @@ pub fn rebuild_source(paths: &MaestroPaths) -> Result<SourceRebuildReport> {
 pub(crate) fn rebuild_source_unlocked(paths: &MaestroPaths) -> Result<SourceRebuildReport> {
     let mut skipped = Vec::new();
     let candidates = source_manifest(paths, &mut skipped)?;
-    let mut files = Vec::new();
-    let mut outline_entries = Vec::new();
+    let mut previous = ReusableSource::load(paths);
 
+    let mut slots: Vec<Option<IndexedCandidate>> = Vec::with_capacity(candidates.len());
+    let mut changed = Vec::new();
     for entry in &candidates {
-        let path = paths.repo_root().join(&entry.path);
-        let bytes = std::fs::read(&path)
-            .with_context(|| format!("failed to read source candidate {}", entry.path))?;
-        if bytes.contains(&0) {
-            skipped.push(SourceSkip {
-                path: entry.path.clone(),
-                reason: "binary".to_string(),
-            });
-            continue;
+        let reused = previous.as_mut().and_then(|previous| previous.take(entry));
+        if reused.is_none() {
+            changed.push(entry);
         }
-        let contents = match String::from_utf8(bytes) {
-            Ok(contents) => contents,
-            Err(_) => {
-                skipped.push(SourceSkip {
-                    path: entry.path.clone(),
-                    reason: "binary".to_string(),
-                });
-                continue;
+        slots.push(reused);
+    }
+    let reused_files = candidates.len() - changed.len();
+    let reparsed_files = changed.len();
+    let mut reparsed = index_changed(paths, &changed)?.into_iter();
+
+    let mut files = Vec::new();
+    let mut outline_entries = Vec::new();
+    let mut changed_paths = Vec::new();
+    for slot in slots {
+        let candidate = match slot {
+            Some(candidate) => candidate,
+            None => {
+                let candidate = reparsed
+                    .next()
+                    .context("source index worker returned too few results")?;
+                if let IndexedCandidate::Indexed { file, .. } = &candidate {
+                    changed_paths.push(file.path.clone());
+                }
+                candidate
             }
         };
-        let line_count = contents
-            .lines()
-            .count()
-            .max(usize::from(!contents.is_empty()));
-        if line_count > MAX_SOURCE_LINES {
-            skipped.push(SourceSkip {
-                path: entry.path.clone(),
-                reason: "line_cap".to_string(),
-            });
-            continue;
+        match candidate {
+            IndexedCandidate::Indexed {
+                file,
+                outline_entries: entries,
+            } => {
+                outline_entries.extend(entries);
+                files.push(file);
+            }
+            IndexedCandidate::Skipped(skip) => skipped.push(skip),
         }
-        let line_offsets = line_offsets(&contents);
-        let language = language_for_path(&entry.path).to_string();
-        outline_entries.extend(outline::extract_outline(&entry.path, &language, &contents));
-        files.push(SourceFile {
-            path: entry.path.clone(),
-            language,
-            contents,
-            line_offsets,
-        });
     }
 
-    let (ctags_status, symbols) = collect_ctags(paths, &files);
+    let reused_symbols = previous
+        .filter(|previous| previous.ctags_status.available)
+        .map(|previous| previous.symbols);
+    let (ctags_status, symbols) = rebuild_symbols(paths, &files, &changed_paths, reused_symbols);
     let report = report(
         files.len(),
         outline_entries.len(),
         symbols.len(),
         ctags_status.clone(),
         &skipped,
+        reused_files,
+        reparsed_files,
     );
     let shard = SourceShard {
         schema_version: SOURCE_SHARD_SCHEMA_VERSION.to_string(),
@@ -305,24 +274,198 @@ pub(crate) fn rebuild_source_unlocked(paths: &MaestroPaths) -> Result<SourceRebu
         skipped,
     };
     ensure_dir(paths.search_index_dir())?;
-    write_atomic(paths.source_shard_file(), &encode_shard(&shard)?)?;
+    write_atomic(
+        paths.source_shard_file(),
+        &source_shard::encode_shard(&shard)?,
+    )?;
     Ok(report)
 }
 
-pub fn source_index_health(paths: &MaestroPaths) -> SourceIndexHealth {
-    let supported_outline_languages = outline::extractor_health().supported_languages;
-    match std::fs::read(paths.source_shard_file())
-        .ok()
-        .and_then(|bytes| decode_shard(&bytes).ok())
-    {
-        Some(shard) if shard.schema_version == SOURCE_SHARD_SCHEMA_VERSION => SourceIndexHealth {
-            source_shard_present: true,
-            indexed_files: shard.files.len(),
-            outline_entries: shard.outline_entries.len(),
-            ctags_symbols: shard.symbols.len(),
+/// Stored shard contents keyed by path, so unchanged manifest entries skip re-reading.
+struct ReusableSource {
+    manifest: BTreeMap<String, ManifestEntry>,
+    files: BTreeMap<String, SourceFile>,
+    outline_entries: BTreeMap<String, Vec<OutlineEntry>>,
+    symbols: BTreeMap<String, Vec<SymbolEntry>>,
+    content_skips: BTreeMap<String, SourceSkip>,
+    ctags_status: CtagsStatus,
+}
+
+impl ReusableSource {
+    fn load(paths: &MaestroPaths) -> Option<Self> {
+        let reader = ShardReader::open(&paths.source_shard_file()).ok()?;
+        if reader.meta.schema_version != SOURCE_SHARD_SCHEMA_VERSION {
+            return None;
+        }
+        let shard = reader.into_shard().ok()?;
+        let mut outline_entries: BTreeMap<String, Vec<OutlineEntry>> = BTreeMap::new();
+        for entry in shard.outline_entries {
+            outline_entries
+                .entry(entry.file.clone())
+                .or_default()
+                .push(entry);
+        }
+        let mut symbols: BTreeMap<String, Vec<SymbolEntry>> = BTreeMap::new();
+        for symbol in shard.symbols {
+            symbols.entry(symbol.path.clone()).or_default().push(symbol);
+        }
+        Some(Self {
+            manifest: shard
+                .manifest
+                .into_iter()
+                .map(|entry| (entry.path.clone(), entry))
+                .collect(),
+            files: shard
+                .files
+                .into_iter()
+                .map(|file| (file.path.clone(), file))
+                .collect(),
+            outline_entries,
+            symbols,
+            content_skips: shard
+                .skipped
+                .into_iter()
+                .filter(|skip| is_content_skip(&skip.reason))
+                .map(|skip| (skip.path.clone(), skip))
+                .collect(),
             ctags_status: shard.ctags_status,
-            supported_outline_languages,
+        })
+    }
+
+    fn take(&mut self, entry: &ManifestEntry) -> Option<IndexedCandidate> {
+        if self.manifest.get(&entry.path) != Some(entry) {
+            return None;
+        }
+        if let Some(file) = self.files.remove(&entry.path) {
+            return Some(IndexedCandidate::Indexed {
+                file,
+                outline_entries: self.outline_entries.remove(&entry.path).unwrap_or_default(),
+            });
+        }
+        self.content_skips
+            .remove(&entry.path)
+            .map(IndexedCandidate::Skipped)
+    }
+}
+
+enum IndexedCandidate {
+    Indexed {
+        file: SourceFile,
+        outline_entries: Vec<OutlineEntry>,
+    },
+    Skipped(SourceSkip),
+}
+
+/// Skip reasons decided from file contents rather than the directory walk.
+fn is_content_skip(reason: &str) -> bool {
+    matches!(reason, "binary" | "line_cap")
+}
+
+fn index_changed(
+    paths: &MaestroPaths,
+    entries: &[&ManifestEntry],
+) -> Result<Vec<IndexedCandidate>> {
+    let workers = std::thread::available_parallelism()
+        .map_or(1, std::num::NonZeroUsize::get)
+        .min(entries.len());
+    if workers <= 1 {
+        let mut parsers = outline::OutlineParsers::default();
+        return entries
+            .iter()
+            .map(|entry| index_candidate(paths, entry, &mut parsers))
+            .collect();
+    }
+
+    let next = AtomicUsize::new(0);
+    let mut indexed = std::thread::scope(|scope| {
+        let handles = (0..workers)
+            .map(|_| {
+                scope.spawn(|| -> Result<Vec<(usize, IndexedCandidate)>> {
+                    let mut parsers = outline::OutlineParsers::default();
+                    let mut done = Vec::new();
+                    loop {
+                        let idx = next.fetch_add(1, Ordering::Relaxed);
+                        let Some(entry) = entries.get(idx) else {
+                            return Ok(done);
+                        };
+                        done.push((idx, index_candidate(paths, entry, &mut parsers)?));
+                    }
+                })
+            })
+            .collect::<Vec<_>>();
+        let mut indexed = Vec::with_capacity(entries.len());
+        for handle in handles {
+            let done = handle
+                .join()
+                .map_err(|_| anyhow!("source index worker panicked"))??;
+            indexed.extend(done);
+        }
+        Ok::<_, anyhow::Error>(indexed)
+    })?;
+    indexed.sort_by_key(|(idx, _)| *idx);
+    Ok(indexed
+        .into_iter()
+        .map(|(_, candidate)| candidate)
+        .collect())
+}
+
+fn index_candidate(
+    paths: &MaestroPaths,
+    entry: &ManifestEntry,
+    parsers: &mut outline::OutlineParsers,
+) -> Result<IndexedCandidate> {
+    let path = paths.repo_root().join(&entry.path);
+    let bytes = std::fs::read(&path)
+        .with_context(|| format!("failed to read source candidate {}", entry.path))?;
+    if bytes.contains(&0) {
+        return Ok(IndexedCandidate::Skipped(SourceSkip {
+            path: entry.path.clone(),
+            reason: "binary".to_string(),
+        }));
+    }
+    let Ok(contents) = String::from_utf8(bytes) else {
+        return Ok(IndexedCandidate::Skipped(SourceSkip {
+            path: entry.path.clone(),
+            reason: "binary".to_string(),
+        }));
+    };
+    let line_count = contents
+        .lines()
+        .count()
+        .max(usize::from(!contents.is_empty()));
+    if line_count > MAX_SOURCE_LINES {
+        return Ok(IndexedCandidate::Skipped(SourceSkip {
+            path: entry.path.clone(),
+            reason: "line_cap".to_string(),
+        }));
+    }
+    let line_offsets = line_offsets(&contents);
+    let language = language_for_path(&entry.path).to_string();
+    let outline_entries = parsers.extract(&entry.path, &language, &contents);
+    Ok(IndexedCandidate::Indexed {
+        file: SourceFile {
+            path: entry.path.clone(),
+            language,
+            contents,
+            line_offsets,
         },
+        outline_entries,
+    })
+}
+
+pub fn source_index_health(paths: &MaestroPaths) -> SourceIndexHealth {
+    let supported_outline_languages = outline::extractor_health().supported_languages;
+    match ShardReader::open(&paths.source_shard_file()).ok() {
+        Some(shard) if shard.meta.schema_version == SOURCE_SHARD_SCHEMA_VERSION => {
+            SourceIndexHealth {
+                source_shard_present: true,
+                indexed_files: shard.file_count(),
+                outline_entries: shard.outline_count(),
+                ctags_symbols: shard.symbol_count(),
+                ctags_status: shard.meta.ctags_status,
+                supported_outline_languages,
+            }
+        }
         _ => SourceIndexHealth {
             source_shard_present: false,
             indexed_files: 0,
@@ -364,6 +507,7 @@ pub(crate) fn grep_source_parsed(
         }
     };
 
+    let _phase = profile::phase("search.source_match");
     let hits = if parsed.filters.sym.is_some() {
         match search_symbols(&loaded.shard, parsed) {
             Ok(hits) => hits,
@@ -401,6 +545,7 @@ pub(crate) fn grep_source_parsed(
 }
 
 fn load_for_query(paths: &MaestroPaths) -> Result<LoadedSourceShard, SearchDiagnostic> {
+    let _phase = profile::phase("search.source_shard");
     match load_fresh(paths) {
         Ok(shard) => Ok(LoadedSourceShard {
             freshness: source_freshness(&shard, false),
@@ -424,72 +569,80 @@ fn load_for_query(paths: &MaestroPaths) -> Result<LoadedSourceShard, SearchDiagn
                     .with_path(".maestro/index/search/source.shard")
                     .with_retryable(false)],
                 }),
-                Err(error) => Err(SearchDiagnostic {
-                    severity: DiagnosticSeverity::Error,
-                    code: "source_shard_unavailable".to_string(),
-                    message: format!("source shard unavailable: {error}"),
-                    corpus: Some(SearchCorpus::Source),
-                    path: Some(".maestro/index/search/source.shard".to_string()),
-                    retryable: Some(true),
-                }),
+                Err(error) => Err(shard_unavailable(error)),
             }
         }
     }
 }
 
-fn load_fresh(paths: &MaestroPaths) -> Result<SourceShard> {
-    let bytes = std::fs::read(paths.source_shard_file()).context("failed to read source shard")?;
-    let shard = decode_shard(&bytes)?;
-    if shard.schema_version != SOURCE_SHARD_SCHEMA_VERSION {
+fn load_fresh(paths: &MaestroPaths) -> Result<ShardReader> {
+    let shard = ShardReader::open(&paths.source_shard_file())?;
+    if shard.meta.schema_version != SOURCE_SHARD_SCHEMA_VERSION {
         bail!("source shard schema is stale");
     }
     let mut skipped = Vec::new();
-    if shard.manifest != source_manifest(paths, &mut skipped)? {
+    if shard.meta.manifest != source_manifest(paths, &mut skipped)? {
         bail!("source shard manifest is stale");
     }
     Ok(shard)
 }
 
-fn source_freshness(shard: &SourceShard, repaired: bool) -> SearchFreshness {
+fn shard_unavailable(error: anyhow::Error) -> SearchDiagnostic {
+    SearchDiagnostic {
+        severity: DiagnosticSeverity::Error,
+        code: "source_shard_unavailable".to_string(),
+        message: format!("source shard unavailable: {error}"),
+        corpus: Some(SearchCorpus::Source),
+        path: Some(".maestro/index/search/source.shard".to_string()),
+        retryable: Some(true),
+    }
+}
+
+fn source_freshness(shard: &ShardReader, repaired: bool) -> SearchFreshness {
     SearchFreshness {
         corpus: SearchCorpus::Source,
         shard: ".maestro/index/search/source.shard".to_string(),
         fresh: true,
         repaired,
-        schema_version: shard.schema_version.clone(),
-        manifest_entries: shard.manifest.len(),
+        schema_version: shard.meta.schema_version.clone(),
+        manifest_entries: shard.meta.manifest.len(),
         vocabulary_version: intent::SYMBOLIC_VOCABULARY_VERSION.to_string(),
         artifact_graph_version: intent::ARTIFACT_GRAPH_VERSION.to_string(),
         outline_extractor_version: Some(outline::OUTLINE_EXTRACTOR_VERSION.to_string()),
         documents: None,
-        indexed_files: Some(shard.files.len()),
-        outline_entries: Some(shard.outline_entries.len()),
-        ctags_symbols: Some(shard.symbols.len()),
-        skipped_files: Some(shard.skipped.len()),
-        skipped_by_reason: skipped_by_reason(&shard.skipped),
+        indexed_files: Some(shard.file_count()),
+        outline_entries: Some(shard.outline_count()),
+        ctags_symbols: Some(shard.symbol_count()),
+        skipped_files: Some(shard.meta.skipped.len()),
+        skipped_by_reason: skipped_by_reason(&shard.meta.skipped),
     }
 }
 
 fn search_shard(
-    shard: &SourceShard,
+    shard: &ShardReader,
     parsed: &ParsedQuery,
 ) -> Result<Vec<SearchHit>, SearchDiagnostic> {
     let case_sensitive = query::literal_case_sensitive(parsed);
     let mut hits = Vec::new();
 
     if wants_file_hits(parsed) {
-        for file in &shard.files {
-            if !source_filters_match(file, parsed)? {
+        let candidates = match candidate_files(shard, &parsed.expr, case_sensitive)? {
+            Some(ids) => ids.into_iter().map(|id| id as usize).collect::<Vec<_>>(),
+            None => (0..shard.file_count()).collect(),
+        };
+        for id in candidates {
+            if !source_filters_match(shard.path(id), shard.language(id), parsed)? {
                 continue;
             }
-            let searchable = file_search_text(file);
+            let file = shard.load_file(id).map_err(shard_unavailable)?;
+            let searchable = file_search_text(&file);
             if !evaluate_expr(&parsed.expr, &searchable, case_sensitive)? {
                 continue;
             }
-            let Some(first_match) = first_positive_match(file, parsed, case_sensitive)? else {
+            let Some(first_match) = first_positive_match(&file, parsed, case_sensitive)? else {
                 continue;
             };
-            let score = source_score(file, &first_match, parsed);
+            let score = source_score(&file, &first_match, parsed);
             hits.push(SearchHit {
                 rank: 0,
                 corpus: SearchCorpus::Source,
@@ -520,11 +673,13 @@ fn search_shard(
     }
 
     if wants_outline_hits(parsed) {
-        for entry in &shard.outline_entries {
-            let Some(file) = shard.files.iter().find(|file| file.path == entry.file) else {
+        for entry in &shard.outline_entries().map_err(shard_unavailable)? {
+            let Some(id) = shard.file_id(&entry.file) else {
                 continue;
             };
-            if !source_filters_match(file, parsed)? || !outline_type_matches(entry, parsed) {
+            if !source_filters_match(shard.path(id), shard.language(id), parsed)?
+                || !outline_type_matches(entry, parsed)
+            {
                 continue;
             }
             let searchable = outline_search_text(entry);
@@ -553,15 +708,15 @@ fn search_shard(
 }
 
 fn search_symbols(
-    shard: &SourceShard,
+    shard: &ShardReader,
     parsed: &ParsedQuery,
 ) -> Result<Vec<SearchHit>, SearchDiagnostic> {
-    if !shard.ctags_status.available {
+    if !shard.meta.ctags_status.available {
         return Err(SearchDiagnostic::error(
             "ctags_unavailable",
             format!(
                 "{}; install universal-ctags and run `maestro index rebuild --source` for sym:",
-                shard.ctags_status.message
+                shard.meta.ctags_status.message
             ),
         ));
     }
@@ -569,15 +724,12 @@ fn search_symbols(
         return Ok(Vec::new());
     };
     let mut hits = Vec::new();
-    for symbol_entry in &shard.symbols {
+    for symbol_entry in &shard.symbols().map_err(shard_unavailable)? {
         if !symbol_entry.name.eq_ignore_ascii_case(symbol) {
             continue;
         }
-        if let Some(file) = shard
-            .files
-            .iter()
-            .find(|file| file.path == symbol_entry.path)
-            && !source_filters_match(file, parsed)?
+        if let Some(id) = shard.file_id(&symbol_entry.path)
+            && !source_filters_match(shard.path(id), shard.language(id), parsed)?
         {
             continue;
         }
@@ -621,9 +773,13 @@ fn search_symbols(
     Ok(hits)
 }
 
-fn source_filters_match(file: &SourceFile, parsed: &ParsedQuery) -> Result<bool, SearchDiagnostic> {
+fn source_filters_match(
+    path: &str,
+    language: &str,
+    parsed: &ParsedQuery,
+) -> Result<bool, SearchDiagnostic> {
     if let Some(lang) = &parsed.filters.lang
-        && lang != &file.language
+        && lang != language
     {
         return Ok(false);
     }
@@ -632,7 +788,7 @@ fn source_filters_match(file: &SourceFile, parsed: &ParsedQuery) -> Result<bool,
             .filters
             .file_globs
             .iter()
-            .any(|pattern| glob_matches(pattern, &file.path))
+            .any(|pattern| glob_matches(pattern, path))
     {
         return Ok(false);
     }
@@ -640,7 +796,7 @@ fn source_filters_match(file: &SourceFile, parsed: &ParsedQuery) -> Result<bool,
         .filters
         .excluded_file_globs
         .iter()
-        .any(|pattern| glob_matches(pattern, &file.path))
+        .any(|pattern| glob_matches(pattern, path))
     {
         return Ok(false);
     }
@@ -774,6 +930,51 @@ fn outline_hit(entry: &OutlineEntry, first_match: &SourceMatch, parsed: &ParsedQ
     }
 }
 
+/// Narrow `expr` to the files whose trigram postings can satisfy it; `None` keeps
+/// every file. Candidates are still confirmed by `evaluate_expr`.
+fn candidate_files(
+    shard: &ShardReader,
+    expr: &QueryExpr,
+    case_sensitive: bool,
+) -> Result<Option<Vec<u32>>, SearchDiagnostic> {
+    match expr {
+        QueryExpr::Atom(QueryAtom::Literal(term)) => {
+            shard.literal_candidates(term).map_err(shard_unavailable)
+        }
+        QueryExpr::Atom(QueryAtom::Regex(pattern)) => {
+            regex_for(pattern, case_sensitive)?;
+            let mut candidates = None;
+            for literal in source_shard::regex_required_literals(pattern) {
+                let found = shard
+                    .literal_candidates(&literal)
+                    .map_err(shard_unavailable)?;
+                candidates = source_shard::intersect_candidates(candidates, found);
+            }
+            Ok(candidates)
+        }
+        QueryExpr::Not(_) => Ok(None),
+        QueryExpr::And(items) => {
+            let mut candidates = None;
+            for item in items {
+                let found = candidate_files(shard, item, case_sensitive)?;
+                candidates = source_shard::intersect_candidates(candidates, found);
+            }
+            Ok(candidates)
+        }
+        QueryExpr::Or(items) => {
+            let mut candidates = Some(Vec::new());
+            for item in items {
+                let found = candidate_files(shard, item, case_sensitive)?;
+                candidates = source_shard::union_candidates(candidates, found);
+                if candidates.is_none() {
+                    break;
+                }
+            }
+            Ok(candidates)
+        }
+    }
+}
+
 fn evaluate_expr(
     expr: &QueryExpr,
     contents: &str,
@@ -987,20 +1188,6 @@ fn line_start_for_byte(offsets: &[LineOffset], byte: usize) -> usize {
     line_start
 }
 
-fn encode_shard(shard: &SourceShard) -> Result<Vec<u8>> {
-    let mut bytes = SOURCE_SHARD_MAGIC.to_vec();
-    let payload = serde_json::to_vec(shard).context("failed to serialize source shard")?;
-    bytes.extend(payload);
-    Ok(bytes)
-}
-
-fn decode_shard(bytes: &[u8]) -> Result<SourceShard> {
-    let Some(payload) = bytes.strip_prefix(SOURCE_SHARD_MAGIC) else {
-        bail!("source shard magic header is missing");
-    };
-    serde_json::from_slice(payload).context("failed to parse source shard")
-}
-
 fn source_manifest(
     paths: &MaestroPaths,
     skipped: &mut Vec<SourceSkip>,
@@ -1157,11 +1344,64 @@ fn language_for_path(path: &str) -> &'static str {
     }
 }
 
-fn collect_ctags(paths: &MaestroPaths, files: &[SourceFile]) -> (CtagsStatus, Vec<SymbolEntry>) {
+/// Reuse stored ctags symbols for unchanged files and run ctags only over `changed`;
+/// without a reusable symbol set every indexed file goes through ctags.
+fn rebuild_symbols(
+    paths: &MaestroPaths,
+    files: &[SourceFile],
+    changed: &[String],
+    reused: Option<BTreeMap<String, Vec<SymbolEntry>>>,
+) -> (CtagsStatus, Vec<SymbolEntry>) {
     let status = current_ctags_status();
     if !status.available {
         return (status, Vec::new());
     }
+    let (status, mut fresh, mut reused) = match reused {
+        Some(mut reused) => {
+            for path in changed {
+                reused.remove(path);
+            }
+            let (status, fresh) = collect_ctags(paths, changed);
+            (status, fresh, reused)
+        }
+        None => {
+            let all = files
+                .iter()
+                .map(|file| file.path.clone())
+                .collect::<Vec<_>>();
+            let (status, fresh) = collect_ctags(paths, &all);
+            (status, fresh, BTreeMap::new())
+        }
+    };
+    if !status.available {
+        return (status, Vec::new());
+    }
+    let symbols = files
+        .iter()
+        .flat_map(|file| {
+            reused
+                .remove(&file.path)
+                .or_else(|| fresh.remove(&file.path))
+                .unwrap_or_default()
+        })
+        .collect();
+    (status, symbols)
+}
+
+/// Run ctags over `files` and group the symbols by repo-relative path.
+fn collect_ctags(
+    paths: &MaestroPaths,
+    files: &[String],
+) -> (CtagsStatus, BTreeMap<String, Vec<SymbolEntry>>) {
+    if files.is_empty() {
+        return (
+            CtagsStatus {
+                available: true,
+                message: "universal-ctags available".to_string(),
+            },
+            BTreeMap::new(),
+        );
+    }
 
     let mut command = Command::new("ctags");
     command
@@ -1171,7 +1411,7 @@ fn collect_ctags(paths: &MaestroPaths, files: &[SourceFile]) -> (CtagsStatus, Ve
         .arg("-f")
         .arg("-");
     for file in files {
-        command.arg(ctags_file_arg(&file.path));
+        command.arg(ctags_file_arg(file));
     }
 
     let output = match command.output() {
@@ -1182,7 +1422,7 @@ fn collect_ctags(paths: &MaestroPaths, files: &[SourceFile]) -> (CtagsStatus, Ve
                     available: false,
                     message: format!("ctags failed to run: {error}"),
                 },
-                Vec::new(),
+                BTreeMap::new(),
             );
         }
     };
@@ -1195,11 +1435,11 @@ fn collect_ctags(paths: &MaestroPaths, files: &[SourceFile]) -> (CtagsStatus, Ve
                     String::from_utf8_lossy(&output.stderr).trim()
                 ),
             },
-            Vec::new(),
+            BTreeMap::new(),
         );
     }
 
-    let mut symbols = Vec::new();
+    let mut symbols: BTreeMap<String, Vec<SymbolEntry>> = BTreeMap::new();
     for line in String::from_utf8_lossy(&output.stdout).lines() {
         let Ok(value) = serde_json::from_str::<serde_json::Value>(line) else {
             continue;
@@ -1215,8 +1455,9 @@ fn collect_ctags(paths: &MaestroPaths, files: &[SourceFile]) -> (CtagsStatus, Ve
             .and_then(serde_json::Value::as_str)
             .unwrap_or("symbol")
             .to_string();
-        symbols.push(SymbolEntry {
-            path: relative_label(Path::new(path), paths.repo_root()),
+        let path = relative_label(Path::new(path), paths.repo_root());
+        symbols.entry(path.clone()).or_default().push(SymbolEntry {
+            path,
             name: name.to_string(),
             kind,
             line: value
@@ -1273,9 +1514,13 @@ fn report(
     ctags_symbols: usize,
     ctags_status: CtagsStatus,
     skipped: &[SourceSkip],
+    reused_files: usize,
+    reparsed_files: usize,
 ) -> SourceRebuildReport {
     SourceRebuildReport {
         indexed_files,
+        reused_files,
+        reparsed_files,
         outline_entries,
         ctags_symbols,
         ctags_status,
@@ -0,0 +1,772 @@
+//! Binary `source-shard.v3` layout.
+//!
+//! The shard is a fixed header followed by offset-addressed sections, so a query
+//! reads the manifest metadata and the file table, then only the trigram postings
+//! and file contents it needs, instead of decoding every stored file up front.
+//!
+//! ```text
+//! magic "MAESTRO_SOURCE_SHARD_V3\n"
+//! header   14 x u64 LE: (offset, len|count) for meta, strings, files, trigrams,
+//!          outline, symbols; then outline and symbol entry counts
+//! meta     JSON: schema_version, manifest, ctags_status, skipped
+//! strings  file paths + languages, addressed by the file table
+//! contents file bodies, then u64 line-start offsets per file
+//! postings ascending u32 file ids per trigram
+//! files    FILE_RECORD_LEN-byte records sorted by path (the path -> file index)
+//! trigrams TRIGRAM_RECORD_LEN-byte records sorted by key
+//! outline  JSON Vec<OutlineEntry>
+//! symbols  JSON Vec<SymbolEntry>
+//! ```
+//!
+//! Trigrams index the case-folded `path\ncontents` text that source queries
+//! search, so one posting set serves case-sensitive and case-insensitive atoms.
+//! Postings only narrow candidates; every hit is still confirmed against contents.
+
+use std::collections::{BTreeSet, HashMap, HashSet};
+use std::fs::File;
+use std::io::{Read, Seek, SeekFrom};
+use std::path::Path;
+
+use anyhow::{Context, Result, bail};
+use serde::{Deserialize, Serialize};
+
+use crate::domain::search::outline::OutlineEntry;
+use crate::domain::search::source::{CtagsStatus, SourceSkip};
+
+pub(super) const SOURCE_SHARD_SCHEMA_VERSION: &str = "source-shard.v3";
+const SOURCE_SHARD_MAGIC: &[u8] = b"MAESTRO_SOURCE_SHARD_V3\n";
+const HEADER_FIELDS: usize = 14;
+const HEADER_LEN: usize = SOURCE_SHARD_MAGIC.len() + HEADER_FIELDS * 8;
+const FILE_RECORD_LEN: usize = 8 * 8;
+const TRIGRAM_RECORD_LEN: usize = 16;
+
+#[derive(Debug)]
+pub(super) struct SourceShard {
+    pub(super) schema_version: String,
+    pub(super) manifest: Vec<ManifestEntry>,
+    pub(super) files: Vec<SourceFile>,
+    pub(super) outline_entries: Vec<OutlineEntry>,
+    pub(super) symbols: Vec<SymbolEntry>,
+    pub(super) ctags_status: CtagsStatus,
+    pub(super) skipped: Vec<SourceSkip>,
+}
+
+#[derive(Clone, Debug, Eq, PartialEq)]
+pub(super) struct SourceFile {
+    pub(super) path: String,
+    pub(super) language: String,
+    pub(super) contents: String,
+    pub(super) line_offsets: Vec<LineOffset>,
+}
+
+#[derive(Clone, Debug, Eq, PartialEq)]
+pub(super) struct LineOffset {
+    pub(super) line: u64,
+    pub(super) byte_start: usize,
+}
+
+#[derive(Clone, Debug, Deserialize, Eq, PartialEq, Serialize)]
+pub(super) struct SymbolEntry {
+    pub(super) path: String,
+    pub(super) name: String,
+    pub(super) kind: String,
+    pub(super) line: u64,
+    pub(super) signature: Option<String>,
+}
+
+#[derive(Clone, Debug, Deserialize, Eq, Ord, PartialEq, PartialOrd, Serialize)]
+pub(super) struct ManifestEntry {
+    pub(super) path: String,
+    pub(super) mtime_ns: u64,
+    pub(super) len: u64,
+}
+
+/// Small, always-read shard metadata: enough to check freshness and report skips.
+#[derive(Debug, Deserialize)]
+pub(super) struct ShardMeta {
+    pub(super) schema_version: String,
+    pub(super) manifest: Vec<ManifestEntry>,
+    pub(super) ctags_status: CtagsStatus,
+    pub(super) skipped: Vec<SourceSkip>,
+}
+
+#[derive(Serialize)]
+struct ShardMetaRef<'a> {
+    schema_version: &'a str,
+    manifest: &'a [ManifestEntry],
+    ctags_status: &'a CtagsStatus,
+    skipped: &'a [SourceSkip],
+}
+
+#[derive(Clone, Copy, Debug, Default)]
+struct Section {
+    offset: u64,
+    len: u64,
+}
+
+#[derive(Clone, Copy, Debug, Default)]
+struct Header {
+    meta: Section,
+    strings: Section,
+    files: Section,
+    trigrams: Section,
+    outline: Section,
+    symbols: Section,
+    outline_count: u64,
+    symbol_count: u64,
+}
+
+impl Header {
+    fn fields(&self) -> [u64; HEADER_FIELDS] {
+        [
+            self.meta.offset,
+            self.meta.len,
+            self.strings.offset,
+            self.strings.len,
+            self.files.offset,
+            self.files.len,
+            self.trigrams.offset,
+            self.trigrams.len,
+            self.outline.offset,
+            self.outline.len,
+            self.symbols.offset,
+            self.symbols.len,
+            self.outline_count,
+            self.symbol_count,
+        ]
+    }
+
+    fn from_bytes(bytes: &[u8]) -> Self {
+        let field = |idx: usize| u64_at(bytes, idx * 8);
+        let section = |idx: usize| Section {
+            offset: field(idx),
+            len: field(idx + 1),
+        };
+        Self {
+            meta: section(0),
+            strings: section(2),
+            files: section(4),
+            trigrams: section(6),
+            outline: section(8),
+            symbols: section(10),
+            outline_count: field(12),
+            symbol_count: field(13),
+        }
+    }
+}
+
+#[derive(Clone, Copy, Debug)]
+struct FileRecord {
+    path_start: usize,
+    path_len: usize,
+    language_start: usize,
+    language_len: usize,
+    contents_offset: u64,
+    contents_len: u64,
+    lines_offset: u64,
+    line_count: u64,
+}
+
+pub(super) fn encode_shard(shard: &SourceShard) -> Result<Vec<u8>> {
+    if shard
+        .files
+        .windows(2)
+        .any(|pair| pair[0].path >= pair[1].path)
+    {
+        bail!("source shard files must be unique and sorted by path");
+    }
+    let mut out = vec![0; HEADER_LEN];
+    out[..SOURCE_SHARD_MAGIC.len()].copy_from_slice(SOURCE_SHARD_MAGIC);
+    let mut header = Header::default();
+
+    let meta = serde_json::to_vec(&ShardMetaRef {
+        schema_version: &shard.schema_version,
+        manifest: &shard.manifest,
+        ctags_status: &shard.ctags_status,
+        skipped: &shard.skipped,
+    })
+    .context("failed to serialize source shard metadata")?;
+    header.meta = push_section(&mut out, &meta);
+
+    let strings_start = out.len();
+    let mut string_spans = Vec::with_capacity(shard.files.len());
+    for file in &shard.files {
+        let path_start = out.len() - strings_start;
+        out.extend_from_slice(file.path.as_bytes());
+        let language_start = out.len() - strings_start;
+        out.extend_from_slice(file.language.as_bytes());
+        string_spans.push((path_start, language_start));
+    }
+    header.strings = Section {
+        offset: strings_start as u64,
+        len: (out.len() - strings_start) as u64,
+    };
+
+    let mut bodies = Vec::with_capacity(shard.files.len());
+    for file in &shard.files {
+        let contents_offset = out.len();
+        out.extend_from_slice(file.contents.as_bytes());
+        let lines_offset = out.len();
+        for offset in &file.line_offsets {
+            out.extend_from_slice(&(offset.byte_start as u64).to_le_bytes());
+        }
+        bodies.push((contents_offset, lines_offset));
+    }
+
+    let mut postings: HashMap<u32, Vec<u32>> = HashMap::new();
+    for (id, file) in shard.files.iter().enumerate() {
+        let id = u32::try_from(id).context("source shard holds too many files")?;
+        for key in file_trigrams(&file.path, &file.contents) {
+            postings.entry(key).or_default().push(id);
+        }
+    }
+    let mut postings = postings.into_iter().collect::<Vec<_>>();
+    postings.sort_unstable_by_key(|(key, _)| *key);
+    let mut trigram_records = Vec::with_capacity(postings.len());
+    for (key, ids) in &postings {
+        let offset = out.len();
+        for id in ids {
+            out.extend_from_slice(&id.to_le_bytes());
+        }
+        let count = u32::try_from(ids.len()).context("source shard posting list is too long")?;
+        trigram_records.push((*key, count, offset as u64));
+    }
+
+    header.files = Section {
+        offset: out.len() as u64,
+        len: shard.files.len() as u64,
+    };
+    for ((file, (path_start, language_start)), (contents_offset, lines_offset)) in
+        shard.files.iter().zip(string_spans).zip(bodies)
+    {
+        for value in [
+            path_start as u64,
+            file.path.len() as u64,
+            language_start as u64,
+            file.language.len() as u64,
+            contents_offset as u64,
+            file.contents.len() as u64,
+            lines_offset as u64,
+            file.line_offsets.len() as u64,
+        ] {
+            out.extend_from_slice(&value.to_le_bytes());
+        }
+    }
+
+    header.trigrams = Section {
+        offset: out.len() as u64,
+        len: trigram_records.len() as u64,
+    };
+    for (key, count, offset) in trigram_records {
+        out.extend_from_slice(&key.to_le_bytes());
+        out.extend_from_slice(&count.to_le_bytes());
+        out.extend_from_slice(&offset.to_le_bytes());
+    }
+
+    let outline = serde_json::to_vec(&shard.outline_entries)
+        .context("failed to serialize source shard outline")?;
+    header.outline = push_section(&mut out, &outline);
+    header.outline_count = shard.outline_entries.len() as u64;
+    let symbols =
+        serde_json::to_vec(&shard.symbols).context("failed to serialize source shard symbols")?;
+    header.symbols = push_section(&mut out, &symbols);
+    header.symbol_count = shard.symbols.len() as u64;
+
+    for (idx, value) in header.fields().into_iter().enumerate() {
+        let at = SOURCE_SHARD_MAGIC.len() + idx * 8;
+        out[at..at + 8].copy_from_slice(&value.to_le_bytes());
+    }
+    Ok(out)
+}
+
+fn push_section(out: &mut Vec<u8>, bytes: &[u8]) -> Section {
+    let offset = out.len() as u64;
+    out.extend_from_slice(bytes);
+    Section {
+        offset,
+        len: bytes.len() as u64,
+    }
+}
+
+/// Read-side view of a `source-shard.v3` file. Opening reads the header, metadata,
+/// path strings, and file table; contents, postings, outline entries, and symbols
+/// are read on demand with positioned reads.
+#[derive(Debug)]
+pub(super) struct ShardReader {
+    file: File,
+    file_len: u64,
+    header: Header,
+    pub(super) meta: ShardMeta,
+    strings: String,
+    records: Vec<FileRecord>,
+}
+
+impl ShardReader {
+    pub(super) fn open(path: &Path) -> Result<Self> {
+        let file = File::open(path).context("failed to read source shard")?;
+        let file_len = file
+            .metadata()
+            .context("failed to stat source shard")?
+            .len();
+        if file_len < HEADER_LEN as u64 {
+            bail!("source shard magic header is missing");
+        }
+        let head = read_at(&file, file_len, 0, HEADER_LEN as u64)?;
+        let Some(fields) = head.strip_prefix(SOURCE_SHARD_MAGIC) else {
+            bail!("source shard magic header is missing");
+        };
+        let header = Header::from_bytes(fields);
+        let meta = read_section(&file, file_len, header.meta)?;
+        let meta = serde_json::from_slice(&meta).context("failed to parse source shard")?;
+        let strings = read_section(&file, file_len, header.strings)?;
+        let strings = String::from_utf8(strings).context("source shard path table is not UTF-8")?;
+        let table_len = header
+            .files
+            .len
+            .checked_mul(FILE_RECORD_LEN as u64)
+            .context("source shard file table is corrupt")?;
+        let table = read_at(&file, file_len, header.files.offset, table_len)?;
+        let records = table
+            .chunks_exact(FILE_RECORD_LEN)
+            .map(|record| FileRecord {
+                path_start: u64_at(record, 0) as usize,
+                path_len: u64_at(record, 8) as usize,
+                language_start: u64_at(record, 16) as usize,
+                language_len: u64_at(record, 24) as usize,
+                contents_offset: u64_at(record, 32),
+                contents_len: u64_at(record, 40),
+                lines_offset: u64_at(record, 48),
+                line_count: u64_at(record, 56),
+            })
+            .collect();
+        let reader = Self {
+            file,
+            file_len,
+            header,
+            meta,
+            strings,
+            records,
+        };
+        for record in &reader.records {
+            if reader.string(record.path_start, record.path_len).is_none()
+                || reader
+                    .string(record.language_start, record.language_len)
+                    .is_none()
+            {
+                bail!("source shard file table is corrupt");
+            }
+        }
+        Ok(reader)
+    }
+
+    pub(super) fn file_count(&self) -> usize {
+        self.records.len()
+    }
+
+    pub(super) fn outline_count(&self) -> usize {
+        self.header.outline_count as usize
+    }
+
+    pub(super) fn symbol_count(&self) -> usize {
+        self.header.symbol_count as usize
+    }
+
+    pub(super) fn path(&self, id: usize) -> &str {
+        let record = &self.records[id];
+        self.string(record.path_start, record.path_len)
+            .unwrap_or_default()
+    }
+
+    pub(super) fn language(&self, id: usize) -> &str {
+        let record = &self.records[id];
+        self.string(record.language_start, record.language_len)
+            .unwrap_or_default()
+    }
+
+    /// Binary search the path-sorted file table.
+    pub(super) fn file_id(&self, path: &str) -> Option<usize> {
+        let mut low = 0;
+        let mut high = self.records.len();
+        while low < high {
+            let mid = low + (high - low) / 2;
+            match self.path(mid).cmp(path) {
+                std::cmp::Ordering::Less => low = mid + 1,
+                std::cmp::Ordering::Greater => high = mid,
+                std::cmp::Ordering::Equal => return Some(mid),
+            }
+        }
+        None
+    }
+
+    pub(super) fn load_file(&self, id: usize) -> Result<SourceFile> {
+        let record = self.records[id];
+        let contents = self.read_at(record.contents_offset, record.contents_len)?;
+        let contents =
+            String::from_utf8(contents).context("source shard file contents are not UTF-8")?;
+        let lines_len = record
+            .line_count
+            .checked_mul(8)
+            .context("source shard line table is corrupt")?;
+        let lines = self.read_at(record.lines_offset, lines_len)?;
+        let line_offsets = lines
+            .chunks_exact(8)
+            .enumerate()
+            .map(|(idx, word)| LineOffset {
+                line: idx as u64 + 1,
+                byte_start: u64_at(word, 0) as usize,
+            })
+            .collect();
+        Ok(SourceFile {
+            path: self.path(id).to_string(),
+            language: self.language(id).to_string(),
+            contents,
+            line_offsets,
+        })
+    }
+
+    pub(super) fn outline_entries(&self) -> Result<Vec<OutlineEntry>> {
+        let bytes = self.read_at(self.header.outline.offset, self.header.outline.len)?;
+        serde_json::from_slice(&bytes).context("failed to parse source shard outline")
+    }
+
+    pub(super) fn symbols(&self) -> Result<Vec<SymbolEntry>> {
+        let bytes = self.read_at(self.header.symbols.offset, self.header.symbols.len)?;
+        serde_json::from_slice(&bytes).context("failed to parse source shard symbols")
+    }
+
+    /// File ids whose folded text holds every trigram of `literal`, ascending.
+    /// `None` means the literal is too short to narrow anything.
+    pub(super) fn literal_candidates(&self, literal: &str) -> Result<Option<Vec<u32>>> {
+        let folded = fold_case(literal);
+        if folded.len() < 3 {
+            return Ok(None);
+        }
+        let keys = folded
+            .as_bytes()
+            .windows(3)
+            .map(trigram_key)
+            .collect::<BTreeSet<_>>();
+        let mut candidates: Option<Vec<u32>> = None;
+        for key in keys {
+            let postings = self.postings(key)?;
+            let narrowed = match candidates {
+                Some(current) => intersect_sorted(&current, &postings),
+                None => postings,
+            };
+            if narrowed.is_empty() {
+                return Ok(Some(narrowed));
+            }
+            candidates = Some(narrowed);
+        }
+        Ok(candidates)
+    }
+
+    /// Expand the whole shard back into memory, for incremental rebuilds.
+    pub(super) fn into_shard(self) -> Result<SourceShard> {
+        let files = (0..self.records.len())
+            .map(|id| self.load_file(id))
+            .collect::<Result<Vec<_>>>()?;
+        let outline_entries = self.outline_entries()?;
+        let symbols = self.symbols()?;
+        Ok(SourceShard {
+            schema_version: self.meta.schema_version,
+            manifest: self.meta.manifest,
+            files,
+            outline_entries,
+            symbols,
+            ctags_status: self.meta.ctags_status,
+            skipped: self.meta.skipped,
+        })
+    }
+
+    fn postings(&self, key: u32) -> Result<Vec<u32>> {
+        let mut low = 0;
+        let mut high = self.header.trigrams.len;
+        while low < high {
+            let mid = low + (high - low) / 2;
+            let record = self.read_at(
+                self.header.trigrams.offset + mid * TRIGRAM_RECORD_LEN as u64,
+                TRIGRAM_RECORD_LEN as u64,
+            )?;
+            let found = u32_at(&record, 0);
+            match found.cmp(&key) {
+                std::cmp::Ordering::Less => low = mid + 1,
+                std::cmp::Ordering::Greater => high = mid,
+                std::cmp::Ordering::Equal => {
+                    let count = u64::from(u32_at(&record, 4));
+                    let ids = self.read_at(u64_at(&record, 8), count * 4)?;
+                    return Ok(ids.chunks_exact(4).map(|id| u32_at(id, 0)).collect());
+                }
+            }
+        }
+        Ok(Vec::new())
+    }
+
+    fn string(&self, start: usize, len: usize) -> Option<&str> {
+        self.strings.get(start..start.checked_add(len)?)
+    }
+
+    fn read_at(&self, offset: u64, len: u64) -> Result<Vec<u8>> {
+        read_at(&self.file, self.file_len, offset, len)
+    }
+}
+
+fn read_section(file: &File, file_len: u64, section: Section) -> Result<Vec<u8>> {
+    read_at(file, file_len, section.offset, section.len)
+}
+
+fn read_at(mut file: &File, file_len: u64, offset: u64, len: u64) -> Result<Vec<u8>> {
+    if offset.checked_add(len).is_none_or(|end| end > file_len) {
+        bail!("source shard is truncated");
+    }
+    let mut bytes = vec![0; usize::try_from(len).context("source shard section is too large")?];
+    file.seek(SeekFrom::Start(offset))
+        .context("failed to seek source shard")?;
+    file.read_exact(&mut bytes)
+        .context("failed to read source shard")?;
+    Ok(bytes)
+}
+
+/// Intersect two candidate sets where `None` stands for every file.
+pub(super) fn intersect_candidates(
+    left: Option<Vec<u32>>,
+    right: Option<Vec<u32>>,
+) -> Option<Vec<u32>> {
+    match (left, right) {
+        (Some(left), Some(right)) => Some(intersect_sorted(&left, &right)),
+        (Some(only), None) | (None, Some(only)) => Some(only),
+        (None, None) => None,
+    }
+}
+
+/// Union two candidate sets where `None` stands for every file.
+pub(super) fn union_candidates(
+    left: Option<Vec<u32>>,
+    right: Option<Vec<u32>>,
+) -> Option<Vec<u32>> {
+    let (left, right) = (left?, right?);
+    let mut merged = Vec::with_capacity(left.len() + right.len());
+    let (mut l, mut r) = (0, 0);
+    while l < left.len() || r < right.len() {
+        let next = match (left.get(l), right.get(r)) {
+            (Some(a), Some(b)) if a == b => {
+                l += 1;
+                r += 1;
+                *a
+            }
+            (Some(a), Some(b)) if a < b => {
+                l += 1;
+                *a
+            }
+            (Some(_), Some(b)) | (None, Some(b)) => {
+                r += 1;
+                *b
+            }
+            (Some(a), None) => {
+                l += 1;
+                *a
+            }
+            (None, None) => break,
+        };
+        merged.push(next);
+    }
+    Some(merged)
+}
+
+fn intersect_sorted(left: &[u32], right: &[u32]) -> Vec<u32> {
+    let mut out = Vec::with_capacity(left.len().min(right.len()));
+    let (mut l, mut r) = (0, 0);
+    while l < left.len() && r < right.len() {
+        match left[l].cmp(&right[r]) {
+            std::cmp::Ordering::Less => l += 1,
+            std::cmp::Ordering::Greater => r += 1,
+            std::cmp::Ordering::Equal => {
+                out.push(left[l]);
+                l += 1;
+                r += 1;
+            }
+        }
+    }
+    out
+}
+
+/// ASCII literal runs that every match of `pattern` must contain. Conservative:
+/// alternation, inline flags, groups, classes, and quantified atoms drop out, so
+/// an empty result only means the pattern cannot narrow candidates.
+pub(super) fn regex_required_literals(pattern: &str) -> Vec<String> {
+    if pattern.contains('|') || pattern.contains("(?") {
+        return Vec::new();
+    }
+    let mut literals = Vec::new();
+    let mut run = String::new();
+    let mut depth = 0usize;
+    let mut chars = pattern.chars().peekable();
+    while let Some(ch) = chars.next() {
+        match ch {
+            '\\' => {
+                let Some(escaped) = chars.next() else {
+                    break;
+                };
+                if escaped.is_ascii_alphanumeric() {
+                    flush_literal(&mut literals, &mut run);
+                    match escaped {
+                        'x' | 'u' | 'U' | 'p' | 'P' if chars.peek() == Some(&'{') => {
+                            for next in chars.by_ref() {
+                                if next == '}' {
+                                    break;
+                                }
+                            }
+                        }
+                        'x' => skip_chars(&mut chars, 2),
+                        'u' => skip_chars(&mut chars, 4),
+                        'U' => skip_chars(&mut chars, 8),
+                        'p' | 'P' => skip_chars(&mut chars, 1),
+                        _ => {}
+                    }
+                } else if depth == 0 && escaped.is_ascii() {
+                    run.push(escaped);
+                } else {
+                    flush_literal(&mut literals, &mut run);
+                }
+            }
+            '?' | '*' | '{' => {
+                run.pop();
+                flush_literal(&mut literals, &mut run);
+                if ch == '{' {
+                    for next in chars.by_ref() {
+                        if next == '}' {
+                            break;
+                        }
+                    }
+                }
+            }
+            '[' => {
+                flush_literal(&mut literals, &mut run);
+                skip_class(&mut chars);
+            }
+            '(' => {
+                flush_literal(&mut literals, &mut run);
+                depth += 1;
+            }
+            ')' => {
+                flush_literal(&mut literals, &mut run);
+                depth = depth.saturating_sub(1);
+            }
+            '+' | '.' | '^' | '$' => flush_literal(&mut literals, &mut run),
+            _ if depth == 0 && ch.is_ascii() && !ch.is_ascii_control() => run.push(ch),
+            _ => flush_literal(&mut literals, &mut run),
+        }
+    }
+    flush_literal(&mut literals, &mut run);
+    literals
+}
+
+fn flush_literal(literals: &mut Vec<String>, run: &mut String) {
+    if run.len() >= 3 {
+        literals.push(run.clone());
+    }
+    run.clear();
+}
+
+fn skip_chars(chars: &mut std::iter::Peekable<std::str::Chars<'_>>, count: usize) {
+    for _ in 0..count {
+        chars.next();
+    }
+}
+
+fn skip_class(chars: &mut std::iter::Peekable<std::str::Chars<'_>>) {
+    let mut depth = 1usize;
+    let mut first = true;
+    if chars.peek() == Some(&'^') {
+        chars.next();
+    }
+    while let Some(ch) = chars.next() {
+        match ch {
+            '\\' => {
+                chars.next();
+            }
+            ']' if first => {}
+            '[' => depth += 1,
+            ']' => {
+                depth -= 1;
+                if depth == 0 {
+                    return;
+                }
+            }
+            _ => {}
+        }
+        first = false;
+    }
+}
+
+/// Per-char lowercase, plus the one non-ASCII simple case fold onto ASCII that
+/// lowercasing misses (`ſ` -> `s`), so the index stays a superset for `case:no`.
+pub(super) fn fold_case(text: &str) -> String {
+    text.chars()
+        .flat_map(char::to_lowercase)
+        .map(|ch| if ch == 'ſ' { 's' } else { ch })
+        .collect()
+}
+
+fn file_trigrams(path: &str, contents: &str) -> HashSet<u32> {
+    let mut folded = fold_case(path);
+    folded.push('\n');
+    folded.push_str(&fold_case(contents));
+    folded.as_bytes().windows(3).map(trigram_key).collect()
+}
+
+fn trigram_key(window: &[u8]) -> u32 {
+    (u32::from(window[0]) << 16) | (u32::from(window[1]) << 8) | u32::from(window[2])
+}
+
+fn u64_at(bytes: &[u8], at: usize) -> u64 {
+    let mut word = [0; 8];
+    word.copy_from_slice(&bytes[at..at + 8]);
+    u64::from_le_bytes(word)
+}
+
+fn u32_at(bytes: &[u8], at: usize) -> u32 {
+    let mut word = [0; 4];
+    word.copy_from_slice(&bytes[at..at + 4]);
+    u32::from_le_bytes(word)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn regex_required_literals_skip_optional_and_grouped_atoms() {
+        assert_eq!(regex_required_literals(r"runtime_\w+"), vec!["runtime_"]);
+        assert_eq!(
+            regex_required_literals(r"fn\s+serve_http"),
+            vec!["serve_http"]
+        );
+        assert_eq!(regex_required_literals(r"colou?rful"), vec!["colo", "rful"]);
+        assert_eq!(regex_required_literals(r"\x41bcdef"), vec!["bcdef"]);
+        assert_eq!(regex_required_literals(r"a[xyz]+bcd(efg)?"), vec!["bcd"]);
+        assert!(regex_required_literals(r"alpha|beta").is_empty());
+        assert!(regex_required_literals(r"(?x) a b c").is_empty());
+    }
+
+    #[test]
+    fn candidate_sets_treat_none_as_every_file() {
+        assert_eq!(
+            intersect_candidates(Some(vec![1, 3, 5]), Some(vec![3, 4, 5])),
+            Some(vec![3, 5])
+        );
+        assert_eq!(intersect_candidates(None, Some(vec![2])), Some(vec![2]));
+        assert_eq!(
+            union_candidates(Some(vec![1, 5]), Some(vec![2, 5, 7])),
+            Some(vec![1, 2, 5, 7])
+        );
+        assert_eq!(union_candidates(Some(vec![1]), None), None);
+    }
+
+    #[test]
+    fn case_fold_keeps_literal_trigrams_a_superset() {
+        let folded = fold_case("HTTPServer ſtate");
+        assert_eq!(folded, "httpserver state");
+        assert!(file_trigrams("src/lib.rs", "HTTPServer").contains(&trigram_key(b"tps")));
+    }
+}
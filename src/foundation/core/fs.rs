@@ -1,9 +1,10 @@
+use std::collections::BTreeMap;
 use std::fs::{self, File, OpenOptions};
 use std::io::{ErrorKind, Read, Seek, SeekFrom, Write};
 use std::path::{Path, PathBuf};
 use std::process;
 use std::sync::atomic::{AtomicU64, Ordering};
-use std::time::{Duration, SystemTime};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
 
 use anyhow::{Context, Result, bail};
 
@@ -437,6 +438,75 @@ pub(crate) fn sorted_child_dirs(parent: &Path) -> Result<Vec<PathBuf>> {
     Ok(dirs)
 }
 
+/// `(mtime_ns, len)` of every listed file and of every file under the listed
+/// trees, keyed by path. Missing paths are skipped, so a file appearing or
+/// vanishing changes the map as surely as a write does; comparing two maps is
+/// the passive freshness check long-lived readers poll with.
+pub(crate) fn stat_fingerprint(
+    files: &[PathBuf],
+    trees: &[PathBuf],
+) -> Result<BTreeMap<PathBuf, (u128, u64)>> {
+    let mut stamps = BTreeMap::new();
+    for file in files {
+        match fs::symlink_metadata(file) {
+            Ok(metadata) => {
+                stamps.insert(file.clone(), stamp(&metadata));
+            }
+            Err(error) if error.kind() == ErrorKind::NotFound => {}
+            Err(error) => {
+                return Err(error).with_context(|| format!("failed to stat {}", file.display()));
+            }
+        }
+    }
+    let mut pending = trees.to_vec();
+    while let Some(dir) = pending.pop() {
+        let Some(entries) = read_child_entries(&dir)? else {
+            continue;
+        };
+        for entry in entries {
+            let entry = entry.with_context(|| format!("failed to read {}", dir.display()))?;
+            let metadata = match entry.metadata() {
+                Ok(metadata) => metadata,
+                // Removed between the listing and the stat.
+                Err(error) if error.kind() == ErrorKind::NotFound => continue,
+                Err(error) => {
+                    return Err(error)
+                        .with_context(|| format!("failed to stat {}", entry.path().display()));
+                }
+            };
+            if metadata.is_dir() {
+                pending.push(entry.path());
+            } else {
+                stamps.insert(entry.path(), stamp(&metadata));
+            }
+        }
+    }
+    Ok(stamps)
+}
+
+/// A file's identity across renames and rewrites: the inode on Unix. Elsewhere
+/// every file reads as `0`, so identity checks there rely on their other
+/// guards alone.
+#[cfg(unix)]
+pub(crate) fn file_identity(metadata: &fs::Metadata) -> u64 {
+    use std::os::unix::fs::MetadataExt;
+    metadata.ino()
+}
+
+#[cfg(not(unix))]
+pub(crate) fn file_identity(_metadata: &fs::Metadata) -> u64 {
+    0
+}
+
+fn stamp(metadata: &fs::Metadata) -> (u128, u64) {
+    let mtime_ns = metadata
+        .modified()
+        .ok()
+        .and_then(|modified| modified.duration_since(UNIX_EPOCH).ok())
+        .map_or(0, |elapsed| elapsed.as_nanos());
+    (mtime_ns, metadata.len())
+}
+
 /// Read a YAML file and require a top-level mapping.
 pub(crate) fn read_yaml_mapping(path: &Path) -> Result<serde_yaml::Mapping> {
     let raw =
@@ -4,6 +4,8 @@ use std::path::{Path, PathBuf};
 use anyhow::{Context, Result, bail};
 use git2::{Oid, Repository, StatusOptions};
 
+use crate::foundation::core::profile;
+
 /// Current Git state needed by proof freshness and migration checks.
 #[derive(Clone, Debug, Eq, PartialEq)]
 pub struct GitSnapshot {
@@ -48,6 +50,7 @@ pub struct ReplacementDurability {
 
 /// Read the current Git HEAD and dirty state for the repository containing `path`.
 pub fn snapshot(path: impl AsRef<Path>) -> Result<GitSnapshot> {
+    let _phase = profile::phase("git.snapshot");
     let repository = discover_repository(path.as_ref())?;
     let counts = dirty_counts(&repository)?;
 
@@ -67,6 +70,7 @@ pub fn snapshot(path: impl AsRef<Path>) -> Result<GitSnapshot> {
 /// local `main`/`master`, or the shared ref cannot be resolved. Callers treat
 /// that as "no advisory" rather than an error.
 pub fn branch_divergence(path: impl AsRef<Path>) -> Result<Option<BranchDivergence>> {
+    let _phase = profile::phase("git.divergence");
     let repository = discover_repository(path.as_ref())?;
     let branch = branch_name(&repository)?;
     let Some(head) = head_commit_oid(&repository)? else {
@@ -94,6 +98,26 @@ pub fn head(path: impl AsRef<Path>) -> Result<Option<String>> {
     head_oid(&repository)
 }
 
+/// Files whose writes move HEAD, a ref, or the index of the repository
+/// containing `path`: HEAD and the index in the worktree's git dir, plus
+/// `packed-refs` and the `refs/` tree in the common dir, as `(files, trees)`.
+/// Both are empty outside a repository.
+pub fn ref_state_paths(path: impl AsRef<Path>) -> Result<(Vec<PathBuf>, Vec<PathBuf>)> {
+    let Some(repository) = discover_optional_repository(path.as_ref())? else {
+        return Ok((Vec::new(), Vec::new()));
+    };
+    let git_dir = repository.path();
+    let common_dir = repository.commondir();
+    Ok((
+        vec![
+            git_dir.join("HEAD"),
+            git_dir.join("index"),
+            common_dir.join("packed-refs"),
+        ],
+        vec![common_dir.join("refs")],
+    ))
+}
+
 /// Return whether the repository containing `path` has tracked or untracked changes.
 pub fn dirty(path: impl AsRef<Path>) -> Result<bool> {
     let repository = discover_repository(path.as_ref())?;
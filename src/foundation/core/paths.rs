@@ -79,6 +79,11 @@ impl MaestroPaths {
         self.maestro_dir().join("store.sqlite")
     }
 
+    /// Return the socket `maestro hook serve` listens on.
+    pub fn hook_socket_file(&self) -> PathBuf {
+        self.maestro_dir().join("hook.sock")
+    }
+
     /// Return the editable workbench root for reopening finalized DB-backed cards.
     pub fn workbench_dir(&self) -> PathBuf {
         self.maestro_dir().join("workbench")
@@ -132,6 +137,16 @@ impl MaestroPaths {
         self.index_dir().join("text.json")
     }
 
+    /// Return the indexed card read model behind `ready` and `list`.
+    pub fn card_read_model_file(&self) -> PathBuf {
+        self.index_dir().join("cards.sqlite")
+    }
+
+    /// Return the per-reader run event log checkpoints directory.
+    pub fn run_checkpoints_dir(&self) -> PathBuf {
+        self.index_dir().join("runs")
+    }
+
     /// Return the unified grep/search index directory.
     pub fn search_index_dir(&self) -> PathBuf {
         self.index_dir().join("search")
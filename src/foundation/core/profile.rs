@@ -0,0 +1,234 @@
+//! Opt-in per-phase profiling for the CLI hot paths.
+//!
+//! `MAESTRO_PROFILE=1` (or the hidden global `--profile` flag) turns it on for
+//! one process. Hot code marks a phase with `let _phase = phase("card.scan");`
+//! and the guard adds the phase's wall time and allocations to a process-wide
+//! table when it drops. A phase opened inside another is keyed by its path
+//! (`status.harness/runs.replay`), so a parent's totals include its children.
+//! [`report`] writes the table to stderr as one JSON document; stdout stays
+//! byte-identical with profiling on.
+//!
+//! Allocations are counted by [`CountingAlloc`], which the binary installs as
+//! its global allocator. The counters are process-wide: a phase also counts
+//! what other threads allocated while it ran. Disabled, a phase costs one
+//! relaxed atomic load and the allocator one more per call.
+
+use std::alloc::{GlobalAlloc, Layout, System};
+use std::cell::RefCell;
+use std::collections::BTreeMap;
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Mutex, OnceLock, PoisonError};
+use std::time::{Duration, Instant};
+
+use serde_json::{Value, json};
+
+/// Environment variable that turns profiling on for one process.
+pub const PROFILE_ENV: &str = "MAESTRO_PROFILE";
+const PROFILE_SCHEMA: &str = "maestro.profile.v1";
+
+static ENABLED: AtomicBool = AtomicBool::new(false);
+static STARTED: OnceLock<Instant> = OnceLock::new();
+static ALLOCATIONS: AtomicU64 = AtomicU64::new(0);
+static ALLOCATED_BYTES: AtomicU64 = AtomicU64::new(0);
+static PHASES: Mutex<BTreeMap<String, PhaseTotals>> = Mutex::new(BTreeMap::new());
+
+thread_local! {
+    /// The phases open on this thread, outermost first.
+    static OPEN: RefCell<Vec<&'static str>> = const { RefCell::new(Vec::new()) };
+}
+
+#[derive(Default)]
+struct PhaseTotals {
+    calls: u64,
+    elapsed: Duration,
+    allocations: u64,
+    allocated_bytes: u64,
+}
+
+/// Whether `MAESTRO_PROFILE` asks for profiling: any value but empty, `0`, or
+/// `false`.
+pub fn requested_by_env() -> bool {
+    std::env::var(PROFILE_ENV).is_ok_and(|value| {
+        let value = value.trim();
+        !value.is_empty() && value != "0" && !value.eq_ignore_ascii_case("false")
+    })
+}
+
+/// Start profiling this process. The report's wall time counts from the
+/// first call.
+pub fn enable() {
+    STARTED.get_or_init(Instant::now);
+    ENABLED.store(true, Ordering::Relaxed);
+}
+
+pub fn enabled() -> bool {
+    ENABLED.load(Ordering::Relaxed)
+}
+
+/// Open the phase `name` until the returned guard drops. Names are dotted
+/// `area.step` labels; a no-op unless profiling is on.
+#[must_use = "the phase closes when the guard drops"]
+pub fn phase(name: &'static str) -> Phase {
+    if !enabled() {
+        return Phase { open: None };
+    }
+    let path = OPEN.with(|open| {
+        let mut open = open.borrow_mut();
+        open.push(name);
+        open.join("/")
+    });
+    Phase {
+        open: Some(OpenPhase {
+            path,
+            started: Instant::now(),
+            allocations: ALLOCATIONS.load(Ordering::Relaxed),
+            allocated_bytes: ALLOCATED_BYTES.load(Ordering::Relaxed),
+        }),
+    }
+}
+
+/// Run `f` as the phase `name`, for a phase that is one expression.
+pub fn timed<T>(name: &'static str, f: impl FnOnce() -> T) -> T {
+    let _phase = phase(name);
+    f()
+}
+
+/// Guard returned by [`phase`].
+pub struct Phase {
+    open: Option<OpenPhase>,
+}
+
+struct OpenPhase {
+    path: String,
+    started: Instant,
+    allocations: u64,
+    allocated_bytes: u64,
+}
+
+impl Drop for Phase {
+    fn drop(&mut self) {
+        let Some(open) = self.open.take() else {
+            return;
+        };
+        let elapsed = open.started.elapsed();
+        let allocations = ALLOCATIONS.load(Ordering::Relaxed) - open.allocations;
+        let allocated_bytes = ALLOCATED_BYTES.load(Ordering::Relaxed) - open.allocated_bytes;
+        OPEN.with(|stack| {
+            stack.borrow_mut().pop();
+        });
+        let mut phases = PHASES.lock().unwrap_or_else(PoisonError::into_inner);
+        let totals = phases.entry(open.path).or_default();
+        totals.calls += 1;
+        totals.elapsed += elapsed;
+        totals.allocations += allocations;
+        totals.allocated_bytes += allocated_bytes;
+    }
+}
+
+/// The profile of everything recorded so far, or `None` when profiling is
+/// off. `command` is the subcommand path the process ran (`card list`).
+pub fn snapshot(command: &str) -> Option<Value> {
+    if !enabled() {
+        return None;
+    }
+    let elapsed = STARTED.get().map(Instant::elapsed).unwrap_or_default();
+    let phases = PHASES.lock().unwrap_or_else(PoisonError::into_inner);
+    Some(json!({
+        "schema": PROFILE_SCHEMA,
+        "command": command,
+        "total_ms": millis(elapsed),
+        "allocations": ALLOCATIONS.load(Ordering::Relaxed),
+        "allocated_bytes": ALLOCATED_BYTES.load(Ordering::Relaxed),
+        "phases": phases
+            .iter()
+            .map(|(path, totals)| {
+                (
+                    path.clone(),
+                    json!({
+                        "calls": totals.calls,
+                        "total_ms": millis(totals.elapsed),
+                        "allocations": totals.allocations,
+                        "allocated_bytes": totals.allocated_bytes,
+                    }),
+                )
+            })
+            .collect::<serde_json::Map<_, _>>(),
+    }))
+}
+
+/// Write [`snapshot`] to stderr as one line of JSON; nothing when profiling
+/// is off.
+pub fn report(command: &str) {
+    if let Some(profile) = snapshot(command) {
+        eprintln!("{profile}");
+    }
+}
+
+fn millis(duration: Duration) -> f64 {
+    duration.as_secs_f64() * 1000.0
+}
+
+/// The system allocator, counting allocations and requested bytes while
+/// profiling is on. The `maestro` binary installs it as its
+/// `#[global_allocator]`.
+pub struct CountingAlloc;
+
+impl CountingAlloc {
+    #[inline]
+    fn count(size: usize) {
+        if ENABLED.load(Ordering::Relaxed) {
+            ALLOCATIONS.fetch_add(1, Ordering::Relaxed);
+            ALLOCATED_BYTES.fetch_add(size as u64, Ordering::Relaxed);
+        }
+    }
+}
+
+// SAFETY: every call is forwarded unchanged to `System`; the counters are
+// lock-free atomics that never allocate.
+unsafe impl GlobalAlloc for CountingAlloc {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        Self::count(layout.size());
+        // SAFETY: the caller upholds `GlobalAlloc::alloc`'s contract.
+        unsafe { System.alloc(layout) }
+    }
+
+    unsafe fn alloc_zeroed(&self, layout: Layout) -> *mut u8 {
+        Self::count(layout.size());
+        // SAFETY: the caller upholds `GlobalAlloc::alloc_zeroed`'s contract.
+        unsafe { System.alloc_zeroed(layout) }
+    }
+
+    unsafe fn realloc(&self, ptr: *mut u8, layout: Layout, new_size: usize) -> *mut u8 {
+        Self::count(new_size);
+        // SAFETY: the caller upholds `GlobalAlloc::realloc`'s contract.
+        unsafe { System.realloc(ptr, layout, new_size) }
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        // SAFETY: the caller upholds `GlobalAlloc::dealloc`'s contract.
+        unsafe { System.dealloc(ptr, layout) }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn nested_phases_are_keyed_by_path_and_counted_per_call() {
+        enable();
+        {
+            let _outer = phase("test.outer");
+            for _ in 0..2 {
+                let _inner = phase("test.inner");
+            }
+        }
+        let profile = snapshot("test").expect("profiling is on");
+        assert_eq!(profile["schema"], PROFILE_SCHEMA);
+        assert_eq!(profile["command"], "test");
+        assert_eq!(profile["phases"]["test.outer"]["calls"], 1);
+        assert_eq!(profile["phases"]["test.outer/test.inner"]["calls"], 2);
+        assert!(profile["phases"].get("test.inner").is_none());
+        OPEN.with(|open| assert!(open.borrow().is_empty()));
+    }
+}
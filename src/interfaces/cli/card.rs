@@ -33,8 +33,8 @@ pub fn ready(args: ReadyArgs) -> Result<()> {
         }
         return Ok(());
     };
-    let cards = card::query::scan(&paths)?;
-    let mut ready = card::query::ready(&cards);
+    let cards = card::read_model::ready(&paths)?;
+    let mut ready: Vec<&card::schema::Card> = cards.iter().collect();
     if let Some(feature) = args.feature.as_deref() {
         ready.retain(|c| c.parent.as_deref() == Some(feature));
     }
@@ -87,7 +87,7 @@ pub fn list(args: ListArgs) -> Result<()> {
     // term too short or indexes unavailable -- falls back to the plain scan.
     let candidates = grep.and_then(|term| grep_candidates(&paths, term));
     let candidates = candidates.as_ref();
-    let live = card::query::scan_with_paths(&paths)?;
+    let live = card::read_model::query(&paths, &filter)?;
     let archived = if args.archived {
         card::query::scan_archived_with_paths(&paths)?
     } else {
@@ -4,6 +4,19 @@ use crate::domain::search;
 use crate::foundation::core::paths::{MaestroPaths, discover_repo_root};
 use crate::interfaces::cli::GrepArgs;
 
+/// Marker error for a rejected query whose diagnostics are already on stderr;
+/// the process exits with status 2.
+#[derive(Debug)]
+pub struct QueryRejected;
+
+impl std::fmt::Display for QueryRejected {
+    fn fmt(&self, formatter: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        formatter.write_str("grep query rejected")
+    }
+}
+
+impl std::error::Error for QueryRejected {}
+
 pub fn run(args: GrepArgs) -> Result<()> {
     let repo_root = discover_repo_root()?;
     let paths = MaestroPaths::new(repo_root);
@@ -18,7 +31,7 @@ pub fn run(args: GrepArgs) -> Result<()> {
         for diagnostic in &envelope.diagnostics {
             eprintln!("{}: {}", diagnostic.code, diagnostic.message);
         }
-        std::process::exit(2);
+        return Err(QueryRejected.into());
     }
     Ok(())
 }
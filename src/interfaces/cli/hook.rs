@@ -1,13 +1,19 @@
+use std::collections::{BTreeMap, HashMap};
+use std::path::PathBuf;
+
 use anyhow::{Context, Result};
+use serde::{Deserialize, Serialize};
 use serde_json::{Value, json};
 
 use crate::domain::run::{self, RecordOutcome};
 use crate::domain::task;
+use crate::foundation::core::fs::stat_fingerprint;
 use crate::foundation::core::paths::{MaestroPaths, discover_repo_root};
-use crate::foundation::core::session::agent_runtime_from_env;
+use crate::foundation::core::profile;
+use crate::foundation::core::session::{agent_runtime_from_env, known_agent_runtime};
 use crate::foundation::core::time::utc_now_timestamp;
 use crate::interfaces::cli::{HookArgs, HookCommand};
-use crate::interfaces::hooks::record;
+use crate::interfaces::hooks::{daemon, record};
 use crate::operations::harness;
 
 /// Event kinds that fire ~once per meaningful action, so the echo can afford a
@@ -24,18 +30,160 @@ pub fn run(args: HookArgs) -> Result<()> {
         } => {
             let result = discover_repo_root()
                 .map(MaestroPaths::new)
-                .and_then(|paths| record_hook(&paths, event, skill, session));
-            if let Err(error) = result {
-                if error.is::<ProgressSetupBlock>() {
-                    return Err(error);
+                .and_then(|paths| {
+                    let request = HookRequest::capture(event, skill, session)?;
+                    Ok(forward(&paths, &request)
+                        .unwrap_or_else(|| handle(&paths, request, &mut ProgressIndex::one_shot())))
+                });
+            match result {
+                Ok(reply) => reply.emit(),
+                Err(error) => {
+                    eprintln!("maestro hook record warning: {error:#}");
+                    Ok(())
                 }
-                eprintln!("maestro hook record warning: {error:#}");
             }
-            Ok(())
+        }
+        HookCommand::Serve => {
+            let paths = MaestroPaths::new(discover_repo_root()?);
+            let mut progress = ProgressIndex::watched();
+            daemon::serve(&paths, |raw| {
+                let reply = match serde_json::from_slice::<HookRequest>(raw) {
+                    Ok(request) => handle(&paths, request, &mut progress),
+                    Err(error) => HookReply::warning(
+                        anyhow::Error::new(error).context("failed to parse hook daemon request"),
+                    ),
+                };
+                println!("served {}", reply.summary());
+                serde_json::to_vec(&reply).unwrap_or_default()
+            })
+        }
+    }
+}
+
+/// Everything one `hook record` invocation reads from its own process -- flags,
+/// stdin, and env -- captured up front so a daemon-served record decides
+/// exactly as the in-process path would.
+#[derive(Debug, Deserialize, Serialize)]
+struct HookRequest {
+    event: Option<String>,
+    skill: Option<String>,
+    session: Option<String>,
+    payload: Option<Value>,
+    /// `MAESTRO_CURRENT_TASK`.
+    current_task: Option<String>,
+    agent_runtime: Option<String>,
+    actor: String,
+    run_id: String,
+}
+
+impl HookRequest {
+    fn capture(
+        event: Option<String>,
+        skill: Option<String>,
+        session: Option<String>,
+    ) -> Result<Self> {
+        Ok(Self {
+            event,
+            skill,
+            session,
+            payload: record::optional_stdin_payload()?,
+            current_task: current_task_id(),
+            agent_runtime: agent_runtime_from_env().map(str::to_string),
+            actor: super::actor(),
+            run_id: super::cli_run_id(),
+        })
+    }
+
+    fn agent_runtime(&self) -> Option<&'static str> {
+        self.agent_runtime.as_deref().and_then(known_agent_runtime)
+    }
+}
+
+/// What a record prints, and the Progress block that fails the hook, if any.
+#[derive(Debug, Default, Deserialize, Serialize)]
+struct HookReply {
+    stdout: String,
+    stderr: String,
+    block: Option<String>,
+}
+
+impl HookReply {
+    fn warning(error: anyhow::Error) -> Self {
+        let mut reply = Self::default();
+        reply.warn(format_args!("maestro hook record warning: {error:#}"));
+        reply
+    }
+
+    /// One line naming what the reply did, for the daemon's request log.
+    fn summary(&self) -> &str {
+        if self.block.is_some() {
+            "blocked"
+        } else if let Some(line) = self.stdout.lines().next() {
+            line
+        } else if !self.stderr.is_empty() {
+            "warning"
+        } else {
+            "nothing to record"
+        }
+    }
+
+    fn out(&mut self, line: std::fmt::Arguments<'_>) {
+        self.stdout.push_str(&line.to_string());
+        self.stdout.push('\n');
+    }
+
+    fn warn(&mut self, line: std::fmt::Arguments<'_>) {
+        self.stderr.push_str(&line.to_string());
+        self.stderr.push('\n');
+    }
+
+    fn emit(self) -> Result<()> {
+        print!("{}", self.stdout);
+        eprint!("{}", self.stderr);
+        match self.block {
+            Some(message) => Err(progress_setup_block(message)),
+            None => Ok(()),
         }
     }
 }
 
+/// Hand `request` to a running `maestro hook serve`, when one answers. `None`
+/// means no daemon took it and the caller records it in-process; once a daemon
+/// has the request, a lost or unreadable reply is a warning, never a second
+/// recording.
+fn forward(paths: &MaestroPaths, request: &HookRequest) -> Option<HookReply> {
+    let _phase = profile::phase("hook.forward");
+    let raw = serde_json::to_vec(request).ok()?;
+    match daemon::forward(paths, &raw) {
+        daemon::Forwarded::Unavailable => None,
+        daemon::Forwarded::Reply(reply) => {
+            Some(serde_json::from_slice(&reply).unwrap_or_else(|error| {
+                HookReply::warning(anyhow::Error::new(error).context(
+                    "hook daemon sent an unreadable reply; the event was not recorded again",
+                ))
+            }))
+        }
+        daemon::Forwarded::Lost(reason) => Some(HookReply::warning(anyhow::anyhow!(
+            "hook daemon took the request but its reply was lost ({reason}); \
+             the event was not recorded again"
+        ))),
+    }
+}
+
+/// Record one hook request, turning a Progress block into the reply's block
+/// and any other failure into the warn-and-continue line.
+fn handle(paths: &MaestroPaths, request: HookRequest, progress: &mut ProgressIndex) -> HookReply {
+    let _phase = profile::phase("hook.record");
+    let mut reply = HookReply::default();
+    if let Err(error) = record_hook(paths, request, progress, &mut reply) {
+        match error.downcast::<ProgressSetupBlock>() {
+            Ok(block) => reply.block = Some(block.0),
+            Err(error) => reply.warn(format_args!("maestro hook record warning: {error:#}")),
+        }
+    }
+    reply
+}
+
 #[derive(Debug)]
 struct ProgressSetupBlock(String);
 
@@ -53,33 +201,46 @@ fn progress_setup_block(message: String) -> anyhow::Error {
 
 fn record_hook(
     paths: &MaestroPaths,
-    event: Option<String>,
-    skill: Option<String>,
-    session: Option<String>,
+    request: HookRequest,
+    progress: &mut ProgressIndex,
+    reply: &mut HookReply,
 ) -> Result<()> {
-    let skill_for_ack = skill.clone();
-    let stdin_payload = record::optional_stdin_payload()?;
-    let outcome = match event {
+    let agent_runtime = request.agent_runtime();
+    let skill_for_ack = request.skill.clone();
+    let outcome = match request.event {
         Some(event) => {
-            let session_id = session
-                .or_else(|| stdin_payload.as_ref().and_then(record::payload_session_id))
-                .unwrap_or_else(super::cli_run_id);
+            let session_id = request
+                .session
+                .or_else(|| {
+                    request
+                        .payload
+                        .as_ref()
+                        .and_then(record::payload_session_id)
+                })
+                .unwrap_or(request.run_id);
             let mut payload = json!({
                 "event": event,
                 "session_id": session_id,
-                "agent": super::actor(),
+                "agent": request.actor,
             });
-            if let Some(skill) = skill {
+            if let Some(skill) = request.skill {
                 payload["skill_name"] = json!(skill);
             }
-            record::record_value(paths, &payload)?
+            record_value(paths, &payload, agent_runtime, reply)?
         }
         None => {
-            let Some(payload) = stdin_payload else {
+            let Some(payload) = request.payload else {
                 return Ok(());
             };
-            ensure_auto_progress_for_hook(paths, &payload)?;
-            record::record_value(paths, &payload)?
+            ensure_auto_progress_for_hook(
+                paths,
+                &payload,
+                request.current_task.as_deref(),
+                agent_runtime,
+                progress,
+                reply,
+            )?;
+            record_value(paths, &payload, agent_runtime, reply)?
         }
     };
     if let RecordOutcome::Recorded {
@@ -95,29 +256,59 @@ fn record_hook(
                 skill_for_ack,
                 session_id.as_deref(),
                 &run_dir,
+                reply,
             );
         } else {
-            println!("recorded {event_type} -> runs/{run_dir}");
+            reply.out(format_args!("recorded {event_type} -> runs/{run_dir}"));
         }
     }
     Ok(())
 }
 
-fn ensure_auto_progress_for_hook(paths: &MaestroPaths, payload: &Value) -> Result<()> {
+/// [`record::record_value`] with the requesting process's agent runtime, its
+/// ignored-payload notice routed into `reply`.
+fn record_value(
+    paths: &MaestroPaths,
+    payload: &Value,
+    agent_runtime: Option<&str>,
+    reply: &mut HookReply,
+) -> Result<RecordOutcome> {
+    let outcome = profile::timed("hook.append", || {
+        run::record_hook_event(paths, payload, agent_runtime)
+    })?;
+    if let Some(notice) = record::ignored_notice(&outcome) {
+        reply.warn(format_args!("{notice}"));
+    }
+    Ok(outcome)
+}
+
+fn ensure_auto_progress_for_hook(
+    paths: &MaestroPaths,
+    payload: &Value,
+    current_task_id: Option<&str>,
+    agent_runtime: Option<&str>,
+    progress: &mut ProgressIndex,
+    reply: &mut HookReply,
+) -> Result<()> {
     if !is_write_like_pre_tool_use(payload) {
         return Ok(());
     }
-    if let Some(current_task_id) = current_task_id() {
-        return ensure_current_progress_allows_write(paths, &current_task_id);
+    let _phase = profile::phase("hook.progress");
+    if let Some(current_task_id) = current_task_id {
+        if let Some(active) = progress.refresh(paths)?.by_task.get(current_task_id) {
+            ensure_progress_allows_write(active)?;
+        }
+        return Ok(());
     }
     let Some(session_id) = record::payload_session_id(payload) else {
         return Ok(());
     };
-    let (agent, actor) = auto_progress_actor(payload, &session_id);
+    let (agent, actor) = auto_progress_actor(payload, agent_runtime, &session_id);
     let title = auto_progress_title(payload, &session_id);
-    if let Some(progress) = active_progress_for_actor(paths, &actor)? {
-        ensure_progress_allows_write(&progress)?;
-        emit_card_touch_for_session(paths, &progress.card_id, &session_id, &agent);
+    if let Some(active) = progress.refresh(paths)?.by_actor.get(&actor) {
+        ensure_progress_allows_write(active)?;
+        let card_id = active.card_id.clone();
+        emit_card_touch_for_session(paths, &card_id, &session_id, &agent, agent_runtime, reply);
         return Ok(());
     }
     Err(progress_setup_block(format!(
@@ -139,23 +330,82 @@ struct ProgressRow {
     task: task::TaskRecord,
 }
 
-fn ensure_current_progress_allows_write(paths: &MaestroPaths, current_task_id: &str) -> Result<()> {
-    if let Some(progress) = progress_for_task(paths, current_task_id)? {
-        ensure_progress_allows_write(&progress)?;
-    }
-    Ok(())
+/// Progress rows indexed by claiming actor (in-progress rows only) and by
+/// task id, the first matching row winning as in a linear scan. A one-shot
+/// index loads once per record; the daemon's watched index reloads only when
+/// the stat fingerprint of the card store has moved since its last load.
+#[derive(Default)]
+struct ProgressIndex {
+    watched: bool,
+    loaded: bool,
+    fingerprint: Option<BTreeMap<PathBuf, (u128, u64)>>,
+    by_actor: HashMap<String, ActiveProgress>,
+    by_task: HashMap<String, ActiveProgress>,
 }
 
-fn active_progress_for_actor(paths: &MaestroPaths, actor: &str) -> Result<Option<ActiveProgress>> {
-    let rows = progress_rows(paths)?;
-    Ok(active_progress_from_rows(&rows, |task| {
-        task.state == task::TaskState::InProgress && task.claimed_by.as_deref() == Some(actor)
-    }))
+impl ProgressIndex {
+    fn one_shot() -> Self {
+        Self::default()
+    }
+
+    fn watched() -> Self {
+        Self {
+            watched: true,
+            ..Self::default()
+        }
+    }
+
+    fn refresh(&mut self, paths: &MaestroPaths) -> Result<&Self> {
+        let fingerprint = if self.watched {
+            Some(store_fingerprint(paths)?)
+        } else {
+            None
+        };
+        if !self.loaded || fingerprint != self.fingerprint {
+            self.loaded = false;
+            self.load(paths)?;
+            self.fingerprint = fingerprint;
+            self.loaded = true;
+        }
+        Ok(self)
+    }
+
+    fn load(&mut self, paths: &MaestroPaths) -> Result<()> {
+        let rows = progress_rows(paths)?;
+        let mut total_tasks: HashMap<&str, usize> = HashMap::new();
+        for row in &rows {
+            *total_tasks.entry(row.card_id.as_str()).or_default() += 1;
+        }
+        self.by_actor.clear();
+        self.by_task.clear();
+        for row in &rows {
+            let active = || ActiveProgress {
+                card_id: row.card_id.clone(),
+                task: row.task.clone(),
+                total_tasks: total_tasks[row.card_id.as_str()],
+            };
+            if row.task.state == task::TaskState::InProgress
+                && let Some(actor) = row.task.claimed_by.as_deref()
+            {
+                self.by_actor
+                    .entry(actor.to_string())
+                    .or_insert_with(active);
+            }
+            self.by_task
+                .entry(row.task.id.clone())
+                .or_insert_with(active);
+        }
+        Ok(())
+    }
 }
 
-fn progress_for_task(paths: &MaestroPaths, task_id: &str) -> Result<Option<ActiveProgress>> {
-    let rows = progress_rows(paths)?;
-    Ok(active_progress_from_rows(&rows, |task| task.id == task_id))
+/// `(mtime_ns, len)` of every file the Progress scan can read: the card tree
+/// and the live store DB with its write-ahead log.
+fn store_fingerprint(paths: &MaestroPaths) -> Result<BTreeMap<PathBuf, (u128, u64)>> {
+    let db = paths.store_db_file();
+    let mut wal = db.clone().into_os_string();
+    wal.push("-wal");
+    stat_fingerprint(&[db, PathBuf::from(wal)], &[paths.cards_dir()])
 }
 
 fn progress_rows(paths: &MaestroPaths) -> Result<Vec<ProgressRow>> {
@@ -175,22 +425,6 @@ fn progress_rows(paths: &MaestroPaths) -> Result<Vec<ProgressRow>> {
     Ok(rows)
 }
 
-fn active_progress_from_rows(
-    rows: &[ProgressRow],
-    predicate: impl Fn(&task::TaskRecord) -> bool,
-) -> Option<ActiveProgress> {
-    let row = rows.iter().find(|row| predicate(&row.task))?;
-    let total_tasks = rows
-        .iter()
-        .filter(|candidate| candidate.card_id == row.card_id)
-        .count();
-    Some(ActiveProgress {
-        card_id: row.card_id.clone(),
-        task: row.task.clone(),
-        total_tasks,
-    })
-}
-
 fn ensure_progress_allows_write(progress: &ActiveProgress) -> Result<()> {
     if progress.total_tasks >= 2 {
         return Ok(());
@@ -238,9 +472,13 @@ fn payload_event_type(payload: &Value) -> Option<&str> {
         .find_map(|field| payload.get(field).and_then(Value::as_str))
 }
 
-fn auto_progress_actor(payload: &Value, session_id: &str) -> (String, String) {
+fn auto_progress_actor(
+    payload: &Value,
+    agent_runtime: Option<&str>,
+    session_id: &str,
+) -> (String, String) {
     let agent = string_field(payload, "agent")
-        .or_else(|| agent_runtime_from_env().map(str::to_string))
+        .or_else(|| agent_runtime.map(str::to_string))
         .unwrap_or_else(|| "maestro".to_string());
     let actor = format!("{agent}#{session_id}");
     (agent, actor)
@@ -269,15 +507,24 @@ fn string_field(payload: &Value, field: &str) -> Option<String> {
         .map(str::to_string)
 }
 
-fn emit_card_touch_for_session(paths: &MaestroPaths, card_id: &str, session_id: &str, agent: &str) {
+fn emit_card_touch_for_session(
+    paths: &MaestroPaths,
+    card_id: &str,
+    session_id: &str,
+    agent: &str,
+    agent_runtime: Option<&str>,
+    reply: &mut HookReply,
+) {
     let payload = json!({
         "event": "card_touch",
         "session_id": session_id,
         "card_id": card_id,
         "agent": agent,
     });
-    if let Err(error) = record::record_value(paths, &payload) {
-        eprintln!("maestro hook record warning: auto-progress card_touch failed: {error:#}");
+    if let Err(error) = record_value(paths, &payload, agent_runtime, reply) {
+        reply.warn(format_args!(
+            "maestro hook record warning: auto-progress card_touch failed: {error:#}"
+        ));
     }
 }
 
@@ -291,21 +538,27 @@ fn print_verbose_block(
     skill: Option<String>,
     session_id: Option<&str>,
     run_dir: &str,
+    reply: &mut HookReply,
 ) {
-    println!("recorded: {event_type}");
+    reply.out(format_args!("recorded: {event_type}"));
     if event_type == "skill_activation"
         && let Some(skill) = skill
     {
-        println!("  skill:   {skill}");
+        reply.out(format_args!("  skill:   {skill}"));
     }
-    println!("  session: {}", session_id.unwrap_or("unattributed"));
+    reply.out(format_args!(
+        "  session: {}",
+        session_id.unwrap_or("unattributed")
+    ));
     if let Some(card) = session_id.and_then(|session| bound_card(paths, session)) {
-        println!("  card:    {card}");
+        reply.out(format_args!("  card:    {card}"));
     }
-    println!("  -> runs/{run_dir}");
-    println!("  tip:     maestro active  (see other live sessions)");
+    reply.out(format_args!("  -> runs/{run_dir}"));
+    reply.out(format_args!(
+        "  tip:     maestro active  (see other live sessions)"
+    ));
     if let Ok(readout) = harness::complete_readout(paths) {
-        println!("  {}", readout.hook_trace_summary_line());
+        reply.out(format_args!("  {}", readout.hook_trace_summary_line()));
     }
 }
 
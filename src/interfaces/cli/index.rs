@@ -32,6 +32,9 @@ pub fn run(args: IndexArgs) -> Result<()> {
                     report.archived_docs
                 );
                 println!("  file: .maestro/index/text.json");
+                let report = card::read_model::rebuild(&paths)?;
+                println!("  read model rebuilt: {} cards", report.cards);
+                println!("  file: .maestro/index/cards.sqlite");
                 println!("next: maestro card list --grep <word> [--archived]");
             }
             if rebuild_memory {
@@ -41,6 +44,10 @@ pub fn run(args: IndexArgs) -> Result<()> {
                     "  docs: {} ({} live cards, {} archived cards, {} run evidence)",
                     report.docs, report.live_docs, report.archived_docs, report.run_evidence_docs
                 );
+                println!(
+                    "  incremental: {} reused, {} rebuilt",
+                    report.reused_docs, report.rebuilt_docs
+                );
                 println!("  file: .maestro/index/search/memory.shard");
             }
             if rebuild_source {
@@ -50,6 +57,10 @@ pub fn run(args: IndexArgs) -> Result<()> {
                     "  files: {} indexed, {} skipped",
                     report.indexed_files, report.skipped_files
                 );
+                println!(
+                    "  incremental: {} reused, {} reparsed",
+                    report.reused_files, report.reparsed_files
+                );
                 println!("  outline entries: {}", report.outline_entries);
                 if report.ctags_status.available {
                     println!("  ctags symbols: {}", report.ctags_symbols);
@@ -288,8 +288,8 @@ fn run_work_lease(args: WorkLeaseArgs) -> Result<()> {
         return Ok(());
     }
 
-    let cards = card::query::scan(&paths)?;
-    let mut ready = card::query::ready(&cards);
+    let cards = card::read_model::ready(&paths)?;
+    let mut ready: Vec<&card::schema::Card> = cards.iter().collect();
     if let Some(feature) = args.feature.as_deref() {
         ready.retain(|candidate| candidate.parent.as_deref() == Some(feature));
     }
@@ -9,7 +9,7 @@ use anyhow::{Context, Result, bail};
 use crate::foundation::core::paths::{MaestroPaths, discover_repo_root};
 use crate::interfaces::cli::{MissionControlArgs, MissionControlFormat, MissionControlRenderer};
 use crate::interfaces::tui::mission_control::{
-    PreviewFormat, PreviewScreen, RenderOptions, render_check, render_preview, snapshot,
+    PreviewFormat, PreviewScreen, RenderOptions, render_check, render_preview, snapshot, stream,
 };
 
 pub fn run(args: MissionControlArgs) -> Result<()> {
@@ -22,6 +22,10 @@ pub fn run(args: MissionControlArgs) -> Result<()> {
         return Ok(());
     }
 
+    if args.stream {
+        return stream(&paths, &mut std::io::stdout().lock());
+    }
+
     if should_use_opentui(&args) {
         run_opentui(&paths, &args, size)?;
         return Ok(());
@@ -61,6 +65,7 @@ fn should_use_opentui(args: &MissionControlArgs) -> bool {
         && args.screen.is_none()
         && !args.render_check
         && !args.json
+        && !args.stream
 }
 
 fn run_opentui(
@@ -16,6 +16,7 @@ use crate::domain::task::{TaskRecord, TaskState};
 use crate::foundation::core::error::MaestroError;
 use crate::foundation::core::git;
 use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
 use crate::interfaces::hooks::record;
 
 pub mod active;
@@ -300,6 +301,10 @@ pub(crate) fn proof_concern_line(paths: &MaestroPaths, task: &TaskRecord) -> Opt
 pub struct Cli {
     #[command(subcommand)]
     pub command: RootCommand,
+    /// Print per-phase timings and allocations as JSON on stderr (same as
+    /// MAESTRO_PROFILE=1).
+    #[arg(long, global = true, hide = true)]
+    pub profile: bool,
 }
 
 #[derive(Debug, Subcommand)]
@@ -2412,7 +2417,8 @@ pub enum IndexCommand {
         /// Rebuild only the repo-source grep shard.
         #[arg(long, conflicts_with_all = ["memory", "cards"])]
         source: bool,
-        /// Rebuild the legacy card grep text index plus the memory/card shard.
+        /// Rebuild the legacy card grep text index, the card read model, and the
+        /// memory/card shard.
         #[arg(long, conflicts_with_all = ["memory", "source"])]
         cards: bool,
     },
@@ -2496,6 +2502,15 @@ pub struct MissionControlArgs {
     /// Validate supported preview screens and report JSON.
     #[arg(long, conflicts_with_all = ["json", "preview", "screen", "feature", "format"])]
     pub render_check: bool,
+    /// Stream the snapshot as JSON lines: one full snapshot, then a diff of the changed
+    /// sections each time cards, the store, run logs, or git refs settle after a write.
+    #[arg(
+        long,
+        conflicts_with_all = [
+            "json", "preview", "screen", "feature", "format", "size", "render_check", "renderer"
+        ]
+    )]
+    pub stream: bool,
 }
 
 #[derive(Clone, Copy, Debug, Eq, PartialEq, ValueEnum)]
@@ -2529,6 +2544,11 @@ pub enum HookCommand {
         )]
         session: Option<String>,
     },
+    #[command(
+        about = "Serve `hook record` from a persistent daemon on .maestro/hook.sock (opt-in)",
+        after_help = "Examples:\n  maestro hook serve   # run until stopped; hook record forwards to it\n\n`maestro hook record` records in-process whenever no daemon answers, with the same allow/deny decisions. Unix only."
+    )]
+    Serve,
 }
 
 pub fn run(cli: Cli) -> Result<()> {
@@ -2540,6 +2560,7 @@ pub fn run(cli: Cli) -> Result<()> {
         cli.command,
         RootCommand::Hook(_) | RootCommand::Mcp(_) | RootCommand::Version
     ) {
+        let _phase = profile::phase("cli.banners");
         let _ = msg::inbox_banner();
         let _ = active::overlap_banner();
         let _ = conflict::conflict_banner();
@@ -24,7 +24,7 @@ use anyhow::{Context, Result, anyhow, bail};
 use serde_json::{Value, json};
 
 use crate::domain::card;
-use crate::domain::channel::{self, Channel, ChannelKind, DeliveryReceipt, Message};
+use crate::domain::channel::{self, Channel, ChannelHead, ChannelKind, DeliveryReceipt, Message};
 use crate::domain::run::{self, Presence};
 use crate::foundation::core::paths::{MaestroPaths, discover_repo_root};
 use crate::foundation::core::time::utc_now_timestamp;
@@ -364,13 +364,13 @@ fn read(scope: Option<&str>) -> Result<()> {
     let paths = MaestroPaths::new(discover_repo_root()?);
     let me = current_card(&paths)?;
     let me_card = resolve_card(&paths, &me)?;
-    let channels = visible_channels_union(&paths, &me_card)?;
-    let legacy_channels = legacy_task_channels_union(&paths, &me_card)?;
-    let selected: Vec<&Channel> = channels
+    let heads = visible_channel_heads(&paths, &me_card)?;
+    let legacy_heads = legacy_task_channel_heads(&paths, &me_card)?;
+    let selected: Vec<&ChannelHead> = heads
         .iter()
-        .filter(|channel| scope.is_none_or(|target| channel.address(&me) == target))
+        .filter(|head| scope.is_none_or(|target| head.kind.address(&me) == target))
         .collect();
-    let selected_legacy: Vec<&LegacyTaskChannel> = legacy_channels
+    let selected_legacy: Vec<&LegacyTaskChannel<ChannelHead>> = legacy_heads
         .iter()
         .filter(|channel| scope.is_none_or(|target| channel.matches_scope(target)))
         .collect();
@@ -379,11 +379,12 @@ fn read(scope: Option<&str>) -> Result<()> {
         println!("{}", empty_note(scope));
         return Ok(());
     }
-    for channel in selected {
-        read_channel(&paths, &me, channel)?;
+    let roots = worktree_roots(&paths);
+    for head in selected {
+        read_channel(&paths, &roots, &me, head)?;
     }
     for channel in selected_legacy {
-        read_legacy_task_channel(&paths, &me, channel)?;
+        read_legacy_task_channel(&paths, &roots, &me, channel)?;
     }
     Ok(())
 }
@@ -463,7 +464,7 @@ fn list(scope: Option<&str>) -> Result<()> {
                 .iter()
                 .filter(|channel| channel.address(&me) == target)
                 .collect();
-            let selected_legacy: Vec<&LegacyTaskChannel> = legacy_channels
+            let selected_legacy: Vec<&LegacyTaskChannel<Channel>> = legacy_channels
                 .iter()
                 .filter(|channel| channel.matches_scope(target))
                 .collect();
@@ -488,53 +489,58 @@ fn list(scope: Option<&str>) -> Result<()> {
 /// Print one channel's context + unread block for `read`, then advance the
 /// cursor to EOF. Always shows context and a `(no new messages)` line when
 /// nothing is unread, so a repeat read still surfaces the recent conversation.
-fn read_channel(paths: &MaestroPaths, me: &str, channel: &Channel) -> Result<()> {
-    let at = cursor(paths, channel, me)?;
-    let unread = channel.unread(me, at.as_deref());
-    let seen = channel.seen_context(me, at.as_deref(), CONTEXT_LIMIT);
+/// Only the bytes past the cursor are parsed, plus a bounded window before it
+/// for the context.
+fn read_channel(
+    paths: &MaestroPaths,
+    roots: &[MaestroPaths],
+    me: &str,
+    head: &ChannelHead,
+) -> Result<()> {
+    let Some(read) = channel::read_since_cursor(roots, head, me, CONTEXT_LIMIT)? else {
+        return Ok(());
+    };
 
-    println!("{}:", channel.address(me));
-    for message in &seen {
+    println!("{}:", head.kind.address(me));
+    for message in &read.context {
         println!(
             "  . {}{}  {}",
-            line_speaker(channel, me, message),
+            line_speaker(&head.kind, me, message),
             message.ts,
             message.text
         );
     }
-    if unread.is_empty() {
+    if read.unread.is_empty() {
         println!("  (no new messages)");
     } else {
-        for message in &unread {
+        for message in &read.unread {
             println!(
                 "  * {}{}  {}",
-                line_speaker(channel, me, message),
+                line_speaker(&head.kind, me, message),
                 message.ts,
                 message.text
             );
         }
         print_task_ordering_hint();
     }
-    channel::set_cursor_to_latest(paths, channel, me)?;
-    Ok(())
+    channel::mark_read(paths, &read, me)
 }
 
 fn read_legacy_task_channel(
     paths: &MaestroPaths,
+    roots: &[MaestroPaths],
     me: &str,
-    channel: &LegacyTaskChannel,
+    channel: &LegacyTaskChannel<ChannelHead>,
 ) -> Result<()> {
-    let at = cursor(paths, &channel.channel, me)?;
-    let unread = channel.channel.unread(me, at.as_deref());
-    let seen = channel
-        .channel
-        .seen_context(me, at.as_deref(), CONTEXT_LIMIT);
+    let Some(read) = channel::read_since_cursor(roots, &channel.channel, me, CONTEXT_LIMIT)? else {
+        return Ok(());
+    };
 
     println!(
         "legacy task-addressed channel about {} with {} (read-only; reply via parent Card {}):",
         channel.task_id, channel.partner, me
     );
-    for message in &seen {
+    for message in &read.context {
         println!(
             "  . {}  {}  {}",
             legacy_line_speaker(me, message),
@@ -542,10 +548,10 @@ fn read_legacy_task_channel(
             message.text
         );
     }
-    if unread.is_empty() {
+    if read.unread.is_empty() {
         println!("  (no new messages)");
     } else {
-        for message in &unread {
+        for message in &read.unread {
             println!(
                 "  * {}  {}  {}",
                 legacy_line_speaker(me, message),
@@ -555,8 +561,7 @@ fn read_legacy_task_channel(
         }
         print_task_ordering_hint();
     }
-    channel::set_cursor_to_latest(paths, &channel.channel, me)?;
-    Ok(())
+    channel::mark_read(paths, &read, me)
 }
 
 fn list_channel_timeline(
@@ -589,7 +594,7 @@ fn list_channel_timeline(
 fn list_legacy_task_channel(
     paths: &MaestroPaths,
     me: &str,
-    channel: &LegacyTaskChannel,
+    channel: &LegacyTaskChannel<Channel>,
 ) -> Result<()> {
     println!(
         "legacy task-addressed channel about {} with {} (read-only; reply via parent Card {}):",
@@ -649,8 +654,8 @@ fn print_task_ordering_hint() {
 /// header already names the partner); a feature channel labels each line with its
 /// sender (`you` for the viewer, else the sender card id) so a multi-party thread
 /// is never collapsed to a single "from them".
-fn line_speaker(channel: &Channel, me: &str, message: &Message) -> String {
-    match &channel.kind {
+fn line_speaker(kind: &ChannelKind, me: &str, message: &Message) -> String {
+    match kind {
         ChannelKind::Pair(_) => String::new(),
         ChannelKind::Feature(_) => {
             let who = if message.from_card == me {
@@ -681,17 +686,19 @@ pub(super) fn inbox_banner() -> Result<()> {
         return Ok(());
     };
 
+    // Counted from the membership index and each file's bytes past the
+    // cursor, so a quiet inbox costs a few small reads however long the
+    // channel histories are.
+    let roots = worktree_roots(&paths);
     let mut counts: Vec<(String, usize)> = Vec::new();
-    for channel in visible_channels_union(&paths, &me_card.card)? {
-        let at = cursor(&paths, &channel, &me)?;
-        let unread = channel.unread(&me, at.as_deref()).len();
+    for head in visible_channel_heads(&paths, &me_card.card)? {
+        let unread = channel::unread_count_union(&roots, &head.key, &me)?;
         if unread > 0 {
-            counts.push((channel.address(&me).to_string(), unread));
+            counts.push((head.kind.address(&me).to_string(), unread));
         }
     }
-    for channel in legacy_task_channels_union(&paths, &me_card.card)? {
-        let at = cursor(&paths, &channel.channel, &me)?;
-        let unread = channel.channel.unread(&me, at.as_deref()).len();
+    for channel in legacy_task_channel_heads(&paths, &me_card.card)? {
+        let unread = channel::unread_count_union(&roots, &channel.channel.key, &me)?;
         if unread > 0 {
             counts.push((
                 format!("legacy task {} with {}", channel.task_id, channel.partner),
@@ -719,35 +726,52 @@ pub(super) fn inbox_banner() -> Result<()> {
 /// local), so `read`/`list` union those files by ts to show the full thread
 /// (`dec-msg-send-local-read-union-cross-worktree`). The link gate is checked
 /// against the LOCAL card store -- relatedness is a property of my card here.
-fn visible_channels_union(paths: &MaestroPaths, me: &card::schema::Card) -> Result<Vec<Channel>> {
+fn visible_channel_heads(
+    paths: &MaestroPaths,
+    me: &card::schema::Card,
+) -> Result<Vec<ChannelHead>> {
     let roots = worktree_roots(paths);
     let mut visible = Vec::new();
-    for channel in channel::channels_for_union(&roots, &me.id)? {
-        let Some(partner) = channel.pair_partner(&me.id) else {
+    for head in channel::heads_for_union(&roots, &me.id)? {
+        let Some(partner) = head.kind.pair_partner(&me.id) else {
             continue;
         };
         if card::query::pair_linked(paths, me, partner)? {
-            visible.push(channel);
+            visible.push(head);
         }
     }
     // The running card's feature broadcast channel: membership is the live parent
-    // edge, checked by construction here (we load only my own feature's channel),
-    // so no link is required and a non-member never reaches it.
+    // edge, checked by construction here (we look up only my own feature's
+    // channel), so no link is required and a non-member never reaches it.
     if let Some(feature_id) = card::query::feature_of(me)
-        && let Some(channel) = channel::load_feature_union(&roots, feature_id)?
+        && let Some(head) = channel::feature_head_union(&roots, feature_id)?
     {
-        visible.push(channel);
+        visible.push(head);
     }
     Ok(visible)
 }
 
-struct LegacyTaskChannel {
+/// [`visible_channel_heads`] loaded in full, for `list`.
+fn visible_channels_union(paths: &MaestroPaths, me: &card::schema::Card) -> Result<Vec<Channel>> {
+    let roots = worktree_roots(paths);
+    let mut channels = Vec::new();
+    for head in visible_channel_heads(paths, me)? {
+        if let Some(channel) = channel::load_union_by_key(&roots, &head.key)? {
+            channels.push(channel);
+        }
+    }
+    Ok(channels)
+}
+
+/// A legacy task-addressed channel: `channel` is its [`ChannelHead`] for
+/// `read` and the banner, or the loaded [`Channel`] for `list`.
+struct LegacyTaskChannel<C> {
     task_id: String,
     partner: String,
-    channel: Channel,
+    channel: C,
 }
 
-impl LegacyTaskChannel {
+impl<C> LegacyTaskChannel<C> {
     fn matches_scope(&self, target: &str) -> bool {
         self.partner == target || self.task_id == target
     }
@@ -756,10 +780,10 @@ impl LegacyTaskChannel {
 /// Read-only compatibility for old transitional channels that were addressed to
 /// a child Task id. New sends to Task ids are rejected, but a parent Card still
 /// needs a recovery surface for history that already exists on disk.
-fn legacy_task_channels_union(
+fn legacy_task_channel_heads(
     paths: &MaestroPaths,
     me: &card::schema::Card,
-) -> Result<Vec<LegacyTaskChannel>> {
+) -> Result<Vec<LegacyTaskChannel<ChannelHead>>> {
     let roots = worktree_roots(paths);
     let mut seen = BTreeSet::new();
     let mut visible = Vec::new();
@@ -776,20 +800,21 @@ fn legacy_task_channels_union(
     }
 
     for task_id in task_ids {
-        for channel in channel::channels_for_union(&roots, &task_id)? {
-            let Some(partner) = channel
+        for head in channel::heads_for_union(&roots, &task_id)? {
+            let Some(partner) = head
+                .kind
                 .pair_partner(&task_id)
                 .map(std::string::ToString::to_string)
             else {
                 continue;
             };
-            if !seen.insert((task_id.clone(), channel.key.clone())) {
+            if !seen.insert((task_id.clone(), head.key.clone())) {
                 continue;
             }
             visible.push(LegacyTaskChannel {
                 task_id: task_id.clone(),
                 partner,
-                channel,
+                channel: head,
             });
         }
     }
@@ -797,6 +822,25 @@ fn legacy_task_channels_union(
     Ok(visible)
 }
 
+/// [`legacy_task_channel_heads`] loaded in full, for `list`.
+fn legacy_task_channels_union(
+    paths: &MaestroPaths,
+    me: &card::schema::Card,
+) -> Result<Vec<LegacyTaskChannel<Channel>>> {
+    let roots = worktree_roots(paths);
+    let mut channels = Vec::new();
+    for legacy in legacy_task_channel_heads(paths, me)? {
+        if let Some(channel) = channel::load_union_by_key(&roots, &legacy.channel.key)? {
+            channels.push(LegacyTaskChannel {
+                task_id: legacy.task_id,
+                partner: legacy.partner,
+                channel,
+            });
+        }
+    }
+    Ok(channels)
+}
+
 fn cursor(paths: &MaestroPaths, channel: &Channel, me: &str) -> Result<Option<String>> {
     channel::cursor_union(&worktree_roots(paths), &channel.key, me)
 }
@@ -569,8 +569,7 @@ fn compute_run_status(
     last_activity: Option<&str>,
     now_nanos: i128,
 ) -> Result<run::RunStatus> {
-    let cards = card::query::scan(paths)?;
-    let ready = card::query::ready(&cards).len();
+    let ready = card::read_model::ready(paths)?.len();
 
     let entries = task::load_task_entries(&paths.tasks_dir())?;
     let features = feature::list_with_entries(paths, &entries)?;
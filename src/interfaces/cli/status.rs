@@ -9,6 +9,7 @@ use crate::domain::feature::{self, FeatureRosterEntry, FeatureStatus};
 use crate::domain::task::{self, TaskRecord, TaskState};
 use crate::domain::{card, gate_lock, loop_recipes as loop_recipe_domain};
 use crate::foundation::core::paths::{MaestroPaths, discover_repo_root};
+use crate::foundation::core::profile::timed;
 use crate::foundation::core::table;
 use crate::foundation::core::time::{timestamp_nanos, utc_now_timestamp};
 use crate::interfaces::cli::{
@@ -623,10 +624,14 @@ fn focal_proof_concern(
 fn build_status_report(paths: &MaestroPaths) -> Result<StatusReport> {
     // One task scan feeds both the report and the per-feature counts inside the
     // roster (list_tolerant would otherwise re-scan the same cards).
-    let task_entries = task::load_task_entries(&paths.tasks_dir())?;
+    let task_entries = timed("status.tasks", || {
+        task::load_task_entries(&paths.tasks_dir())
+    })?;
     let mut features = Vec::new();
     let mut unreadable_features = Vec::new();
-    for entry in feature::list_tolerant_with_entries(paths, &task_entries) {
+    for entry in timed("status.features", || {
+        feature::list_tolerant_with_entries(paths, &task_entries)
+    }) {
         match entry {
             FeatureRosterEntry::Loaded(view) => features.push(*view),
             FeatureRosterEntry::Unreadable {
@@ -698,28 +703,36 @@ fn build_status_report(paths: &MaestroPaths) -> Result<StatusReport> {
         _ => None,
     };
 
-    let mut rows = Vec::new();
-    for task in &live_tasks {
-        rows.push(TaskRowJson {
-            id: task.id.clone(),
-            state: task_state_label(task),
-            title: task.title.clone(),
-            next: compact_next(paths, task)?,
-            inspect: format!("maestro task show {}", task.id),
-            project: task.project.clone(),
-        });
-    }
+    let rows = timed("status.task_rows", || {
+        live_tasks
+            .iter()
+            .map(|task| -> Result<TaskRowJson> {
+                Ok(TaskRowJson {
+                    id: task.id.clone(),
+                    state: task_state_label(task),
+                    title: task.title.clone(),
+                    next: compact_next(paths, task)?,
+                    inspect: format!("maestro task show {}", task.id),
+                    project: task.project.clone(),
+                })
+            })
+            .collect::<Result<Vec<_>>>()
+    })?;
 
     let next_action = match current_task_action {
         Some(action) => Some(action),
-        None => choose_next_task_action(paths, &live_tasks)?,
+        None => timed("status.next_action", || {
+            choose_next_task_action(paths, &live_tasks)
+        })?,
     };
     let proof_concern = focal_proof_concern(paths, next_action.as_ref(), &live_tasks);
     let ready_to_close_features = ready_to_close_features(&features);
     let now_nanos = timestamp_nanos(&utc_now_timestamp()).unwrap_or(0);
     let mut active_features = active_feature_rows(paths, &features, now_nanos);
-    let worktree_actions = worktree_actions(paths, &features)?;
-    let progress = progress_status_rows(paths, &task_entries)?;
+    let worktree_actions = timed("status.worktrees", || worktree_actions(paths, &features))?;
+    let progress = timed("status.progress", || {
+        progress_status_rows(paths, &task_entries)
+    })?;
     for (id, path, error, hint, _) in unreadable_features {
         warnings.push(WarningJson {
             code: "feature_unreadable".to_string(),
@@ -735,21 +748,30 @@ fn build_status_report(paths: &MaestroPaths) -> Result<StatusReport> {
             stale_proposed: false,
         });
     }
-    let harness_friction = harness::over_threshold_items(paths)?
-        .into_iter()
-        .map(HarnessFrictionJson::from)
-        .collect::<Vec<_>>();
-    let audit_hint = harness::audit_overdue_hint(paths)?.map(AuditHintJson::from);
-    let complete_harness = harness::complete_readout(paths)?;
-    let approved_memory =
-        memory::approved_memory(paths, MemoryReadSurface::Status, MemoryReadScope::default())?;
-    let memory_suggestions =
-        memory::suggestion_hints(paths, MemoryReadSurface::Status, MemoryReadScope::default())?;
+    let harness_friction = timed("status.harness_friction", || {
+        harness::over_threshold_items(paths)
+    })?
+    .into_iter()
+    .map(HarnessFrictionJson::from)
+    .collect::<Vec<_>>();
+    let audit_hint = timed("status.harness_audit", || {
+        harness::audit_overdue_hint(paths)
+    })?
+    .map(AuditHintJson::from);
+    let complete_harness = timed("status.harness_readout", || {
+        harness::complete_readout(paths)
+    })?;
+    let approved_memory = timed("status.memory", || {
+        memory::approved_memory(paths, MemoryReadSurface::Status, MemoryReadScope::default())
+    })?;
+    let memory_suggestions = timed("status.memory_hints", || {
+        memory::suggestion_hints(paths, MemoryReadSurface::Status, MemoryReadScope::default())
+    })?;
     let sections = StatusSectionsJson {
         ready_to_close: ready_to_close_features.clone(),
     };
-    let git = git_readout(paths);
-    let merge_lock_holder = gate_lock::merge_holder(paths);
+    let git = timed("status.git", || git_readout(paths));
+    let merge_lock_holder = timed("status.merge_lock", || gate_lock::merge_holder(paths));
     // The next verb is close/verify-shaped when the chosen task action is a proof
     // or completion step, or a feature is ready to close (`feature_close` never
     // appears as a task `next_action.kind`; it lives in ready_to_close_features).
@@ -759,13 +781,15 @@ fn build_status_report(paths: &MaestroPaths) -> Result<StatusReport> {
             "complete_task" | "done_task" | "proof_recovery"
         )
     }) || !ready_to_close_features.is_empty();
-    let loop_hint = match super::loop_recipes::build_loop_next_report_from_snapshot(
-        paths,
-        &task_entries,
-        &features,
-        git.as_ref(),
-        Vec::new(),
-    ) {
+    let loop_hint = match timed("status.loop_hint", || {
+        super::loop_recipes::build_loop_next_report_from_snapshot(
+            paths,
+            &task_entries,
+            &features,
+            git.as_ref(),
+            Vec::new(),
+        )
+    }) {
         Ok(report) => Some(LoopStatusHintJson::from_loop_next(&report)),
         Err(error) => {
             warnings.push(WarningJson {
@@ -0,0 +1,187 @@
+//! Unix-socket transport for `maestro hook serve`.
+//!
+//! One request per connection: the client writes a JSON request, shuts down
+//! its write half, and reads the JSON reply to EOF. The daemon gives each
+//! connection its own thread for that I/O but runs the handler under one lock,
+//! so every run-log append it makes still goes through one writer while a
+//! stalled client holds up only its own thread. The transport knows nothing
+//! about hook semantics; `cli/hook.rs` supplies the handler and the fallback.
+
+use anyhow::Result;
+
+use crate::foundation::core::paths::MaestroPaths;
+
+/// How long either end waits on the other before giving up on a connection.
+#[cfg(unix)]
+const IO_TIMEOUT: std::time::Duration = std::time::Duration::from_secs(10);
+
+/// What became of a request offered to the daemon.
+pub(crate) enum Forwarded {
+    /// No daemon took the request; the caller handles it in-process.
+    Unavailable,
+    /// The daemon's complete reply.
+    Reply(Vec<u8>),
+    /// The daemon took the whole request but no complete reply came back. It
+    /// may still act on the request, so the caller must not handle it again.
+    Lost(String),
+}
+
+/// Forward `request` to the daemon serving `paths`, if one answers. Only a
+/// request that never fully reached a daemon is [`Forwarded::Unavailable`]:
+/// a truncated request fails to parse there and is never acted on.
+#[cfg(unix)]
+pub(crate) fn forward(paths: &MaestroPaths, request: &[u8]) -> Forwarded {
+    use std::io::{Read, Write};
+    use std::net::Shutdown;
+    use std::os::unix::net::UnixStream;
+
+    let Ok(mut stream) = UnixStream::connect(paths.hook_socket_file()) else {
+        return Forwarded::Unavailable;
+    };
+    if stream
+        .set_read_timeout(Some(IO_TIMEOUT))
+        .and_then(|()| stream.set_write_timeout(Some(IO_TIMEOUT)))
+        .and_then(|()| stream.write_all(request))
+        .is_err()
+    {
+        return Forwarded::Unavailable;
+    }
+    // Delivered: the daemon may act on the request from here on, so every
+    // failure is reported rather than retried in-process.
+    if let Err(error) = stream.shutdown(Shutdown::Write) {
+        return Forwarded::Lost(format!("ending the request failed: {error}"));
+    }
+    let mut reply = Vec::new();
+    match stream.read_to_end(&mut reply) {
+        Ok(_) if !reply.is_empty() => Forwarded::Reply(reply),
+        Ok(_) => Forwarded::Lost("the daemon closed the connection without a reply".to_string()),
+        Err(error) => Forwarded::Lost(format!("reading the reply failed: {error}")),
+    }
+}
+
+#[cfg(not(unix))]
+pub(crate) fn forward(_paths: &MaestroPaths, _request: &[u8]) -> Forwarded {
+    Forwarded::Unavailable
+}
+
+/// Serve hook requests on the `paths` socket until the process is stopped.
+/// Refuses to start when another daemon already answers there; a socket file
+/// left by a daemon that died is replaced.
+#[cfg(unix)]
+pub(crate) fn serve(
+    paths: &MaestroPaths,
+    handle: impl FnMut(&[u8]) -> Vec<u8> + Send,
+) -> Result<()> {
+    use std::fs;
+    use std::os::unix::fs::DirBuilderExt;
+    use std::os::unix::net::UnixStream;
+    use std::sync::Mutex;
+    use std::thread;
+
+    use anyhow::{Context, bail};
+
+    use crate::foundation::core::fs::ensure_dir;
+
+    let socket = paths.hook_socket_file();
+    if UnixStream::connect(&socket).is_ok() {
+        bail!("a hook daemon is already serving {}", label(paths, &socket));
+    }
+    ensure_dir(paths.maestro_dir())?;
+    // `bind` creates the socket under the process umask. Bind it inside a
+    // private 0o700 directory, tighten it there, then rename it into place
+    // (replacing a stale socket), so no other user can connect in between.
+    let staging = paths
+        .maestro_dir()
+        .join(format!(".hook.sock.{}", std::process::id()));
+    let _ = fs::remove_dir_all(&staging);
+    fs::DirBuilder::new()
+        .mode(0o700)
+        .create(&staging)
+        .with_context(|| format!("failed to create {}", staging.display()))?;
+    let bound = bind_private(&staging.join("hook.sock"), &socket);
+    let _ = fs::remove_dir_all(&staging);
+    let listener = bound?;
+    println!("hook daemon serving {}", label(paths, &socket));
+    println!("  stop: Ctrl-C; `maestro hook record` falls back in-process when it is gone");
+
+    let handle = Mutex::new(handle);
+    thread::scope(|scope| {
+        for stream in listener.incoming() {
+            match stream {
+                Ok(stream) => {
+                    let handle = &handle;
+                    scope.spawn(move || answer(stream, handle));
+                }
+                Err(error) => eprintln!("maestro hook serve warning: accept failed: {error}"),
+            }
+        }
+    });
+    Ok(())
+}
+
+/// Bind at `staged`, restrict it to the owner, and move it to `socket`.
+#[cfg(unix)]
+fn bind_private(
+    staged: &std::path::Path,
+    socket: &std::path::Path,
+) -> Result<std::os::unix::net::UnixListener> {
+    use std::fs;
+    use std::os::unix::fs::PermissionsExt;
+    use std::os::unix::net::UnixListener;
+
+    use anyhow::Context;
+
+    let listener = UnixListener::bind(staged)
+        .with_context(|| format!("failed to listen on {}", socket.display()))?;
+    fs::set_permissions(staged, fs::Permissions::from_mode(0o600))
+        .with_context(|| format!("failed to restrict {}", socket.display()))?;
+    fs::rename(staged, socket)
+        .with_context(|| format!("failed to move the socket to {}", socket.display()))?;
+    Ok(listener)
+}
+
+/// Read one request, run the handler under the shared lock, write the reply.
+#[cfg(unix)]
+fn answer(
+    mut stream: std::os::unix::net::UnixStream,
+    handle: &std::sync::Mutex<impl FnMut(&[u8]) -> Vec<u8>>,
+) {
+    use std::io::{Read, Write};
+    use std::sync::PoisonError;
+
+    let mut request = Vec::new();
+    if let Err(error) = stream
+        .set_read_timeout(Some(IO_TIMEOUT))
+        .and_then(|()| stream.read_to_end(&mut request))
+    {
+        eprintln!("maestro hook serve warning: request read failed: {error}");
+        return;
+    }
+    let reply = {
+        let mut handle = handle.lock().unwrap_or_else(PoisonError::into_inner);
+        handle(&request)
+    };
+    if let Err(error) = stream
+        .set_write_timeout(Some(IO_TIMEOUT))
+        .and_then(|()| stream.write_all(&reply))
+    {
+        eprintln!("maestro hook serve warning: reply write failed: {error}");
+    }
+}
+
+#[cfg(not(unix))]
+pub(crate) fn serve(
+    _paths: &MaestroPaths,
+    _handle: impl FnMut(&[u8]) -> Vec<u8> + Send,
+) -> Result<()> {
+    anyhow::bail!("maestro hook serve needs Unix domain sockets; hook record runs in-process here")
+}
+
+#[cfg(unix)]
+fn label(paths: &MaestroPaths, socket: &std::path::Path) -> String {
+    socket
+        .strip_prefix(paths.repo_root())
+        .unwrap_or(socket)
+        .display()
+        .to_string()
+}
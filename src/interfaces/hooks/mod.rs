@@ -1,2 +1,3 @@
+pub(crate) mod daemon;
 pub mod event;
 pub mod record;
@@ -36,15 +36,21 @@ pub(crate) fn payload_session_id(payload: &Value) -> Option<String> {
 
 pub(crate) fn record_value(paths: &MaestroPaths, payload: &Value) -> Result<run::RecordOutcome> {
     let outcome = run::record_hook_event(paths, payload, agent_runtime_from_env())?;
-    if let run::RecordOutcome::Ignored { event_type } = &outcome {
-        match event_type {
-            Some(event_type) => {
-                eprintln!("maestro hook record: ignored unrecognized event type `{event_type}`");
-            }
-            None => {
-                eprintln!("maestro hook record: ignored payload with no recognizable event type");
-            }
-        }
+    if let Some(notice) = ignored_notice(&outcome) {
+        eprintln!("{notice}");
     }
     Ok(outcome)
 }
+
+/// The stderr notice for a payload the recorder ignored, if `outcome` is one.
+pub(crate) fn ignored_notice(outcome: &run::RecordOutcome) -> Option<String> {
+    let run::RecordOutcome::Ignored { event_type } = outcome else {
+        return None;
+    };
+    Some(match event_type {
+        Some(event_type) => {
+            format!("maestro hook record: ignored unrecognized event type `{event_type}`")
+        }
+        None => "maestro hook record: ignored payload with no recognizable event type".to_string(),
+    })
+}
@@ -0,0 +1,225 @@
+//! Process-level cache of read-only MCP tool responses.
+//!
+//! The server lives for a whole agent session, and agents call the same read
+//! tools over and over between writes. A response is reused while the stat
+//! fingerprint of everything a read tool can consult -- the card, task,
+//! feature, decision, and archive stores, the live DB, plus git HEAD, index,
+//! and refs -- is unchanged. Any mutating tool call drops the cache outright, and a
+//! fingerprint that moved under us (another process wrote) drops it on the
+//! next read.
+
+use std::collections::{BTreeMap, HashMap};
+use std::path::PathBuf;
+use std::sync::{Mutex, PoisonError};
+
+use anyhow::Result;
+use serde_json::Value;
+
+use crate::foundation::core::fs::stat_fingerprint;
+use crate::foundation::core::git;
+use crate::foundation::core::paths::MaestroPaths;
+
+/// Entries kept before the cache starts over; responses are small, tool and
+/// argument combinations per session are few.
+const MAX_ENTRIES: usize = 256;
+
+type Fingerprint = BTreeMap<PathBuf, (u128, u64)>;
+
+#[derive(Default)]
+pub(crate) struct ToolCache {
+    state: Mutex<CacheState>,
+}
+
+#[derive(Default)]
+struct CacheState {
+    /// The fingerprint every entry was computed under; `None` after a write.
+    fingerprint: Option<Fingerprint>,
+    entries: HashMap<(String, String), String>,
+}
+
+/// A cache probe: the hit, or what a miss needs to store its response.
+pub(crate) enum Lookup {
+    Hit(String),
+    Miss(PendingEntry),
+}
+
+pub(crate) struct PendingEntry {
+    key: (String, String),
+    fingerprint: Fingerprint,
+}
+
+impl ToolCache {
+    /// Probe for `name` called with `arguments`, first dropping every entry
+    /// if the store changed since they were computed.
+    pub(crate) fn lookup(
+        &self,
+        paths: &MaestroPaths,
+        name: &str,
+        arguments: &Value,
+    ) -> Result<Lookup> {
+        let fingerprint = read_fingerprint(paths)?;
+        let key = (name.to_string(), arguments.to_string());
+        let mut state = self.state.lock().unwrap_or_else(PoisonError::into_inner);
+        if state.fingerprint.as_ref() != Some(&fingerprint) {
+            state.entries.clear();
+            state.fingerprint = Some(fingerprint.clone());
+        }
+        Ok(match state.entries.get(&key) {
+            Some(text) => Lookup::Hit(text.clone()),
+            None => Lookup::Miss(PendingEntry { key, fingerprint }),
+        })
+    }
+
+    /// Keep a response computed after a miss, unless the store moved while
+    /// the tool ran: the response may then describe either state.
+    pub(crate) fn store(
+        &self,
+        paths: &MaestroPaths,
+        pending: PendingEntry,
+        text: &str,
+    ) -> Result<()> {
+        if read_fingerprint(paths)? != pending.fingerprint {
+            return Ok(());
+        }
+        let mut state = self.state.lock().unwrap_or_else(PoisonError::into_inner);
+        if state.fingerprint.as_ref() != Some(&pending.fingerprint) {
+            return Ok(());
+        }
+        if state.entries.len() >= MAX_ENTRIES {
+            state.entries.clear();
+        }
+        state.entries.insert(pending.key, text.to_string());
+        Ok(())
+    }
+
+    /// Drop every entry; called after each mutating tool call.
+    pub(crate) fn invalidate(&self) {
+        let mut state = self.state.lock().unwrap_or_else(PoisonError::into_inner);
+        state.entries.clear();
+        state.fingerprint = None;
+    }
+}
+
+/// `(mtime_ns, len)` of every file a cached read tool can consult: the card,
+/// task, feature, decision, and archive stores, the live DB and its WAL, and
+/// git HEAD, index, and refs. Run logs, channels, and the hook socket change on
+/// every agent action, so they stay out and an appended run event does not
+/// drop the cache. The tools that do read run logs -- `maestro_status` and
+/// `maestro_task_next` report harness friction from them -- are not read-only
+/// and are never cached.
+fn read_fingerprint(paths: &MaestroPaths) -> Result<Fingerprint> {
+    let db = paths.store_db_file();
+    let mut wal = db.clone().into_os_string();
+    wal.push("-wal");
+    let mut files = vec![db, PathBuf::from(wal), paths.decisions_file()];
+    let mut trees = vec![
+        paths.cards_dir(),
+        paths.workbench_dir(),
+        paths.tasks_dir(),
+        paths.features_dir(),
+        paths.decisions_dir(),
+        paths.archive_dir(),
+    ];
+    let (git_files, git_trees) = git::ref_state_paths(paths.repo_root())?;
+    files.extend(git_files);
+    trees.extend(git_trees);
+    stat_fingerprint(&files, &trees)
+}
+
+#[cfg(test)]
+mod tests {
+    use std::fs;
+    use std::io::Write;
+    use std::time::{SystemTime, UNIX_EPOCH};
+
+    use serde_json::json;
+
+    use super::*;
+    use crate::interfaces::mcp::tools::is_read_only;
+
+    fn temp_paths(prefix: &str) -> MaestroPaths {
+        let nanos = SystemTime::now()
+            .duration_since(UNIX_EPOCH)
+            .expect("invariant: system clock should be after the Unix epoch")
+            .as_nanos();
+        let root = std::env::temp_dir().join(format!("{prefix}-{}-{nanos}", std::process::id()));
+        fs::create_dir_all(root.join(".maestro/cards")).expect("invariant: temp dir is creatable");
+        MaestroPaths::new(root)
+    }
+
+    fn hit(cache: &ToolCache, paths: &MaestroPaths, name: &str) -> Option<String> {
+        match cache.lookup(paths, name, &json!({})).expect("lookup") {
+            Lookup::Hit(text) => Some(text),
+            Lookup::Miss(pending) => {
+                cache
+                    .store(paths, pending, &format!("{name} response"))
+                    .expect("store");
+                None
+            }
+        }
+    }
+
+    #[test]
+    fn a_run_event_appended_between_reads_keeps_the_cache_warm() {
+        let paths = temp_paths("maestro-mcp-cache-runs");
+        let cache = ToolCache::default();
+        let events = paths.runs_dir().join("session-1").join("events.jsonl");
+        fs::create_dir_all(
+            events
+                .parent()
+                .expect("invariant: events file has a parent"),
+        )
+        .expect("invariant: run dir is creatable");
+        fs::write(&events, "{\"event_type\":\"SessionStart\"}\n").expect("invariant: writable");
+        assert_eq!(hit(&cache, &paths, "maestro_card_list"), None);
+
+        let mut log = fs::OpenOptions::new()
+            .append(true)
+            .open(&events)
+            .expect("invariant: events file is appendable");
+        log.write_all(b"{\"event_type\":\"PreToolUse\"}\n")
+            .expect("invariant: writable");
+        drop(log);
+        assert_eq!(
+            hit(&cache, &paths, "maestro_card_list").as_deref(),
+            Some("maestro_card_list response")
+        );
+        // Status-like tools read run logs for harness friction, so they never
+        // go through the cache and always see the new event.
+        for tool in ["maestro_status", "maestro_task_next"] {
+            assert!(!is_read_only(tool), "{tool} must not be cached");
+        }
+
+        let _ = fs::remove_dir_all(paths.repo_root());
+    }
+
+    #[test]
+    fn responses_are_reused_until_a_write_or_store_change() {
+        let paths = temp_paths("maestro-mcp-cache");
+        let cache = ToolCache::default();
+        assert_eq!(hit(&cache, &paths, "maestro_task_list"), None);
+        assert_eq!(
+            hit(&cache, &paths, "maestro_task_list").as_deref(),
+            Some("maestro_status response")
+        );
+
+        cache.invalidate();
+        assert_eq!(hit(&cache, &paths, "maestro_task_list"), None);
+
+        // Derived caches under index/ do not count as a store change.
+        fs::create_dir_all(paths.index_dir()).expect("invariant: index dir is creatable");
+        fs::write(paths.card_read_model_file(), "derived").expect("invariant: writable");
+        assert!(hit(&cache, &paths, "maestro_task_list").is_some());
+
+        // Channel logs feed no read tool either.
+        fs::create_dir_all(paths.channels_dir()).expect("invariant: channels dir is creatable");
+        fs::write(paths.channels_dir().join("task-1.jsonl"), "{}\n").expect("invariant: writable");
+        assert!(hit(&cache, &paths, "maestro_task_list").is_some());
+
+        fs::write(paths.cards_dir().join("card.yaml"), "id: x\n").expect("invariant: writable");
+        assert_eq!(hit(&cache, &paths, "maestro_task_list"), None);
+        assert!(hit(&cache, &paths, "maestro_task_list").is_some());
+
+        let _ = fs::remove_dir_all(paths.repo_root());
+    }
+}
@@ -1,2 +1,4 @@
+mod cache;
 pub mod server;
+mod stats;
 pub mod tools;
@@ -1,31 +1,196 @@
+use std::collections::BTreeMap;
 use std::io::{self, BufRead, BufReader, Write};
+use std::panic::{self, AssertUnwindSafe};
+use std::sync::mpsc::{self, Receiver, Sender};
+use std::sync::{Condvar, Mutex, PoisonError};
+use std::thread;
+use std::time::Instant;
 
-use anyhow::{Context, Result, bail};
+use anyhow::{Context, Result, anyhow, bail};
 use serde_json::{Value, json};
 
 use crate::foundation::core::paths::{MaestroPaths, discover_repo_root};
-use crate::interfaces::mcp::tools::{call_tool, tool_definitions};
+use crate::interfaces::mcp::cache::{Lookup, ToolCache};
+use crate::interfaces::mcp::stats::{CallOutcome, TOOL_STATS_URI, ToolStats};
+use crate::interfaces::mcp::tools::{call_tool, is_read_only, tool_definitions};
 
 const MAX_MCP_FRAME_BYTES: usize = 1024 * 1024;
+/// Upper bound on read-only tool calls running at once.
+const MAX_READ_WORKERS: usize = 4;
+
+/// State shared by every request the server handles.
+struct Server {
+    paths: MaestroPaths,
+    cache: ToolCache,
+    stats: ToolStats,
+}
+
+/// Requests dispatched to the read pool and not yet answered.
+#[derive(Default)]
+struct InFlight {
+    count: Mutex<usize>,
+    idle: Condvar,
+}
+
+impl InFlight {
+    fn start(&self) {
+        *self.count.lock().unwrap_or_else(PoisonError::into_inner) += 1;
+    }
+
+    /// A guard that calls [`Self::finish`] when it drops, so a request
+    /// leaves the count even if answering it unwinds.
+    fn slot(&self) -> Finish<'_> {
+        Finish(self)
+    }
+
+    fn finish(&self) {
+        let mut count = self.count.lock().unwrap_or_else(PoisonError::into_inner);
+        *count -= 1;
+        if *count == 0 {
+            self.idle.notify_all();
+        }
+    }
+
+    fn wait_idle(&self) {
+        let mut count = self.count.lock().unwrap_or_else(PoisonError::into_inner);
+        while *count > 0 {
+            count = self
+                .idle
+                .wait(count)
+                .unwrap_or_else(PoisonError::into_inner);
+        }
+    }
+}
+
+/// Guard returned by [`InFlight::slot`].
+struct Finish<'a>(&'a InFlight);
+
+impl Drop for Finish<'_> {
+    fn drop(&mut self) {
+        self.0.finish();
+    }
+}
 
 /// Run the stdio MCP JSON-RPC server.
+///
+/// Read-only tool calls run on a small worker pool; everything else -- writes,
+/// lifecycle methods, batches -- waits for the reads before it and runs alone
+/// on the reading thread, so the store sees one writer at a time. Responses
+/// are written in request order whatever order they finish in.
 pub fn serve() -> Result<()> {
     let repo_root = discover_repo_root()?;
-    let paths = MaestroPaths::new(repo_root);
+    let server = Server {
+        paths: MaestroPaths::new(repo_root),
+        cache: ToolCache::default(),
+        stats: ToolStats::default(),
+    };
     let stdin = io::stdin();
     let mut reader = BufReader::new(stdin.lock());
-    let mut stdout = io::stdout();
+    let workers = thread::available_parallelism()
+        .map_or(1, std::num::NonZeroUsize::get)
+        .clamp(1, MAX_READ_WORKERS);
 
-    while let Some(body) = read_message(&mut reader)? {
-        let response = handle_request(&paths, &body);
-        if let Some(response) = response {
-            write_frame(&mut stdout, &response)?;
+    thread::scope(|scope| {
+        let (responses, ordered) = mpsc::channel::<(u64, Option<Value>)>();
+        let writer = scope.spawn(move || write_in_order(&mut io::stdout(), ordered));
+        let (jobs, queue) = mpsc::sync_channel::<(u64, Value)>(workers);
+        let queue = Mutex::new(queue);
+        let in_flight = InFlight::default();
+        for _ in 0..workers {
+            let responses = responses.clone();
+            let (server, queue, in_flight) = (&server, &queue, &in_flight);
+            scope.spawn(move || {
+                loop {
+                    let job = queue.lock().unwrap_or_else(PoisonError::into_inner).recv();
+                    let Ok((seq, request)) = job else {
+                        return;
+                    };
+                    let _slot = in_flight.slot();
+                    // A panicking tool answers its own request with an error
+                    // instead of taking the worker down and leaving every
+                    // later response held behind its sequence number.
+                    let response = panic::catch_unwind(AssertUnwindSafe(|| {
+                        handle_request_value(server, &request)
+                    }))
+                    .unwrap_or_else(|_| Some(internal_error(&request)));
+                    let _ = responses.send((seq, response));
+                }
+            });
         }
+
+        let read = dispatch_requests(&server, &mut reader, &responses, &jobs, &in_flight);
+        drop(jobs);
+        drop(responses);
+        let written = writer
+            .join()
+            .map_err(|_| anyhow!("MCP response writer panicked"))?;
+        read.and(written)
+    })
+}
+
+/// Read requests until EOF, handing read-only tool calls to the pool.
+fn dispatch_requests(
+    server: &Server,
+    reader: &mut impl BufRead,
+    responses: &Sender<(u64, Option<Value>)>,
+    jobs: &mpsc::SyncSender<(u64, Value)>,
+    in_flight: &InFlight,
+) -> Result<()> {
+    let mut seq = 0;
+    while let Some(body) = read_message(reader)? {
+        let response = match serde_json::from_str::<Value>(&body) {
+            Ok(request) if is_read_only_call(&request) => {
+                in_flight.start();
+                if jobs.send((seq, request)).is_err() {
+                    bail!("MCP read workers stopped");
+                }
+                seq += 1;
+                continue;
+            }
+            Ok(request) => {
+                in_flight.wait_idle();
+                handle_parsed_request(server, &request)
+            }
+            Err(error) => Some(parse_error(&error)),
+        };
+        if responses.send((seq, response)).is_err() {
+            bail!("MCP response writer stopped");
+        }
+        seq += 1;
     }
+    Ok(())
+}
 
+/// Write responses as they arrive, holding each until every earlier request
+/// is answered. Requests with no response (notifications) still take a slot.
+fn write_in_order(
+    writer: &mut impl Write,
+    responses: Receiver<(u64, Option<Value>)>,
+) -> Result<()> {
+    let mut next = 0;
+    let mut held = BTreeMap::new();
+    for (seq, response) in responses {
+        held.insert(seq, response);
+        while let Some(response) = held.remove(&next) {
+            if let Some(response) = response {
+                write_frame(writer, &response)?;
+            }
+            next += 1;
+        }
+    }
     Ok(())
 }
 
+fn is_read_only_call(request: &Value) -> bool {
+    request.get("id").is_some()
+        && request.get("method").and_then(Value::as_str) == Some("tools/call")
+        && request
+            .get("params")
+            .and_then(|params| params.get("name"))
+            .and_then(Value::as_str)
+            .is_some_and(is_read_only)
+}
+
 fn read_message(reader: &mut impl BufRead) -> Result<Option<String>> {
     let buffer = reader.fill_buf().context("failed to read MCP input")?;
     if buffer.is_empty() {
@@ -93,18 +258,23 @@ fn write_frame(writer: &mut impl Write, response: &Value) -> Result<()> {
     writer.flush().context("failed to flush MCP response")
 }
 
-fn handle_request(paths: &MaestroPaths, body: &str) -> Option<Value> {
-    let request = match serde_json::from_str::<Value>(body) {
-        Ok(request) => request,
-        Err(error) => {
-            return Some(json!({
-                "jsonrpc": "2.0",
-                "id": Value::Null,
-                "error": {"code": -32700, "message": error.to_string()}
-            }));
-        }
-    };
+fn internal_error(request: &Value) -> Value {
+    json!({
+        "jsonrpc": "2.0",
+        "id": request.get("id").cloned().unwrap_or(Value::Null),
+        "error": {"code": -32603, "message": "internal error: the tool call panicked"}
+    })
+}
 
+fn parse_error(error: &serde_json::Error) -> Value {
+    json!({
+        "jsonrpc": "2.0",
+        "id": Value::Null,
+        "error": {"code": -32700, "message": error.to_string()}
+    })
+}
+
+fn handle_parsed_request(server: &Server, request: &Value) -> Option<Value> {
     if let Some(batch) = request.as_array() {
         if batch.is_empty() {
             return Some(json!({
@@ -115,7 +285,7 @@ fn handle_request(paths: &MaestroPaths, body: &str) -> Option<Value> {
         }
         let responses = batch
             .iter()
-            .filter_map(|request| handle_request_value(paths, request))
+            .filter_map(|request| handle_request_value(server, request))
             .collect::<Vec<_>>();
         return if responses.is_empty() {
             None
@@ -124,10 +294,10 @@ fn handle_request(paths: &MaestroPaths, body: &str) -> Option<Value> {
         };
     }
 
-    handle_request_value(paths, &request)
+    handle_request_value(server, request)
 }
 
-fn handle_request_value(paths: &MaestroPaths, request: &Value) -> Option<Value> {
+fn handle_request_value(server: &Server, request: &Value) -> Option<Value> {
     let id = request.get("id").cloned();
     let Some(method) = request.get("method").and_then(Value::as_str) else {
         return id.map(|id| {
@@ -146,7 +316,7 @@ fn handle_request_value(paths: &MaestroPaths, request: &Value) -> Option<Value>
                 "id": id,
                 "result": {
                     "protocolVersion": "2024-11-05",
-                    "capabilities": {"tools": {}},
+                    "capabilities": {"tools": {}, "resources": {}},
                     "serverInfo": {"name": "maestro", "version": env!("MAESTRO_VERSION")}
                 }
             })
@@ -159,7 +329,20 @@ fn handle_request_value(paths: &MaestroPaths, request: &Value) -> Option<Value>
                 "result": {"tools": tools_json()}
             })
         }),
-        "tools/call" => id.map(|id| tool_call_response(paths, id, request.get("params"))),
+        "tools/call" => id.map(|id| tool_call_response(server, id, request.get("params"))),
+        "resources/list" => id.map(|id| {
+            json!({
+                "jsonrpc": "2.0",
+                "id": id,
+                "result": {"resources": [{
+                    "uri": TOOL_STATS_URI,
+                    "name": "MCP tool stats",
+                    "description": "Per-tool call counts, latency, and read-cache hit rate for this server process.",
+                    "mimeType": "application/json"
+                }]}
+            })
+        }),
+        "resources/read" => id.map(|id| resource_read_response(server, id, request.get("params"))),
         _ => id.map(|id| {
             json!({
                 "jsonrpc": "2.0",
@@ -183,7 +366,7 @@ fn tools_json() -> Vec<Value> {
         .collect()
 }
 
-fn tool_call_response(paths: &MaestroPaths, id: Value, params: Option<&Value>) -> Value {
+fn tool_call_response(server: &Server, id: Value, params: Option<&Value>) -> Value {
     let Some(params) = params else {
         return invalid_params(id, "missing params");
     };
@@ -195,7 +378,7 @@ fn tool_call_response(paths: &MaestroPaths, id: Value, params: Option<&Value>) -
         .cloned()
         .unwrap_or_else(|| json!({}));
 
-    match call_tool(paths, name, &arguments) {
+    match run_tool(server, name, &arguments) {
         Ok(text) => json!({
             "jsonrpc": "2.0",
             "id": id,
@@ -209,6 +392,61 @@ fn tool_call_response(paths: &MaestroPaths, id: Value, params: Option<&Value>) -
     }
 }
 
+/// Call `name`, answering read-only tools from the cache when the store has
+/// not changed and dropping the cache after any other tool.
+fn run_tool(server: &Server, name: &str, arguments: &Value) -> Result<String> {
+    let started = Instant::now();
+    let read_only = is_read_only(name);
+    let pending = if read_only {
+        match server.cache.lookup(&server.paths, name, arguments)? {
+            Lookup::Hit(text) => {
+                server
+                    .stats
+                    .record(name, CallOutcome::CacheHit, started.elapsed());
+                return Ok(text);
+            }
+            Lookup::Miss(pending) => Some(pending),
+        }
+    } else {
+        None
+    };
+    let result = call_tool(&server.paths, name, arguments);
+    if !read_only {
+        server.cache.invalidate();
+    }
+    let outcome = match (&result, pending) {
+        (Ok(text), Some(pending)) => {
+            server.cache.store(&server.paths, pending, text)?;
+            CallOutcome::Ran
+        }
+        (Ok(_), None) => CallOutcome::Ran,
+        (Err(_), _) => CallOutcome::Failed,
+    };
+    server.stats.record(name, outcome, started.elapsed());
+    result
+}
+
+fn resource_read_response(server: &Server, id: Value, params: Option<&Value>) -> Value {
+    let Some(uri) = params
+        .and_then(|params| params.get("uri"))
+        .and_then(Value::as_str)
+    else {
+        return invalid_params(id, "missing resource uri");
+    };
+    if uri != TOOL_STATS_URI {
+        return invalid_params(id, &format!("unknown resource: {uri}"));
+    }
+    json!({
+        "jsonrpc": "2.0",
+        "id": id,
+        "result": {"contents": [{
+            "uri": TOOL_STATS_URI,
+            "mimeType": "application/json",
+            "text": server.stats.snapshot().to_string()
+        }]}
+    })
+}
+
 fn invalid_params(id: Value, message: &str) -> Value {
     json!({
         "jsonrpc": "2.0",
@@ -0,0 +1,89 @@
+//! Per-tool latency and cache-hit counters, served as the
+//! `maestro://mcp/tool-stats` resource.
+
+use std::collections::BTreeMap;
+use std::sync::{Mutex, PoisonError};
+use std::time::Duration;
+
+use serde_json::{Value, json};
+
+pub(crate) const TOOL_STATS_URI: &str = "maestro://mcp/tool-stats";
+
+#[derive(Default)]
+pub(crate) struct ToolStats {
+    tools: Mutex<BTreeMap<String, ToolCounters>>,
+}
+
+#[derive(Default)]
+struct ToolCounters {
+    calls: u64,
+    cache_hits: u64,
+    errors: u64,
+    total: Duration,
+    max: Duration,
+}
+
+/// How one tool call was answered.
+#[derive(Clone, Copy)]
+pub(crate) enum CallOutcome {
+    CacheHit,
+    Ran,
+    Failed,
+}
+
+impl ToolStats {
+    pub(crate) fn record(&self, name: &str, outcome: CallOutcome, elapsed: Duration) {
+        let mut tools = self.tools.lock().unwrap_or_else(PoisonError::into_inner);
+        let counters = tools.entry(name.to_string()).or_default();
+        counters.calls += 1;
+        match outcome {
+            CallOutcome::CacheHit => counters.cache_hits += 1,
+            CallOutcome::Ran => {}
+            CallOutcome::Failed => counters.errors += 1,
+        }
+        counters.total += elapsed;
+        counters.max = counters.max.max(elapsed);
+    }
+
+    /// The counters as the resource's JSON document.
+    pub(crate) fn snapshot(&self) -> Value {
+        let tools = self.tools.lock().unwrap_or_else(PoisonError::into_inner);
+        let (calls, hits) = tools.values().fold((0, 0), |(calls, hits), counters| {
+            (calls + counters.calls, hits + counters.cache_hits)
+        });
+        json!({
+            "schema": "maestro.mcp.tool_stats.v1",
+            "calls": calls,
+            "cache_hits": hits,
+            "cache_hit_rate": ratio(hits, calls),
+            "tools": tools
+                .iter()
+                .map(|(name, counters)| {
+                    (
+                        name.clone(),
+                        json!({
+                            "calls": counters.calls,
+                            "cache_hits": counters.cache_hits,
+                            "errors": counters.errors,
+                            "cache_hit_rate": ratio(counters.cache_hits, counters.calls),
+                            "mean_ms": millis(counters.total) / counters.calls.max(1) as f64,
+                            "max_ms": millis(counters.max),
+                        }),
+                    )
+                })
+                .collect::<serde_json::Map<_, _>>(),
+        })
+    }
+}
+
+fn ratio(part: u64, whole: u64) -> f64 {
+    if whole == 0 {
+        0.0
+    } else {
+        part as f64 / whole as f64
+    }
+}
+
+fn millis(duration: Duration) -> f64 {
+    duration.as_secs_f64() * 1000.0
+}
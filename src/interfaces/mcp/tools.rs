@@ -212,6 +212,30 @@ pub fn tool_definitions() -> Vec<ToolDefinition> {
     ]
 }
 
+/// Tools that only read the store. The server runs these concurrently and
+/// may answer them from its cache; every other tool is a write and runs
+/// alone, after the reads before it and before the reads after it.
+/// `maestro_status` and `maestro_task_next` stay off the list: their harness
+/// friction readout refreshes the proposal backlog when the run-log evidence
+/// moved, which writes `cards/ideas.yaml` and the detect stamp.
+const READ_ONLY_TOOLS: &[&str] = &[
+    "maestro_task_list",
+    "maestro_task_show",
+    "maestro_feature_list",
+    "maestro_feature_show",
+    "maestro_card_list",
+    "maestro_card_show",
+    "maestro_card_ready",
+    "maestro_card_graph",
+    "maestro_decision_list",
+    "maestro_query_matrix",
+];
+
+/// Whether `name` is a tool that never writes the store.
+pub fn is_read_only(name: &str) -> bool {
+    READ_ONLY_TOOLS.contains(&name)
+}
+
 /// Execute a V1 Maestro MCP tool.
 pub fn call_tool(paths: &MaestroPaths, name: &str, arguments: &Value) -> Result<String> {
     match name {
@@ -1,17 +1,33 @@
 use std::collections::{BTreeMap, BTreeSet};
+use std::io::{ErrorKind, Write};
+use std::path::PathBuf;
+use std::thread;
+use std::time::{Duration, Instant};
 
-use anyhow::{Result, bail};
+use anyhow::{Context, Result, bail};
 use serde::Serialize;
+use serde_json::{Value, json};
 
 use crate::domain::card;
 use crate::domain::proof;
 use crate::domain::run::{self, Presence};
 use crate::domain::task;
+use crate::foundation::core::fs::stat_fingerprint;
 use crate::foundation::core::git;
 use crate::foundation::core::paths::MaestroPaths;
+use crate::foundation::core::profile;
 use crate::foundation::core::time::utc_now_timestamp;
 
 const SNAPSHOT_SCHEMA: &str = "maestro.mission_control.snapshot.v1";
+const STREAM_SCHEMA: &str = "maestro.mission_control.stream.v1";
+/// How often `--stream` re-stats its sources.
+const STREAM_POLL: Duration = Duration::from_millis(100);
+/// How long sources must stay unchanged before a diff is built.
+pub(crate) const STREAM_DEBOUNCE: Duration = Duration::from_millis(200);
+/// The longest a steady trickle of writes can hold a diff back.
+const STREAM_MAX_DELAY: Duration = Duration::from_secs(1);
+/// How often sessions and git status are reread with no write to prompt it.
+const STREAM_HEARTBEAT: Duration = Duration::from_secs(5);
 const DEFAULT_WIDTH: usize = 120;
 const DEFAULT_HEIGHT: usize = 40;
 
@@ -138,7 +154,7 @@ pub struct TaskSnapshot {
     pub claimed_by: Option<String>,
 }
 
-#[derive(Debug, Serialize)]
+#[derive(Clone, Debug, Serialize)]
 pub struct SessionSnapshot {
     pub session_id: String,
     pub agent_runtime: Option<String>,
@@ -149,7 +165,7 @@ pub struct SessionSnapshot {
     pub presence: &'static str,
 }
 
-#[derive(Debug, Serialize)]
+#[derive(Clone, Debug, Serialize)]
 pub struct ProofSnapshot {
     pub needs_verification: usize,
     pub verified_or_done: usize,
@@ -196,6 +212,93 @@ struct CardView {
 }
 
 pub fn snapshot(paths: &MaestroPaths) -> Result<MissionControlSnapshot> {
+    Ok(SnapshotInputs::load(paths)?.assemble(paths))
+}
+
+/// The read models a snapshot is assembled from, grouped by the source each
+/// reads so a stream reloads only the groups whose source changed.
+struct SnapshotInputs {
+    /// From the card tree and store.
+    views: Vec<CardView>,
+    /// From the run logs of every worktree.
+    sessions: Vec<SessionSnapshot>,
+    /// From git HEAD, refs, and the worktree.
+    git: Option<git::GitSnapshot>,
+    /// From the card tree and git HEAD.
+    proof: ProofSnapshot,
+}
+
+impl SnapshotInputs {
+    fn load(paths: &MaestroPaths) -> Result<Self> {
+        let views = card_views(paths)?;
+        let git = git::snapshot(paths.repo_root()).ok();
+        let proof = proof_for(paths, &views, git.as_ref())?;
+        Ok(Self {
+            views,
+            sessions: active_sessions(paths),
+            git,
+            proof,
+        })
+    }
+
+    fn reload(&mut self, paths: &MaestroPaths, sources: ChangedSources) -> Result<()> {
+        if sources.cards {
+            self.views = card_views(paths)?;
+        }
+        if sources.runs {
+            self.sessions = active_sessions(paths);
+        }
+        // Card writes are worktree changes too: `maestro_dirty` counts them.
+        if sources.git || sources.cards {
+            self.git = git::snapshot(paths.repo_root()).ok();
+        }
+        if sources.cards || sources.git {
+            self.proof = proof_for(paths, &self.views, self.git.as_ref())?;
+        }
+        Ok(())
+    }
+
+    fn assemble(&self, paths: &MaestroPaths) -> MissionControlSnapshot {
+        let counts = counts_from_views(self.views.iter());
+        let git = self.git.as_ref();
+        MissionControlSnapshot {
+            schema: SNAPSHOT_SCHEMA,
+            mode: "home",
+            repo: RepoSnapshot {
+                root: paths.repo_root().display().to_string(),
+                branch: git.and_then(|git| git.branch.clone()),
+                dirty: git.is_some_and(|git| git.dirty),
+                code_other_dirty: git.map_or(0, |git| git.code_other_dirty),
+                maestro_dirty: git.map_or(0, |git| git.maestro_dirty),
+            },
+            summary: SummarySnapshot {
+                features: self.views.iter().filter(|card| card.is_feature).count(),
+                workable_cards: counts.total(),
+                ready: counts.ready,
+                active: counts.active,
+                needs_verification: counts.needs_verification,
+                blocked: counts.blocked,
+                done: counts.done,
+                live_sessions: self.sessions.len(),
+            },
+            features: feature_snapshots(&self.views),
+            tasks: task_snapshots(&self.views),
+            sessions: self.sessions.clone(),
+            proof: self.proof.clone(),
+            config: ConfigSnapshot {
+                preview_screens: PreviewScreen::all()
+                    .iter()
+                    .map(|screen| screen.as_str())
+                    .collect(),
+                read_only: true,
+                source: "current Maestro card/task/run/proof read models",
+            },
+        }
+    }
+}
+
+fn card_views(paths: &MaestroPaths) -> Result<Vec<CardView>> {
+    let _phase = profile::phase("mission_control.cards");
     let mut cards: Vec<_> = card::query::scan_with_failures(paths)?
         .cards
         .into_iter()
@@ -206,9 +309,7 @@ pub fn snapshot(paths: &MaestroPaths) -> Result<MissionControlSnapshot> {
         .into_iter()
         .map(|card| card.id.clone())
         .collect();
-    let sessions = active_sessions(paths);
-    let git = git::snapshot(paths.repo_root()).ok();
-    let views: Vec<CardView> = cards
+    Ok(cards
         .iter()
         .map(|card| CardView {
             id: card.id.clone(),
@@ -219,49 +320,228 @@ pub fn snapshot(paths: &MaestroPaths) -> Result<MissionControlSnapshot> {
             state: card::query::classify(card, &blocked_ids),
             is_feature: card::query::feature_of(card).is_some_and(|feature| feature == card.id),
         })
-        .collect();
-    let features = feature_snapshots(&views);
-    let tasks = task_snapshots(&views);
-    let counts = counts_from_views(views.iter());
-    let proof = proof_snapshot(
+        .collect())
+}
+
+fn proof_for(
+    paths: &MaestroPaths,
+    views: &[CardView],
+    git: Option<&git::GitSnapshot>,
+) -> Result<ProofSnapshot> {
+    let _phase = profile::phase("mission_control.proof");
+    proof_snapshot(
         paths,
-        git.as_ref().and_then(|git| git.head.clone()),
-        &counts,
-    )?;
-    let feature_count = views.iter().filter(|card| card.is_feature).count();
-    Ok(MissionControlSnapshot {
-        schema: SNAPSHOT_SCHEMA,
-        mode: "home",
-        repo: RepoSnapshot {
-            root: paths.repo_root().display().to_string(),
-            branch: git.as_ref().and_then(|git| git.branch.clone()),
-            dirty: git.as_ref().is_some_and(|git| git.dirty),
-            code_other_dirty: git.as_ref().map_or(0, |git| git.code_other_dirty),
-            maestro_dirty: git.as_ref().map_or(0, |git| git.maestro_dirty),
-        },
-        summary: SummarySnapshot {
-            features: feature_count,
-            workable_cards: counts.total(),
-            ready: counts.ready,
-            active: counts.active,
-            needs_verification: counts.needs_verification,
-            blocked: counts.blocked,
-            done: counts.done,
-            live_sessions: sessions.len(),
-        },
-        features,
-        tasks,
-        sessions,
-        proof,
-        config: ConfigSnapshot {
-            preview_screens: PreviewScreen::all()
-                .iter()
-                .map(|screen| screen.as_str())
-                .collect(),
-            read_only: true,
-            source: "current Maestro card/task/run/proof read models",
-        },
-    })
+        git.and_then(|git| git.head.clone()),
+        &counts_from_views(views.iter()),
+    )
+}
+
+/// The files and trees a snapshot reads, one list per input group. Resolving
+/// them walks the worktree list and the git dir, so a stream resolves them
+/// once and again only on its heartbeat, not on every poll.
+pub(crate) struct SourcePaths {
+    cards: Vec<PathBuf>,
+    card_trees: Vec<PathBuf>,
+    run_dirs: Vec<PathBuf>,
+    git_files: Vec<PathBuf>,
+    git_trees: Vec<PathBuf>,
+}
+
+impl SourcePaths {
+    pub(crate) fn resolve(paths: &MaestroPaths) -> Result<Self> {
+        let db = paths.store_db_file();
+        let mut wal = db.clone().into_os_string();
+        wal.push("-wal");
+        let run_dirs = crate::interfaces::cli::worktree_roots(paths)
+            .iter()
+            .map(|root| root.runs_dir())
+            .collect();
+        let (git_files, git_trees) = git::ref_state_paths(paths.repo_root())?;
+        Ok(Self {
+            cards: vec![db, PathBuf::from(wal)],
+            card_trees: vec![paths.cards_dir()],
+            run_dirs,
+            git_files,
+            git_trees,
+        })
+    }
+}
+
+/// Stat fingerprints of the sources a snapshot reads, one per input group.
+#[derive(Clone, Default, PartialEq)]
+pub(crate) struct SourceStamps {
+    cards: BTreeMap<PathBuf, (u128, u64)>,
+    runs: BTreeMap<PathBuf, (u128, u64)>,
+    git: BTreeMap<PathBuf, (u128, u64)>,
+}
+
+#[derive(Clone, Copy, Default)]
+struct ChangedSources {
+    cards: bool,
+    runs: bool,
+    git: bool,
+}
+
+impl SourceStamps {
+    pub(crate) fn capture(sources: &SourcePaths) -> Result<Self> {
+        Ok(Self {
+            cards: stat_fingerprint(&sources.cards, &sources.card_trees)?,
+            runs: stat_fingerprint(&[], &sources.run_dirs)?,
+            git: stat_fingerprint(&sources.git_files, &sources.git_trees)?,
+        })
+    }
+
+    fn changed_since(&self, previous: &Self) -> ChangedSources {
+        ChangedSources {
+            cards: self.cards != previous.cards,
+            runs: self.runs != previous.runs,
+            git: self.git != previous.git,
+        }
+    }
+}
+
+/// A Mission Control snapshot kept current by reloading only the input
+/// groups whose sources changed, reported as versioned records: one full
+/// `snapshot`, then `diff` records carrying each top-level section whose
+/// content changed, whole. Applying the diffs in `seq` order to the first
+/// snapshot reproduces `maestro mission-control --json`.
+pub struct ChangeFeed {
+    inputs: SnapshotInputs,
+    sources: SourcePaths,
+    stamps: SourceStamps,
+    sections: serde_json::Map<String, Value>,
+    seq: u64,
+}
+
+impl ChangeFeed {
+    /// Load the full snapshot; the returned record is the feed's first.
+    pub fn open(paths: &MaestroPaths) -> Result<(Self, Value)> {
+        let sources = SourcePaths::resolve(paths)?;
+        let stamps = SourceStamps::capture(&sources)?;
+        let inputs = SnapshotInputs::load(paths)?;
+        let snapshot = serde_json::to_value(inputs.assemble(paths))?;
+        let Value::Object(sections) = snapshot.clone() else {
+            bail!("mission control snapshot did not serialize to an object");
+        };
+        let feed = Self {
+            inputs,
+            sources,
+            stamps,
+            sections,
+            seq: 0,
+        };
+        let record = json!({
+            "schema": STREAM_SCHEMA,
+            "seq": feed.seq,
+            "kind": "snapshot",
+            "snapshot": snapshot,
+        });
+        Ok((feed, record))
+    }
+
+    /// The source paths the feed stats; [`Self::refresh`] re-resolves them on
+    /// a heartbeat.
+    pub(crate) fn sources(&self) -> &SourcePaths {
+        &self.sources
+    }
+
+    /// The source stamps the feed's current snapshot was loaded against.
+    pub(crate) fn stamps(&self) -> &SourceStamps {
+        &self.stamps
+    }
+
+    /// Reload the groups whose sources changed since the last refresh, plus
+    /// the time-dependent groups when `heartbeat` is set: session presence
+    /// ages without a write, and worktree edits outside the index touch no
+    /// ref. A heartbeat also re-resolves the source paths, picking up added
+    /// worktrees and packed or new refs. `None` when no section's content
+    /// changed.
+    pub fn refresh(&mut self, paths: &MaestroPaths, heartbeat: bool) -> Result<Option<Value>> {
+        if heartbeat {
+            self.sources = SourcePaths::resolve(paths)?;
+        }
+        let stamps = SourceStamps::capture(&self.sources)?;
+        let mut changed = stamps.changed_since(&self.stamps);
+        changed.runs |= heartbeat;
+        changed.git |= heartbeat;
+        self.stamps = stamps;
+        if !(changed.cards || changed.runs || changed.git) {
+            return Ok(None);
+        }
+        self.inputs.reload(paths, changed)?;
+        let Value::Object(sections) = serde_json::to_value(self.inputs.assemble(paths))? else {
+            bail!("mission control snapshot did not serialize to an object");
+        };
+        let diff: serde_json::Map<String, Value> = sections
+            .iter()
+            .filter(|(key, value)| self.sections.get(*key) != Some(*value))
+            .map(|(key, value)| (key.clone(), value.clone()))
+            .collect();
+        self.sections = sections;
+        if diff.is_empty() {
+            return Ok(None);
+        }
+        self.seq += 1;
+        Ok(Some(json!({
+            "schema": STREAM_SCHEMA,
+            "seq": self.seq,
+            "kind": "diff",
+            "sections": diff,
+        })))
+    }
+}
+
+/// Write the change feed to `out` as JSON lines until the reader goes away.
+/// Sources are re-stat'ed every [`STREAM_POLL`]; a change is held until they
+/// stay quiet for [`STREAM_DEBOUNCE`] (or [`STREAM_MAX_DELAY`] passes), so a
+/// burst of writes -- a claim touching the card, the store, and a run log --
+/// becomes one diff.
+pub fn stream(paths: &MaestroPaths, out: &mut impl Write) -> Result<()> {
+    let (mut feed, first) = ChangeFeed::open(paths)?;
+    if !emit(out, &first)? {
+        return Ok(());
+    }
+    let mut seen = feed.stamps().clone();
+    let mut pending_since: Option<Instant> = None;
+    let mut last_change = Instant::now();
+    let mut last_refresh = Instant::now();
+    loop {
+        thread::sleep(STREAM_POLL);
+        let now = Instant::now();
+        let stamps = SourceStamps::capture(feed.sources())?;
+        if stamps != seen {
+            seen = stamps;
+            last_change = now;
+            pending_since.get_or_insert(now);
+            continue;
+        }
+        let settled = pending_since.is_some_and(|since| {
+            now.duration_since(last_change) >= STREAM_DEBOUNCE
+                || now.duration_since(since) >= STREAM_MAX_DELAY
+        });
+        let heartbeat = now.duration_since(last_refresh) >= STREAM_HEARTBEAT;
+        if !(settled || heartbeat) {
+            continue;
+        }
+        pending_since = None;
+        last_refresh = now;
+        if let Some(record) = feed.refresh(paths, heartbeat)?
+            && !emit(out, &record)?
+        {
+            return Ok(());
+        }
+    }
+}
+
+/// Write one record line; `false` once the reader has closed the pipe.
+fn emit(out: &mut impl Write, record: &Value) -> Result<bool> {
+    let mut line = serde_json::to_vec(record)?;
+    line.push(b'\n');
+    match out.write_all(&line).and_then(|()| out.flush()) {
+        Ok(()) => Ok(true),
+        Err(error) if error.kind() == ErrorKind::BrokenPipe => Ok(false),
+        Err(error) => Err(error).context("failed to write mission control stream"),
+    }
 }
 
 pub fn render_preview(paths: &MaestroPaths, options: RenderOptions<'_>) -> Result<String> {
@@ -317,6 +597,7 @@ pub fn render_check(
 }
 
 fn active_sessions(paths: &MaestroPaths) -> Vec<SessionSnapshot> {
+    let _phase = profile::phase("mission_control.sessions");
     let roots = crate::interfaces::cli::worktree_roots(paths);
     let now = utc_now_timestamp();
     run::active_sessions_union(&roots, &now)
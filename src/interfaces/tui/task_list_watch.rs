@@ -1,7 +1,7 @@
 use std::collections::{BTreeMap, BTreeSet};
 use std::io::{self, IsTerminal, Write};
 use std::thread;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 
 use anyhow::{Context, Result};
 
@@ -13,6 +13,7 @@ use crate::domain::task;
 use crate::foundation::core::git;
 use crate::foundation::core::paths::MaestroPaths;
 use crate::foundation::core::time::utc_now_timestamp;
+use crate::interfaces::tui::mission_control::{STREAM_DEBOUNCE, SourcePaths, SourceStamps};
 use crate::operations::harness;
 
 // The board classifier moved to `card::query` so `maestro status` shares it
@@ -624,6 +625,11 @@ pub fn run_board(paths: &MaestroPaths, focus: Option<&str>, interval_seconds: u6
     let mut prev_live: BTreeSet<String> = BTreeSet::new();
     let mut tick: u64 = 0;
     loop {
+        // Resolve the watched paths once per reload, not on every render tick;
+        // stamping before the load means a write during it still triggers the
+        // next reload.
+        let sources = SourcePaths::resolve(paths)?;
+        let mut stamps = SourceStamps::capture(&sources)?;
         let (cards, blocked_ids) = load_board(paths, focus)?;
         let mut live_now: BTreeSet<String> = BTreeSet::new();
         let mut just_completed: BTreeSet<String> = BTreeSet::new();
@@ -641,6 +647,7 @@ pub fn run_board(paths: &MaestroPaths, focus: Option<&str>, interval_seconds: u6
         }
         let sessions = load_live_sessions(paths);
         let layout = build_board_layout(&cards, &blocked_ids, focus, &just_completed, &sessions);
+        let mut changed_at: Option<Instant> = None;
         for _ in 0..render_ticks {
             let mut board = layout.render(Some(tick));
             board.push_str(&harness::scheduler_surface_line(paths)?);
@@ -652,6 +659,15 @@ pub fn run_board(paths: &MaestroPaths, focus: Option<&str>, interval_seconds: u6
                 .context("failed to flush watch output")?;
             tick += 1;
             thread::sleep(Duration::from_millis(100));
+            // Reload as soon as a write burst settles rather than waiting out
+            // the interval, which now only bounds how stale session ages get.
+            let latest = SourceStamps::capture(&sources)?;
+            if latest != stamps {
+                stamps = latest;
+                changed_at = Some(Instant::now());
+            } else if changed_at.is_some_and(|at| at.elapsed() >= STREAM_DEBOUNCE) {
+                break;
+            }
         }
         prev_live = live_now;
     }
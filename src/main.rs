@@ -1,7 +1,11 @@
 use std::process;
 
-use clap::Parser;
 use clap::error::ErrorKind;
+use clap::{CommandFactory, Parser};
+use maestro::foundation::core::profile::{self, CountingAlloc};
+
+#[global_allocator]
+static ALLOCATOR: CountingAlloc = CountingAlloc;
 
 fn main() {
     let cli = match maestro::interfaces::cli::Cli::try_parse() {
@@ -19,7 +23,18 @@ fn main() {
         }
     };
     let auto_check = should_auto_check_after(&cli.command);
-    if let Err(error) = maestro::interfaces::cli::run(cli) {
+    let profiling = cli.profile || profile::requested_by_env();
+    if profiling {
+        profile::enable();
+    }
+    let result = maestro::interfaces::cli::run(cli);
+    if profiling {
+        profile::report(&command_path());
+    }
+    if let Err(error) = result {
+        if error.is::<maestro::interfaces::cli::grep::QueryRejected>() {
+            process::exit(2);
+        }
         if !error.is::<maestro::interfaces::cli::update::ReportedError>() {
             eprintln!("Error: {error:?}");
             if let Some(hint) = error_hint(&error) {
@@ -33,6 +48,20 @@ fn main() {
     }
 }
 
+/// The subcommand path this process ran (`card list`), for the profile
+/// report; the arguments themselves can carry message text and stay out.
+fn command_path() -> String {
+    let mut names = Vec::new();
+    if let Ok(matches) = maestro::interfaces::cli::Cli::command().try_get_matches() {
+        let mut current = &matches;
+        while let Some((name, next)) = current.subcommand() {
+            names.push(name.to_string());
+            current = next;
+        }
+    }
+    names.join(" ")
+}
+
 fn error_hint(error: &anyhow::Error) -> Option<String> {
     error.chain().find_map(|cause| {
         cause
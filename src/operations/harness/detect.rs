@@ -2,6 +2,7 @@ use std::collections::{BTreeMap, BTreeSet};
 use std::fs;
 
 use anyhow::{Context, Result};
+use serde::{Deserialize, Serialize};
 
 use crate::domain::harness::{BacklogItem, EscalationPolicy, HarnessConfig};
 use crate::domain::proof;
@@ -45,17 +46,38 @@ struct InterventionEvents {
     corrections_by_session: BTreeMap<String, Vec<String>>,
 }
 
-fn collect_intervention_events(
-    paths: &MaestroPaths,
-    require_keyword: bool,
-) -> Result<InterventionEvents> {
-    let mut events = InterventionEvents::default();
-    run::visit_managed_events(paths, |record| {
-        let event = record.event();
+/// Per-log intervention fold, checkpointed by `run::fold_managed_logs`. It
+/// keeps every candidate in log order and both correction verdicts, so the
+/// escalation policy's keyword switch applies at merge time.
+#[derive(Debug, Default, Deserialize, Serialize)]
+struct InterventionFold {
+    interventions: Vec<InterventionNote>,
+    prompts: Vec<CorrectionPrompt>,
+}
+
+#[derive(Debug, Deserialize, Serialize)]
+struct InterventionNote {
+    session_id: String,
+    topic: String,
+    note: String,
+}
+
+#[derive(Debug, Deserialize, Serialize)]
+struct CorrectionPrompt {
+    session_id: String,
+    text: String,
+    correction: bool,
+    keyword_correction: bool,
+}
+
+impl run::EventFold for InterventionFold {
+    const NAME: &'static str = "harness-interventions.v1";
+
+    fn observe(&mut self, session_id: &str, event: &run::EventLine<'_>) {
         if event.is_event_type("intervention") {
             let note = event.intervention_note().unwrap_or_default().trim();
             if note.is_empty() {
-                return Ok(());
+                return;
             }
             let topic = event
                 .topic()
@@ -63,30 +85,60 @@ fn collect_intervention_events(
                 .filter(|topic| !topic.is_empty())
                 .unwrap_or_else(|| normalize_topic(note));
             if topic.is_empty() {
-                return Ok(());
+                return;
             }
-            let entry = events.by_topic.entry(topic).or_default();
-            entry.0.insert(record.session_id().to_string());
-            entry.1.push(format!("{}: {}", record.session_id(), note));
+            self.interventions.push(InterventionNote {
+                session_id: session_id.to_string(),
+                topic,
+                note: note.to_string(),
+            });
         }
 
         if event.is_event_type("UserPromptSubmit") {
             let text = event.prompt_text().unwrap_or_default();
+            let correction = looks_like_correction(text);
+            let keyword_correction = looks_like_correction_requiring_keyword(text);
+            if correction || keyword_correction {
+                self.prompts.push(CorrectionPrompt {
+                    session_id: session_id.to_string(),
+                    text: text.to_string(),
+                    correction,
+                    keyword_correction,
+                });
+            }
+        }
+    }
+}
+
+fn collect_intervention_events(
+    paths: &MaestroPaths,
+    require_keyword: bool,
+) -> Result<InterventionEvents> {
+    let mut events = InterventionEvents::default();
+    for fold in run::fold_managed_logs::<InterventionFold>(paths)? {
+        for intervention in fold.interventions {
+            let entry = events.by_topic.entry(intervention.topic).or_default();
+            entry.0.insert(intervention.session_id.clone());
+            entry.1.push(format!(
+                "{}: {}",
+                intervention.session_id, intervention.note
+            ));
+        }
+        for prompt in fold.prompts {
             let is_correction = if require_keyword {
-                looks_like_correction_requiring_keyword(text)
+                prompt.keyword_correction
             } else {
-                looks_like_correction(text)
+                prompt.correction
             };
             if is_correction {
                 events
                     .corrections_by_session
-                    .entry(record.session_id().to_string())
+                    .entry(prompt.session_id)
                     .or_default()
-                    .push(text.to_string());
+                    .push(prompt.text);
             }
         }
-        Ok(())
-    })?;
+    }
     Ok(events)
 }
 
@@ -16,6 +16,12 @@ export interface InteractiveOptions {
   snapshot: MissionControlSnapshot;
   snapshotDeps: SnapshotDeps;
   reloadSnapshot: (options?: SnapshotBuildOptions) => Promise<MissionControlSnapshot>;
+  /**
+   * Bumped whenever a pushed snapshot change arrives; while it returns a
+   * number the loop reloads on each bump instead of polling. `undefined`
+   * (or no callback) falls back to the poll interval.
+   */
+  snapshotVersion?: () => number | undefined;
 }
 
 // Phase 3 strip: Mission Control no longer tracks live agent runtimes,
@@ -289,14 +289,20 @@ const RESIZE_RENDER_INTERVAL_MS = 16;
     renderCurrentFrame();
     dirty = false;
     let lastPollMs = Date.now();
+    let lastVersion = opts.snapshotVersion?.();
 
       while (state.running) {
         await sleep(100);
         if (!state.running) break;
 
         const now = Date.now();
-        if (now - lastPollMs >= getSnapshotPollIntervalMs(state.snapshot)) {
+        const version = opts.snapshotVersion?.();
+        const due = version === undefined
+          ? now - lastPollMs >= getSnapshotPollIntervalMs(state.snapshot)
+          : version !== lastVersion;
+        if (due) {
             lastPollMs = now;
+            lastVersion = version;
             try {
               const snapshot = await opts.reloadSnapshot({
                 includeTaskBoard: shouldIncludeTaskBoard(),
@@ -32,18 +32,26 @@ async function main(): Promise<void> {
   }
 
   if (args.mode === "interactive") {
-    await renderDashboard({
-      snapshot,
-      snapshotDeps: { config: {} },
-      reloadSnapshot: async () => {
-        if (!args.maestroBin) return snapshot;
-        try {
-          return adaptRustSnapshot(await reloadRustSnapshot(args.cwd, args.maestroBin));
-        } catch {
-          return snapshot;
-        }
-      },
-    });
+    const stream = args.maestroBin ? openSnapshotStream(args.cwd, args.maestroBin) : undefined;
+    try {
+      await renderDashboard({
+        snapshot,
+        snapshotDeps: { config: {} },
+        snapshotVersion: () => stream?.version(),
+        reloadSnapshot: async () => {
+          const streamed = stream?.current();
+          if (streamed) return adaptRustSnapshot(streamed);
+          if (!args.maestroBin) return snapshot;
+          try {
+            return adaptRustSnapshot(await reloadRustSnapshot(args.cwd, args.maestroBin));
+          } catch {
+            return snapshot;
+          }
+        },
+      });
+    } finally {
+      stream?.close();
+    }
     return;
   }
 
@@ -181,6 +189,89 @@ async function reloadRustSnapshot(cwd: string, maestroBin: string): Promise<Rust
   return JSON.parse(stdout) as RustMissionControlSnapshot;
 }
 
+interface StreamRecord {
+  readonly schema: string;
+  readonly seq: number;
+  readonly kind: "snapshot" | "diff";
+  readonly snapshot?: RustMissionControlSnapshot;
+  readonly sections?: Partial<RustMissionControlSnapshot>;
+}
+
+interface SnapshotStream {
+  /** Latest streamed snapshot, or undefined once the stream has ended. */
+  current(): RustMissionControlSnapshot | undefined;
+  /** Bumped per applied record; undefined once the stream has ended. */
+  version(): number | undefined;
+  close(): void;
+}
+
+// Follow `maestro mission-control --stream`: one full snapshot, then diffs
+// that replace whole top-level sections. A gap in `seq` or an unknown schema
+// ends the stream, and the caller falls back to polling `--json`.
+function openSnapshotStream(cwd: string, maestroBin: string): SnapshotStream {
+  const proc = Bun.spawn([maestroBin, "mission-control", "--stream"], {
+    cwd,
+    env: {
+      ...process.env,
+      MAESTRO_AUTO_UPDATE: "0",
+    },
+    stdout: "pipe",
+    stderr: "ignore",
+  });
+  let snapshot: RustMissionControlSnapshot | undefined;
+  let seq = -1;
+  let applied = 0;
+  let ended = false;
+
+  const apply = (record: StreamRecord): boolean => {
+    if (record.schema !== "maestro.mission_control.stream.v1") {
+      return false;
+    }
+    if (record.kind === "snapshot" && record.snapshot) {
+      snapshot = record.snapshot;
+    } else if (record.kind === "diff" && record.sections && snapshot && record.seq === seq + 1) {
+      snapshot = { ...snapshot, ...record.sections };
+    } else {
+      return false;
+    }
+    seq = record.seq;
+    applied += 1;
+    return true;
+  };
+
+  void (async () => {
+    const decoder = new TextDecoder();
+    let buffered = "";
+    try {
+      for await (const chunk of proc.stdout) {
+        buffered += decoder.decode(chunk, { stream: true });
+        let newline = buffered.indexOf("\n");
+        while (newline >= 0) {
+          const line = buffered.slice(0, newline).trim();
+          buffered = buffered.slice(newline + 1);
+          if (line && !apply(JSON.parse(line) as StreamRecord)) {
+            throw new Error("unexpected mission-control stream record");
+          }
+          newline = buffered.indexOf("\n");
+        }
+      }
+    } catch {
+      // Fall through: an ended stream hands reloads back to polling.
+    }
+    ended = true;
+    proc.kill();
+  })();
+
+  return {
+    current: () => (ended ? undefined : snapshot),
+    version: () => (ended || snapshot === undefined ? undefined : applied),
+    close: () => {
+      ended = true;
+      proc.kill();
+    },
+  };
+}
+
 main().catch((error: unknown) => {
   const message = error instanceof Error ? error.message : String(error);
   console.error(`mission-control OpenTUI sidecar failed: ${message}`);
@@ -18,8 +18,10 @@ use std::fs;
 use std::path::Path;
 use std::process::{Command, Output};
 
+use maestro::domain::card::query::{self, Coarse, ListFilter};
 use maestro::domain::card::schema::{Card, CardType, Dep, DepKind};
 use maestro::domain::card::store::{card_path, load_with_snapshot, save_with_snapshot};
+use maestro::domain::card::{live_db, read_model};
 use maestro::domain::task::{self, CreateTaskOptions};
 use maestro::foundation::core::paths::MaestroPaths;
 use maestro::operations::card_migrate;
@@ -250,6 +252,109 @@ fn ready_hides_a_blocked_card_until_its_blocker_closes() {
     );
 }
 
+/// The indexed read model must answer `ready`, the blocked set, and the `list`
+/// filter exactly as the full scan does -- after the first build, after a
+/// CAS write, after a hand edit it only sees through the file fingerprint,
+/// and with a DB-backed card in the graph.
+#[test]
+fn read_model_answers_like_the_full_scan_across_edits() {
+    let temp = TestTempDir::new("p4b-read-model");
+    let paths = MaestroPaths::new(temp.path());
+
+    let blocker = Card::new("task-300", CardType::Task, "Blocker", "ready", NOW);
+    let mut dependent = Card::new("task-301", CardType::Task, "Dependent", "ready", NOW);
+    dependent.deps = vec![Dep {
+        kind: DepKind::Blocks,
+        target: "task-300".to_string(),
+    }];
+    let mut claimed = Card::new("task-302", CardType::Task, "Claimed", "in_progress", NOW);
+    claimed.claimed_by = Some("claude#s1".to_string());
+    let feature = Card::new("feat-300", CardType::Feature, "Feature", "draft", NOW);
+    write_card(&paths, &blocker);
+    write_card(&paths, &dependent);
+    write_card(&paths, &claimed);
+    write_card(&paths, &feature);
+    assert_read_model_matches_scan(&paths);
+    assert!(paths.card_read_model_file().exists());
+
+    // A CAS write closes the blocker; the dependent clears.
+    let path = card_path(&paths, "task-300");
+    let snapshot = load_with_snapshot(&path).expect("snapshot");
+    let mut closed = snapshot.card.clone().expect("blocker exists");
+    closed.status = "closed".to_string();
+    save_with_snapshot(&path, &closed, &snapshot).expect("rewrite blocker");
+    assert_read_model_matches_scan(&paths);
+
+    // A hand edit outside maestro re-blocks the dependent on a missing card.
+    let path = card_path(&paths, "task-301");
+    let mut edited = load_with_snapshot(&path)
+        .expect("snapshot")
+        .card
+        .expect("dependent exists");
+    edited.deps.push(Dep {
+        kind: DepKind::Blocks,
+        target: "task-999".to_string(),
+    });
+    edited.title = "Dependent, hand edited".to_string();
+    fs::write(&path, serde_yaml::to_string(&edited).expect("serialize")).expect("hand edit");
+    assert_read_model_matches_scan(&paths);
+
+    // A DB-backed card joins the graph, blocked by the hand-edited one.
+    let mut db_card = Card::new("task-303", CardType::Task, "From the DB", "ready", NOW);
+    db_card.deps = vec![Dep {
+        kind: DepKind::Blocks,
+        target: "task-301".to_string(),
+    }];
+    live_db::insert_card(&paths, &db_card, "task.yaml").expect("insert DB card");
+    assert_read_model_matches_scan(&paths);
+
+    // A removed record leaves the model too.
+    fs::remove_dir_all(card_path(&paths, "task-302").parent().expect("card dir"))
+        .expect("remove card");
+    assert_read_model_matches_scan(&paths);
+}
+
+fn assert_read_model_matches_scan(paths: &MaestroPaths) {
+    fn ids<'a>(cards: impl IntoIterator<Item = &'a Card>) -> Vec<String> {
+        cards.into_iter().map(|card| card.id.clone()).collect()
+    }
+    let cards = query::scan(paths).expect("scan");
+    assert_eq!(
+        ids(&read_model::ready(paths).expect("indexed ready")),
+        ids(query::ready(&cards))
+    );
+    assert_eq!(
+        ids(&read_model::blocked(paths).expect("indexed blocked")),
+        ids(query::blocked(&cards))
+    );
+    let filters = [
+        ListFilter::default(),
+        ListFilter {
+            card_type: Some(CardType::Task),
+            status: Some(Coarse::Open),
+            ..ListFilter::default()
+        },
+        ListFilter {
+            assignee: Some("claude"),
+            ..ListFilter::default()
+        },
+    ];
+    for filter in &filters {
+        let indexed = read_model::query(paths, filter).expect("indexed list");
+        assert_eq!(
+            indexed
+                .iter()
+                .map(|(card, _)| card.clone())
+                .collect::<Vec<_>>(),
+            query::query(&cards, filter)
+                .into_iter()
+                .cloned()
+                .collect::<Vec<_>>(),
+            "filter {filter:?}"
+        );
+    }
+}
+
 #[test]
 fn list_assignee_matches_the_agent_portion_of_a_claim() {
     let temp = TestTempDir::new("p4b-assignee");
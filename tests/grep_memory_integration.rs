@@ -289,3 +289,103 @@ fn grep_memory_indexes_managed_run_evidence_but_not_raw_events() {
         0
     );
 }
+
+#[test]
+fn memory_rebuild_reuses_docs_of_unchanged_cards() {
+    let temp = cards_repo("grep-memory-incremental");
+    let repo = temp.path();
+    let mut ids = Vec::new();
+    for title in ["Runtime Identity", "Proof Ledger"] {
+        let id = stdout(
+            maestro(&["feature", "new", title, "--id-only"], repo),
+            &["feature", "new"],
+        );
+        ids.push(id.trim().to_string());
+    }
+    let incremental = |out: &str| -> (usize, usize) {
+        let line = out
+            .lines()
+            .find_map(|line| line.trim().strip_prefix("incremental: "))
+            .unwrap_or_else(|| panic!("index output should report reuse: {out}"));
+        let counts: Vec<usize> = line
+            .split(", ")
+            .map(|part| part.split(' ').next().unwrap().parse().unwrap())
+            .collect();
+        (counts[0], counts[1])
+    };
+
+    let out = stdout(maestro(&["index", "--memory"], repo), &["index"]);
+    assert_eq!(incremental(&out).0, 0, "{out}");
+
+    stdout(
+        maestro(
+            &[
+                "feature",
+                "spec",
+                &ids[0],
+                "--section",
+                "Problem",
+                "--append",
+                "incremental_marker lives in the spec",
+            ],
+            repo,
+        ),
+        &["feature", "spec"],
+    );
+    let out = stdout(maestro(&["index", "--memory"], repo), &["index"]);
+    let (reused, rebuilt) = incremental(&out);
+    assert!(reused >= 1, "{out}");
+    assert!(rebuilt >= 1, "{out}");
+
+    let out = stdout(
+        maestro(
+            &["grep", "--json", "incremental_marker corpus:memory"],
+            repo,
+        ),
+        &["grep", "--json"],
+    );
+    let json: Value = serde_json::from_str(&out).expect("grep output should be JSON");
+    assert_eq!(json["hits"][0]["id"], ids[0]);
+    assert_eq!(json["hits"].as_array().unwrap().len(), 1);
+
+    // A rebuild from a subdirectory labels reused and re-derived docs alike,
+    // relative to the repo root.
+    let subdir = repo.join("src");
+    fs::create_dir_all(&subdir).expect("invariant: subdir should be creatable");
+    stdout(
+        maestro(
+            &[
+                "feature",
+                "spec",
+                &ids[1],
+                "--section",
+                "Problem",
+                "--append",
+                "incremental_marker lives here too",
+            ],
+            repo,
+        ),
+        &["feature", "spec"],
+    );
+    let out = stdout(maestro(&["index", "--memory"], &subdir), &["index"]);
+    let (reused, rebuilt) = incremental(&out);
+    assert!(reused >= 1 && rebuilt >= 1, "{out}");
+    let out = stdout(
+        maestro(
+            &["grep", "--json", "incremental_marker corpus:memory"],
+            &subdir,
+        ),
+        &["grep", "--json"],
+    );
+    let json: Value = serde_json::from_str(&out).expect("grep output should be JSON");
+    let hits = json["hits"].as_array().unwrap();
+    assert_eq!(hits.len(), 2, "{json:#}");
+    for hit in hits {
+        assert!(
+            hit["path"]
+                .as_str()
+                .is_some_and(|path| path.starts_with(".maestro/cards/")),
+            "{hit:#}"
+        );
+    }
+}
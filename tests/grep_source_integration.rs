@@ -209,6 +209,57 @@ fn index_rebuild_source_reports_indexed_and_skipped_files() {
     assert!(repo.join(".maestro/index/search/source.shard").exists());
 }
 
+#[test]
+fn index_rebuild_source_reparses_only_changed_files() {
+    let temp = source_repo("grep-source-incremental");
+    let repo = temp.path();
+    let out = stdout(
+        maestro(&["index", "rebuild", "--source"], repo),
+        &["index", "rebuild", "--source"],
+    );
+    assert!(out.contains("incremental: 0 reused, 6 reparsed"), "{out}");
+
+    fs::write(
+        repo.join("src/app.py"),
+        "def runtime_agent():\n    return 'incremental_marker'\n",
+    )
+    .expect("python source should be rewritable");
+    let guarded = repo.join("src/lib.rs");
+    let mut permissions = fs::metadata(&guarded)
+        .expect("guarded file metadata should read")
+        .permissions();
+    permissions.set_mode(0o000);
+    fs::set_permissions(&guarded, permissions).expect("guarded file should become unreadable");
+
+    let out = maestro(&["index", "rebuild", "--source"], repo);
+
+    let mut permissions = fs::metadata(&guarded)
+        .expect("guarded file metadata should still read")
+        .permissions();
+    permissions.set_mode(0o644);
+    fs::set_permissions(&guarded, permissions).expect("guarded file permissions restore");
+
+    let out = stdout(out, &["index", "rebuild", "--source"]);
+    assert!(out.contains("files: 4 indexed"), "{out}");
+    assert!(out.contains("incremental: 5 reused, 1 reparsed"), "{out}");
+    assert!(out.contains("skipped binary: 1"), "{out}");
+    assert!(out.contains("skipped line_cap: 1"), "{out}");
+
+    for (query, path) in [
+        ("incremental_marker corpus:source", "src/app.py"),
+        ("HTTPServer corpus:source file:src/lib.rs", "src/lib.rs"),
+    ] {
+        let out = stdout(
+            maestro(&["grep", "--json", query], repo),
+            &["grep", "--json", query],
+        );
+        let json: Value = serde_json::from_str(&out).expect("grep output should be JSON");
+        assert_eq!(json["ok"], true, "{out}");
+        assert_eq!(json["hits"][0]["path"], path, "{out}");
+        assert_eq!(json["freshness"][0]["repaired"], false, "{out}");
+    }
+}
+
 #[test]
 fn grep_source_json_supports_regex_file_lang_case_or_and_negation() {
     let temp = source_repo("grep-source-query");
@@ -317,6 +368,46 @@ fn grep_source_fresh_query_does_not_read_source_files() {
     assert_eq!(json["freshness"][0]["repaired"], false);
 }
 
+#[test]
+fn grep_source_repairs_legacy_json_shard_into_binary_v3() {
+    let temp = source_repo("grep-source-v3-upgrade");
+    let repo = temp.path();
+    fs::create_dir_all(repo.join(".maestro/index/search")).expect("search dir should be creatable");
+    fs::write(
+        repo.join(".maestro/index/search/source.shard"),
+        b"MAESTRO_SOURCE_SHARD_V2\n{}",
+    )
+    .expect("legacy shard should be writable");
+
+    let out = stdout(
+        maestro(
+            &["grep", "--json", "/runtime_\\w+/ corpus:source lang:python"],
+            repo,
+        ),
+        &["grep", "--json", "legacy shard"],
+    );
+    let json: Value = serde_json::from_str(&out).expect("grep output should be JSON");
+    assert_eq!(json["ok"], true, "{out}");
+    assert_eq!(json["hits"][0]["path"], "src/app.py", "{out}");
+    assert_eq!(json["freshness"][0]["repaired"], true, "{out}");
+    assert_eq!(json["freshness"][0]["schema_version"], "source-shard.v3");
+    let shard = fs::read(repo.join(".maestro/index/search/source.shard"))
+        .expect("rebuilt shard should be readable");
+    assert!(shard.starts_with(b"MAESTRO_SOURCE_SHARD_V3\n"));
+
+    let out = stdout(
+        maestro(
+            &["grep", "--json", "no_such_trigram_anywhere corpus:source"],
+            repo,
+        ),
+        &["grep", "--json", "absent literal"],
+    );
+    let json: Value = serde_json::from_str(&out).expect("grep output should be JSON");
+    assert_eq!(json["ok"], true, "{out}");
+    assert_eq!(json["hits"].as_array().map(Vec::len), Some(0), "{out}");
+    assert_eq!(json["freshness"][0]["repaired"], false, "{out}");
+}
+
 #[test]
 fn grep_source_reports_malformed_regex() {
     let temp = source_repo("grep-source-bad-regex");
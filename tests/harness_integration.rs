@@ -1696,6 +1696,58 @@ fn mcp_serve_lists_tools_and_calls_status_over_stdio() {
     );
 }
 
+#[test]
+fn mcp_serve_answers_in_request_order_and_reuses_reads_until_a_write() {
+    let temp = setup_repo("maestro-mcp-warm-cache");
+    let repo = temp.path();
+    create_task(repo, "MCP cached task");
+
+    let lines = run_mcp_requests(
+        repo,
+        &[
+            r#"{"jsonrpc":"2.0","id":1,"method":"tools/call","params":{"name":"maestro_task_list","arguments":{}}}"#,
+            // Not a read-only call: waits for id 1, so id 3 finds its entry.
+            r#"{"jsonrpc":"2.0","id":2,"method":"tools/list","params":{}}"#,
+            r#"{"jsonrpc":"2.0","id":3,"method":"tools/call","params":{"name":"maestro_task_list","arguments":{}}}"#,
+            r#"{"jsonrpc":"2.0","id":4,"method":"tools/call","params":{"name":"maestro_task_add","arguments":{"title":"MCP added task"}}}"#,
+            r#"{"jsonrpc":"2.0","id":5,"method":"tools/call","params":{"name":"maestro_task_list","arguments":{}}}"#,
+            r#"{"jsonrpc":"2.0","id":6,"method":"resources/list","params":{}}"#,
+            r#"{"jsonrpc":"2.0","id":7,"method":"resources/read","params":{"uri":"maestro://mcp/tool-stats"}}"#,
+        ],
+    );
+    let ids: Vec<_> = lines.iter().map(|line| line["id"].clone()).collect();
+    assert_eq!(ids, (1..=7).map(JsonValue::from).collect::<Vec<_>>());
+    let text = |line: &JsonValue| {
+        line["result"]["content"][0]["text"]
+            .as_str()
+            .unwrap_or_else(|| panic!("tool call should succeed: {line}"))
+            .to_string()
+    };
+    assert_eq!(text(&lines[0]), text(&lines[2]));
+    assert!(!text(&lines[0]).contains("MCP added task"));
+    assert!(
+        text(&lines[4]).contains("MCP added task"),
+        "a write drops cached reads:\n{}",
+        text(&lines[4])
+    );
+    assert_eq!(
+        lines[5]["result"]["resources"][0]["uri"],
+        "maestro://mcp/tool-stats"
+    );
+
+    let stats: JsonValue = serde_json::from_str(
+        lines[6]["result"]["contents"][0]["text"]
+            .as_str()
+            .expect("invariant: stats resource should be text"),
+    )
+    .expect("invariant: stats resource should be JSON");
+    let task_list = &stats["tools"]["maestro_task_list"];
+    assert_eq!(task_list["calls"], 3, "{stats:#}");
+    assert_eq!(task_list["cache_hits"], 1, "{stats:#}");
+    assert_eq!(stats["tools"]["maestro_task_add"]["cache_hits"], 0);
+    assert!(task_list["max_ms"].as_f64().is_some());
+}
+
 #[test]
 fn mcp_lifecycle_tools_expose_schemas_and_blocked_envelope() {
     let temp = setup_repo("maestro-mcp-lifecycle-envelope");
@@ -1484,3 +1484,138 @@ fn hook_record_refuses_symlinked_run_artifacts_without_failing_adapter() {
             .exists()
     );
 }
+
+/// A `maestro hook serve` child that is killed when the guard drops, so a
+/// failing assertion never leaves a daemon behind.
+#[cfg(unix)]
+struct HookDaemon(std::process::Child);
+
+#[cfg(unix)]
+impl HookDaemon {
+    fn spawn(cwd: &Path) -> Self {
+        Self(
+            Command::new(env!("CARGO_BIN_EXE_maestro"))
+                .args(["hook", "serve"])
+                .current_dir(cwd)
+                .stdout(Stdio::piped())
+                .stderr(Stdio::null())
+                .spawn()
+                .expect("invariant: compiled maestro binary should be runnable in hook tests"),
+        )
+    }
+
+    /// Kill the daemon and return everything it logged to stdout.
+    fn stop(mut self) -> String {
+        let stdout = self.0.stdout.take();
+        self.0
+            .kill()
+            .expect("invariant: hook daemon should be killable");
+        self.0.wait().expect("invariant: hook daemon should exit");
+        let mut log = String::new();
+        if let Some(mut stdout) = stdout {
+            std::io::Read::read_to_string(&mut stdout, &mut log)
+                .expect("invariant: hook daemon stdout should be readable");
+        }
+        log
+    }
+}
+
+#[cfg(unix)]
+impl Drop for HookDaemon {
+    fn drop(&mut self) {
+        let _ = self.0.kill();
+        let _ = self.0.wait();
+    }
+}
+
+#[cfg(unix)]
+#[test]
+fn hook_daemon_answers_like_the_in_process_path_and_falls_back_when_gone() {
+    let repo = init_repo();
+    let socket = repo.path().join(".maestro/hook.sock");
+    let blocked_payload = r#"{"session_id":"session-daemon","event_type":"PreToolUse","agent":"codex","tool_name":"Edit","tool_input":{"file_path":"src/lib.rs"}}"#;
+    let in_process = maestro_record(repo.path(), blocked_payload);
+
+    let daemon = HookDaemon::spawn(repo.path());
+    for _ in 0..100 {
+        if socket.exists() {
+            break;
+        }
+        thread::sleep(std::time::Duration::from_millis(50));
+    }
+    assert!(
+        socket.exists(),
+        "hook serve should listen on .maestro/hook.sock"
+    );
+    {
+        use std::os::unix::fs::PermissionsExt;
+        let mode = fs::metadata(&socket)
+            .expect("invariant: hook socket should be statable")
+            .permissions()
+            .mode();
+        assert_eq!(mode & 0o777, 0o600, "only the owner may connect");
+    }
+
+    let served = maestro_record(repo.path(), blocked_payload);
+    assert!(
+        !served.status.success(),
+        "daemon must block like the in-process path"
+    );
+    assert_eq!(served.stderr, in_process.stderr);
+
+    let setup = maestro_with_env(
+        repo.path(),
+        &[
+            "task",
+            "setup",
+            "--task",
+            "Map behavior",
+            "--task",
+            "Implement fix",
+            "--start",
+        ],
+        &[("MAESTRO_ACTOR", "codex#session-daemon")],
+    );
+    assert!(setup.status.success());
+    let allowed = maestro_record(repo.path(), blocked_payload);
+    assert!(
+        allowed.status.success(),
+        "daemon must see the new Progress checklist\nstderr:\n{}",
+        String::from_utf8_lossy(&allowed.stderr)
+    );
+    let events = read_events(repo.path(), "session-daemon");
+    assert!(
+        events
+            .iter()
+            .any(|event| event["event_type"] == "card_touch")
+            && events
+                .iter()
+                .any(|event| event["event_type"] == "PreToolUse"),
+        "served record binds the card and appends the tool event: {events:#?}"
+    );
+
+    let log = daemon.stop();
+    let served: Vec<&str> = log
+        .lines()
+        .filter(|line| line.starts_with("served "))
+        .collect();
+    assert_eq!(
+        served.len(),
+        2,
+        "the daemon, not the fallback, answered both records:\n{log}"
+    );
+    assert_eq!(served[0], "served blocked");
+    let fallback = maestro_record(
+        repo.path(),
+        r#"{"session_id":"session-daemon","event_type":"Stop"}"#,
+    );
+    assert!(
+        fallback.status.success(),
+        "a stale socket falls back in-process"
+    );
+    assert!(
+        read_events(repo.path(), "session-daemon")
+            .iter()
+            .any(|event| event["event_type"] == "Stop")
+    );
+}
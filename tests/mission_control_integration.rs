@@ -2,8 +2,12 @@ pub mod card_support;
 mod support;
 
 use std::fs;
+use std::io::{BufRead, BufReader};
 use std::path::{Path, PathBuf};
-use std::process::{Command, Output};
+use std::process::{Command, Output, Stdio};
+use std::sync::mpsc;
+use std::thread;
+use std::time::Duration;
 
 use card_support::{cards_repo, id_by_title};
 use serde_json::Value;
@@ -158,3 +162,106 @@ fn mission_control_preview_json_render_check_are_read_only() {
         "watch snapshot should still render after mission-control addition:\n{watch}"
     );
 }
+
+/// A `--stream` child that is killed and reaped when the guard drops, so a
+/// failing assertion never leaves it polling.
+struct StreamChild(std::process::Child);
+
+impl Drop for StreamChild {
+    fn drop(&mut self) {
+        let _ = self.0.kill();
+        let _ = self.0.wait();
+    }
+}
+
+#[test]
+fn mission_control_stream_emits_a_snapshot_then_section_diffs() {
+    let temp = cards_repo("mission-control-stream");
+    let repo = temp.path();
+    run(repo, &["create", "-t", "feature", "Import receipts"]);
+    let feature_id = id_by_title(repo, "Import receipts");
+
+    let mut child = StreamChild(
+        Command::new(env!("CARGO_BIN_EXE_maestro"))
+            .args(["mission-control", "--stream"])
+            .current_dir(repo)
+            .env("MAESTRO_AGENT", "codex")
+            .env("MAESTRO_SESSION", "mission-control-test")
+            .env("MAESTRO_AUTO_UPDATE", "0")
+            .stdout(Stdio::piped())
+            .stderr(Stdio::null())
+            .spawn()
+            .expect("invariant: compiled maestro binary should run in integration tests"),
+    );
+    let stdout = child.0.stdout.take().expect("stream stdout is piped");
+    let (lines, records) = mpsc::channel();
+    thread::spawn(move || {
+        for line in BufReader::new(stdout).lines().map_while(Result::ok) {
+            if lines.send(line).is_err() {
+                break;
+            }
+        }
+    });
+    let next = || -> Value {
+        let line = records
+            .recv_timeout(Duration::from_secs(20))
+            .expect("stream should emit a record after a write settles");
+        serde_json::from_str(&line).expect("stream records are JSON lines")
+    };
+
+    let first = next();
+    assert_eq!(first["schema"], "maestro.mission_control.stream.v1");
+    assert_eq!(first["kind"], "snapshot");
+    assert_eq!(first["seq"], 0);
+    let mut snapshot = first["snapshot"].clone();
+    assert_eq!(snapshot["schema"], "maestro.mission_control.snapshot.v1");
+
+    run(
+        repo,
+        &[
+            "create",
+            "-t",
+            "task",
+            "Parse receipt PDFs",
+            "--parent",
+            &feature_id,
+        ],
+    );
+    let has_task = |snapshot: &Value| {
+        snapshot["tasks"].as_array().is_some_and(|tasks| {
+            tasks
+                .iter()
+                .any(|task| task["title"] == "Parse receipt PDFs")
+        })
+    };
+    let mut seq = 0;
+    while !has_task(&snapshot) {
+        let record = next();
+        seq += 1;
+        assert_eq!(record["kind"], "diff", "{record:#}");
+        assert_eq!(
+            record["seq"], seq,
+            "diffs are numbered in order: {record:#}"
+        );
+        let sections = record["sections"]
+            .as_object()
+            .expect("a diff carries changed sections");
+        assert!(
+            !sections.contains_key("config"),
+            "unchanged sections are not resent: {record:#}"
+        );
+        for (key, value) in sections {
+            snapshot[key.as_str()] = value.clone();
+        }
+    }
+    drop(child);
+
+    let json: Value = serde_json::from_str(&run(repo, &["mission-control", "--json"]))
+        .expect("mission-control --json should emit JSON");
+    for section in ["summary", "features", "tasks", "proof", "repo"] {
+        assert_eq!(
+            snapshot[section], json[section],
+            "applied diffs should match a fresh snapshot's {section}"
+        );
+    }
+}
@@ -0,0 +1,113 @@
+//! `MAESTRO_PROFILE=1` / `--profile`: the per-phase profile rides stderr as one
+//! JSON line and leaves the command's stdout byte-identical.
+
+mod support;
+
+use std::fs;
+use std::path::Path;
+use std::process::{Command, Output};
+
+use maestro::domain::card::schema::{Card, CardType};
+use maestro::domain::card::store::create_card;
+use maestro::foundation::core::paths::MaestroPaths;
+use serde_json::Value;
+use support::TestTempDir;
+
+const NOW: &str = "2026-06-08T12:00:00Z";
+
+fn maestro(cwd: &Path, args: &[&str], envs: &[(&str, &str)]) -> Output {
+    let mut command = Command::new(env!("CARGO_BIN_EXE_maestro"));
+    command
+        .args(args)
+        .current_dir(cwd)
+        .env("MAESTRO_AUTO_UPDATE", "0")
+        .env_remove("MAESTRO_PROFILE");
+    for (key, value) in envs {
+        command.env(key, value);
+    }
+    let output = command
+        .output()
+        .expect("invariant: compiled maestro binary should run in integration tests");
+    assert!(
+        output.status.success(),
+        "maestro {args:?} failed\nstdout:\n{}\nstderr:\n{}",
+        String::from_utf8_lossy(&output.stdout),
+        String::from_utf8_lossy(&output.stderr)
+    );
+    output
+}
+
+fn profile_line(output: &Output) -> Option<Value> {
+    String::from_utf8_lossy(&output.stderr)
+        .lines()
+        .filter_map(|line| serde_json::from_str::<Value>(line).ok())
+        .find(|value| value["schema"] == "maestro.profile.v1")
+}
+
+#[test]
+fn profile_reports_phases_on_stderr_without_touching_stdout() {
+    let temp = TestTempDir::new("maestro-profile");
+    let repo = temp.path();
+    let paths = MaestroPaths::new(repo);
+    fs::create_dir_all(paths.cards_dir()).expect("invariant: cards dir should be creatable");
+    for (id, status) in [("task-101", "ready"), ("task-102", "in_progress")] {
+        create_card(
+            &paths,
+            &Card::new(id, CardType::Task, &format!("Card {id}"), status, NOW),
+        )
+        .expect("invariant: fixture card should be creatable");
+    }
+
+    let plain = maestro(repo, &["list", "--json"], &[]);
+    assert!(profile_line(&plain).is_none(), "profiling is opt-in");
+
+    let by_env = maestro(repo, &["list", "--json"], &[("MAESTRO_PROFILE", "1")]);
+    let by_flag = maestro(repo, &["list", "--json", "--profile"], &[]);
+    for profiled in [&by_env, &by_flag] {
+        assert_eq!(profiled.stdout, plain.stdout);
+        let profile = profile_line(profiled).expect("profiled run reports on stderr");
+        assert_eq!(profile["command"], "list");
+        assert!(profile["total_ms"].as_f64().is_some());
+        assert!(
+            profile["allocations"]
+                .as_u64()
+                .is_some_and(|count| count > 0)
+        );
+        let phases = profile["phases"]
+            .as_object()
+            .expect("phases is an object keyed by phase path");
+        assert!(phases.contains_key("cli.banners"), "{phases:?}");
+        assert!(
+            phases.keys().any(|path| path.starts_with("card.")),
+            "the card read is a phase: {phases:?}"
+        );
+    }
+
+    let disabled = maestro(repo, &["list", "--json"], &[("MAESTRO_PROFILE", "0")]);
+    assert!(profile_line(&disabled).is_none());
+}
+
+#[test]
+fn profile_is_reported_before_a_rejected_grep_exits() {
+    let temp = TestTempDir::new("maestro-profile-grep");
+    let repo = temp.path();
+    fs::create_dir_all(MaestroPaths::new(repo).cards_dir())
+        .expect("invariant: cards dir should be creatable");
+
+    let output = Command::new(env!("CARGO_BIN_EXE_maestro"))
+        .args(["grep", " ", "--profile"])
+        .current_dir(repo)
+        .env("MAESTRO_AUTO_UPDATE", "0")
+        .env_remove("MAESTRO_PROFILE")
+        .output()
+        .expect("invariant: compiled maestro binary should run in integration tests");
+    assert_eq!(output.status.code(), Some(2), "a rejected query exits 2");
+    let stderr = String::from_utf8_lossy(&output.stderr);
+    assert!(stderr.contains("empty_query"), "{stderr}");
+    assert!(
+        !stderr.contains("Error:"),
+        "diagnostics are not repeated: {stderr}"
+    );
+    let profile = profile_line(&output).expect("the profile is reported before the exit");
+    assert_eq!(profile["command"], "grep");
+}